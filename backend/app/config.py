@@ -28,6 +28,10 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(',')]
         return v
 
+    CORS_ALLOW_METHODS: List[str] = ["GET", "POST", "PATCH", "DELETE", "OPTIONS"]
+    CORS_ALLOW_HEADERS: List[str] = ["Authorization", "Content-Type"]
+    CORS_MAX_AGE: int = 86400  # Seconds browsers may cache preflight responses
+
     # Database
     DATABASE_URL: str = "postgresql://rdfmap:rdfmap@db:5432/rdfmap"
 
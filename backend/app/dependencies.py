@@ -0,0 +1,10 @@
+"""Shared FastAPI dependencies."""
+
+from fastapi import Request
+
+from .services.rdfmap_service import RDFMapService
+
+
+def get_rdfmap_service(request: Request) -> RDFMapService:
+    """Dependency for getting the process-wide RDFMapService created at startup."""
+    return request.app.state.rdfmap_service
@@ -0,0 +1,38 @@
+"""HTTP conditional-request helpers for responses derived from uploaded files."""
+from typing import Dict, Optional
+import hashlib
+import os
+
+from fastapi import Request
+
+CACHE_CONTROL = "private, max-age=60, must-revalidate"
+
+
+def file_etag(path, *extra) -> Optional[str]:
+    """Strong ETag for a file (path, mtime and size), or None if it cannot be stat'ed.
+
+    Extra values (e.g. query parameters that shape the response) are folded into the tag.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = ":".join([str(path), str(st.st_mtime_ns), str(st.st_size), *map(str, extra)])
+    return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """True if the client's If-None-Match already covers the current ETag."""
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def cache_headers(etag: Optional[str]) -> Dict[str, str]:
+    """ETag and Cache-Control headers for a cacheable response."""
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
@@ -1,12 +1,16 @@
 """FastAPI main application."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 
 from .config import settings
 from .routers import projects, mappings, conversion, websockets, files
+from .services.rdfmap_service import RDFMapService
 
 # Import RDFMap version
 try:
@@ -14,6 +18,31 @@ try:
 except ImportError:
     rdfmap_version = "unknown"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize shared resources on startup and release them on shutdown."""
+    # Create directories
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    os.makedirs(settings.DATA_DIR, exist_ok=True)
+
+    # Initialize database tables
+    from .database import init_db
+    init_db()
+
+    # One service instance per process; routers get it via Depends(get_rdfmap_service)
+    service = RDFMapService(uploads_dir=settings.UPLOAD_DIR, data_dir=settings.DATA_DIR)
+    service.warmup(load_encoder=settings.RDFMAP_USE_SEMANTIC)
+    app.state.rdfmap_service = service
+
+    print(f"🚀 RDFMap Web API started (RDFMap Core v{rdfmap_version})")
+    print(f"📊 Database initialized and ready")
+
+    yield
+
+    print("👋 RDFMap Web API shutting down")
+
+
 app = FastAPI(
     title="RDFMap Web API",
     description="Web API for RDFMap - Semantic Model Data Mapper",
@@ -21,6 +50,8 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -28,8 +59,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
 # Include routers
@@ -39,9 +71,9 @@ app.include_router(conversion.router, prefix="/api/conversion", tags=["conversio
 app.include_router(websockets.router, prefix="/ws", tags=["websockets"])
 app.include_router(files.router, prefix="/api/files", tags=["files"])
 
-# Serve uploaded files (in production, use S3 or CDN)
-if os.path.exists("/app/uploads"):
-    app.mount("/uploads", StaticFiles(directory="/app/uploads"), name="uploads")
+# Serve uploaded files (in production, use S3 or CDN).
+# The directory is created in lifespan, so don't require it to exist at import time.
+app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR, check_dir=False), name="uploads")
 
 
 @app.get("/")
@@ -63,23 +95,3 @@ async def health():
         "rdfmap_version": rdfmap_version,
     }
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize on startup."""
-    # Create directories
-    os.makedirs("/app/uploads", exist_ok=True)
-    os.makedirs("/app/data", exist_ok=True)
-
-    # Initialize database tables
-    from .database import init_db
-    init_db()
-
-    print(f"🚀 RDFMap Web API started (RDFMap Core v{rdfmap_version})")
-    print(f"📊 Database initialized and ready")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
-    print("👋 RDFMap Web API shutting down")
@@ -0,0 +1,28 @@
+"""Per-project storage paths with project id validation."""
+from pathlib import Path
+import re
+
+from fastapi import HTTPException
+
+from .config import settings
+
+_UPLOAD = Path(settings.UPLOAD_DIR).resolve()
+_DATA = Path(settings.DATA_DIR).resolve()
+# Project ids are str(uuid.uuid4()); anything else (e.g. "../..") is rejected
+_ID_RE = re.compile(r"[0-9a-f-]{36}")
+
+
+def _check_id(project_id: str) -> str:
+    if not _ID_RE.fullmatch(project_id):
+        raise HTTPException(status_code=400, detail="Invalid project id")
+    return project_id
+
+
+def project_upload_dir(project_id: str) -> Path:
+    """Directory holding a project's uploaded files (data, ontology, shapes, SKOS)."""
+    return _UPLOAD / _check_id(project_id)
+
+
+def project_data_dir(project_id: str) -> Path:
+    """Directory holding a project's generated files (mapping config, reports, RDF output)."""
+    return _DATA / _check_id(project_id)
@@ -1,23 +1,90 @@
 """Conversion router - handles RDF conversion."""
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
-from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse
+from celery import states
+from celery.backends.base import KeyValueStoreBackend
+from celery.result import AsyncResult
+from typing import List, Optional
+import json
 import logging
+import os
 
-from ..services.rdfmap_service import RDFMapService
-from ..config import settings
-from ..worker import convert_to_rdf_task
+from ..services.mapping_cache import load_config
+from ..services.rdfmap_service import RDFMapService, FORMAT_EXTENSIONS, OUTPUT_META_FILE
+from ..paths import project_data_dir
+from ..dependencies import get_rdfmap_service
+from ..schemas.conversion import BulkConversionRequest
+from ..worker import celery_app, convert_sheets_in_parallel, convert_to_rdf_task
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+MEDIA_TYPES = {
+    "ttl": "text/turtle",
+    "jsonld": "application/ld+json",
+    "rdf": "application/rdf+xml",
+    "nt": "application/n-triples",
+    "n3": "text/n3",
+}
+
+
+@router.post("/bulk")
+async def bulk_convert_to_rdf(request: BulkConversionRequest):
+    """
+    Queue background conversions for several projects.
+
+    All tasks are published through a single broker connection instead of
+    one round trip per project. Projects without a mapping configuration
+    are reported under "skipped".
+    """
+    # Validate every id before anything is queued
+    mapping_files = {
+        project_id: project_data_dir(project_id) / "mapping_config.yaml"
+        for project_id in request.project_ids
+    }
+    try:
+        queued = []
+        skipped = []
+        with celery_app.producer_pool.acquire(block=True) as producer:
+            for project_id, mapping_file in mapping_files.items():
+                if not mapping_file.exists():
+                    skipped.append({"project_id": project_id, "error": "No mapping configuration found"})
+                    continue
+                task = convert_to_rdf_task.apply_async(
+                    kwargs={
+                        "project_id": str(project_id),
+                        "mapping_file_path": str(mapping_file),
+                        "output_format": request.output_format,
+                        "validate": request.validate_output,
+                    },
+                    producer=producer,
+                )
+                queued.append({"project_id": project_id, "task_id": task.id})
+
+        return {
+            "status": "queued",
+            "queued": queued,
+            "skipped": skipped,
+            "message": f"Queued {len(queued)} conversion job(s)",
+        }
+    except Exception as e:
+        logger.error(f"Error queueing bulk conversion: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
 
 @router.post("/{project_id}")
 async def convert_to_rdf(
     project_id: str,
     output_format: str = Query("turtle", description="RDF format: turtle, json-ld, xml, nt"),
     validate: bool = Query(True, description="Validate output against ontology"),
+    validate_shapes: bool = Query(False, description="Also validate output against uploaded SHACL shapes"),
     use_background: bool = Query(False, description="Run conversion as background job"),
+    split_sheets: bool = Query(
+        False,
+        description="Background only: convert each sheet in its own task and merge the results "
+                    "(structural checks and reasoning then run per sheet)",
+    ),
+    service: RDFMapService = Depends(get_rdfmap_service),
 ):
     """
     Convert project data to RDF using the generated mappings.
@@ -28,20 +95,41 @@ async def convert_to_rdf(
         logger.info(f"Converting project {project_id} to RDF (format: {output_format})")
 
         # Check if mapping file exists
-        mapping_file = Path(settings.DATA_DIR) / project_id / "mapping_config.yaml"
+        mapping_file = project_data_dir(project_id) / "mapping_config.yaml"
         if not mapping_file.exists():
             raise HTTPException(
                 status_code=400,
                 detail="No mapping configuration found. Generate mappings first."
             )
 
-        if use_background:
+        sheet_count = len(load_config(str(mapping_file)).sheets) if use_background and split_sheets else 0
+        if sheet_count > 1:
+            # Fan the sheets out over the workers; the merge task's id tracks the whole job.
+            # The ontology import is persisted here, once, before the sheet tasks read the mapping.
+            ontology_path = service.resolve_ontology_import(project_id, str(mapping_file))
+            task = convert_sheets_in_parallel(
+                project_id=str(project_id),
+                sheet_count=sheet_count,
+                mapping_file_path=str(mapping_file),
+                output_format=output_format,
+                validate=validate,
+                validate_shapes=validate_shapes,
+                ontology_path=ontology_path,
+            )
+            return {
+                "status": "queued",
+                "project_id": project_id,
+                "task_id": task.id,
+                "message": f"Conversion of {sheet_count} sheets queued as background jobs",
+            }
+        elif use_background:
             # Queue background task
             task = convert_to_rdf_task.delay(
                 project_id=str(project_id),
                 mapping_file_path=str(mapping_file),
                 output_format=output_format,
                 validate=validate,
+                validate_shapes=validate_shapes,
             )
             return {
                 "status": "queued",
@@ -51,16 +139,12 @@ async def convert_to_rdf(
             }
         else:
             # Run synchronously
-            service = RDFMapService(
-                uploads_dir=settings.UPLOAD_DIR,
-                data_dir=settings.DATA_DIR,
-            )
-
             result = service.convert_to_rdf(
                 project_id=project_id,
                 mapping_file_path=str(mapping_file),
                 output_format=output_format,
                 validate=validate,
+                validate_shapes=validate_shapes,
             )
 
             return {
@@ -76,21 +160,57 @@ async def convert_to_rdf(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _job_statuses(task_ids: List[str]) -> List[dict]:
+    """Look up status/result for several tasks, using one MGET on key-value result backends."""
+    backend = celery_app.backend
+    if isinstance(backend, KeyValueStoreBackend):
+        keys = [backend.get_key_for_task(tid) for tid in task_ids]
+        values = backend.mget(keys)
+        if hasattr(values, "get"):
+            # Some clients (e.g. memcached) return a key -> value mapping instead of a list
+            values = [values.get(key) for key in keys]
+        metas = [
+            backend.decode_result(value) if value else {"status": states.PENDING, "result": None}
+            for value in values
+        ]
+    else:
+        metas = []
+        for tid in task_ids:
+            res = AsyncResult(tid, app=celery_app)
+            metas.append({"status": res.status, "result": res.result})
+
+    responses = []
+    for tid, meta in zip(task_ids, metas):
+        response = {"task_id": tid, "status": meta["status"]}
+        if meta["status"] == states.SUCCESS:
+            response["result"] = meta["result"]
+        elif meta["status"] == states.FAILURE:
+            response["error"] = str(meta["result"])
+        responses.append(response)
+    return responses
+
+
+@router.get("/jobs")
+async def get_jobs_status(ids: str = Query(..., description="Comma-separated task ids")):
+    """
+    Get the status and (if available) the result of several background conversion jobs at once.
+    """
+    task_ids = [tid.strip() for tid in ids.split(",") if tid.strip()]
+    if not task_ids:
+        raise HTTPException(status_code=400, detail="No task ids given")
+    try:
+        return {"jobs": _job_statuses(task_ids)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/job/{task_id}")
 async def get_job_status(task_id: str):
     """
     Get the status and (if available) the result of a background conversion job.
     """
     try:
-        from celery.result import AsyncResult
-        res = AsyncResult(task_id)
-        status = res.status
-        response = {"task_id": task_id, "status": status}
-        if res.successful():
-            response["result"] = res.result
-        elif res.failed():
-            response["error"] = str(res.result)
-        return response
+        return _job_statuses([task_id])[0]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -98,34 +218,35 @@ async def get_job_status(task_id: str):
 @router.get("/{project_id}/download")
 async def download_rdf(project_id: str, format: Optional[str] = Query(None)):
     """Download the generated RDF file. If format is provided, return that specific file; otherwise return the most recent output.* file."""
-    project_dir = Path(settings.DATA_DIR) / project_id
-    ext_map = {"turtle":"ttl","json-ld":"jsonld","xml":"rdf","nt":"nt","n3":"n3"}
+    project_dir = project_data_dir(project_id)
     if format:
-        ext = ext_map.get(format, format)
+        ext = FORMAT_EXTENSIONS.get(format, format)
         candidate = project_dir / f"output.{ext}"
-        if candidate.exists():
-            from fastapi.responses import FileResponse
-            media_types = {
-                "ttl": "text/turtle",
-                "jsonld": "application/ld+json",
-                "rdf": "application/rdf+xml",
-                "nt": "application/n-triples",
-                "n3": "text/n3",
-            }
-            return FileResponse(str(candidate), media_type=media_types.get(ext, "text/plain"), filename=f"rdfmap-output.{ext}")
-        raise HTTPException(status_code=404, detail=f"Requested format not found: {format}")
-    # No format specified: choose most recent output.* by mtime
-    candidates = list(project_dir.glob("output.*"))
-    if not candidates:
-        raise HTTPException(status_code=404, detail="RDF output file not found. Run conversion first.")
-    latest = max(candidates, key=lambda p: p.stat().st_mtime)
-    from fastapi.responses import FileResponse
-    ext = latest.suffix.lstrip('.')
-    media_types = {
-        "ttl": "text/turtle",
-        "jsonld": "application/ld+json",
-        "rdf": "application/rdf+xml",
-        "nt": "application/n-triples",
-        "n3": "text/n3",
-    }
-    return FileResponse(str(latest), media_type=media_types.get(ext, "text/plain"), filename=f"rdfmap-output.{ext}")
+        try:
+            stat_result = os.stat(candidate)
+        except OSError:
+            raise HTTPException(status_code=404, detail=f"Requested format not found: {format}")
+        return FileResponse(str(candidate), media_type=MEDIA_TYPES.get(ext, "text/plain"), filename=f"rdfmap-output.{ext}", stat_result=stat_result)
+    # No format specified: use the output recorded by the last conversion
+    try:
+        meta = json.loads((project_dir / OUTPUT_META_FILE).read_text())
+        latest = meta["path"]
+        stat_result = os.stat(latest)
+    except (OSError, ValueError, KeyError):
+        # Outputs written before the sidecar existed: choose most recent output.* by mtime
+        # from a single directory listing
+        try:
+            with os.scandir(project_dir) as it:
+                candidates = [
+                    e for e in it
+                    if e.name.startswith("output.") and e.name != OUTPUT_META_FILE and e.is_file()
+                ]
+        except OSError:
+            candidates = []
+        if not candidates:
+            raise HTTPException(status_code=404, detail="RDF output file not found. Run conversion first.")
+        entry = max(candidates, key=lambda e: e.stat().st_mtime)
+        latest = entry.path
+        stat_result = entry.stat()
+    ext = os.path.splitext(latest)[1].lstrip('.')
+    return FileResponse(latest, media_type=MEDIA_TYPES.get(ext, "text/plain"), filename=f"rdfmap-output.{ext}", stat_result=stat_result)
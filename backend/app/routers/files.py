@@ -1,7 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
-from pathlib import Path
-from ..config import settings
+from ..paths import project_data_dir
 
 router = APIRouter()
 
@@ -12,17 +11,18 @@ WHITELIST = {
     'output.ttl', 'output.jsonld', 'output.rdf', 'output.nt', 'output.n3'
 }
 
+MEDIA_TYPES = {
+    'yaml': 'text/yaml', 'ttl': 'text/turtle', 'jsonld': 'application/ld+json',
+    'rdf': 'application/rdf+xml', 'nt': 'application/n-triples', 'n3': 'text/n3', 'html': 'text/html', 'json': 'application/json'
+}
+
 @router.get('/{project_id}/{filename}')
 async def get_project_file(project_id: str, filename: str):
     if filename not in WHITELIST:
         raise HTTPException(status_code=404, detail='File not found')
-    file_path = Path(settings.DATA_DIR) / project_id / filename
+    file_path = project_data_dir(project_id) / filename
     if not file_path.exists():
         raise HTTPException(status_code=404, detail='File not found')
-    media_types = {
-        'yaml': 'text/yaml', 'ttl': 'text/turtle', 'jsonld': 'application/ld+json',
-        'rdf': 'application/rdf+xml', 'nt': 'application/n-triples', 'n3': 'text/n3', 'html': 'text/html', 'json': 'application/json'
-    }
     ext = file_path.suffix.lstrip('.')
-    return FileResponse(str(file_path), media_type=media_types.get(ext, 'application/octet-stream'), filename=filename)
+    return FileResponse(str(file_path), media_type=MEDIA_TYPES.get(ext, 'application/octet-stream'), filename=filename)
 
@@ -1,10 +1,20 @@
 """Mappings router - handles mapping generation and management."""
-from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import Optional
+import asyncio
+import copy
+import json
 import logging
 
+import aiofiles
+import yaml
+from rdfmap.config.yarrrml_generator import internal_to_yarrrml
+
 from ..services.rdfmap_service import RDFMapService
-from ..config import settings
+from ..services.mapping_cache import SafeDumper, load_mapping
+from ..paths import project_data_dir, project_upload_dir
+from ..dependencies import get_rdfmap_service
+from ..http_cache import cache_headers, file_etag, is_not_modified
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -17,6 +27,12 @@ async def generate_mappings(
     base_iri: str = Query("http://example.org/", description="Base IRI for resources"),
     use_semantic: bool = Query(True, description="Use semantic matching"),
     min_confidence: float = Query(0.5, description="Minimum confidence threshold"),
+    include: str = Query(
+        "summary",
+        pattern="^(summary|full|yaml)$",
+        description="Response detail: summary (preview and counts), full (adds alignment report) or yaml (mapping YAML only)",
+    ),
+    service: RDFMapService = Depends(get_rdfmap_service),
 ):
     """
     Generate automatic mappings between data and ontology.
@@ -29,8 +45,7 @@ async def generate_mappings(
 
         # Get project files from projects router storage
         # For now, we'll construct paths - in production, query from database
-        from pathlib import Path
-        project_dir = Path(settings.UPLOAD_DIR) / project_id
+        project_dir = project_upload_dir(project_id)
 
         # Find data and ontology files
         data_files = list(project_dir.glob("data.*"))
@@ -45,11 +60,6 @@ async def generate_mappings(
         ontology_file = str(ontology_files[0])
 
         # Generate mappings
-        service = RDFMapService(
-            uploads_dir=settings.UPLOAD_DIR,
-            data_dir=settings.DATA_DIR,
-        )
-
         result = service.generate_mappings(
             project_id=project_id,
             ontology_file_path=ontology_file,
@@ -60,25 +70,28 @@ async def generate_mappings(
             min_confidence=min_confidence,
         )
 
-        sheet_columns = 0
-        if isinstance(result.get("mapping_config"), dict):
-            sheets = result["mapping_config"].get("sheets", [])
-            if sheets:
-                sheet_columns = len(sheets[0].get("columns", {}))
-        return {
+        # The YAML is already rendered; send it as-is instead of through the JSON encoder
+        if include == "yaml":
+            return Response(content=result["formatted_yaml"], media_type="text/yaml")
+
+        mapping_config = result.get("mapping_config") or {}
+        sheet0 = next(iter(mapping_config.get("sheets") or []), {})
+        response = {
             "status": "success",
             "project_id": project_id,
             "mapping_file": result["mapping_file"],
-            "alignment_report": result["alignment_report"],
             "mapping_summary": result.get("mapping_summary"),
-            "formatted_yaml": result.get("formatted_yaml"),
-            "match_details": result["alignment_report"].get("match_details", []) if result.get("alignment_report") else [],
             "mapping_preview": {
-                "base_iri": result["mapping_config"].get("defaults", {}).get("base_iri"),
-                "target_class": result["mapping_config"].get("sheets", [{}])[0].get("row_resource", {}).get("class"),
-                "column_count": sheet_columns,
-            }
+                "base_iri": mapping_config.get("defaults", {}).get("base_iri"),
+                "target_class": sheet0.get("row_resource", {}).get("class"),
+                "column_count": len(sheet0.get("columns", {})),
+            },
         }
+        if include == "full":
+            alignment_report = result.get("alignment_report") or {}
+            response["alignment_report"] = alignment_report
+            response["match_details"] = alignment_report.get("match_details", [])
+        return response
 
     except HTTPException:
         raise
@@ -88,20 +101,23 @@ async def generate_mappings(
 
 
 @router.get("/{project_id}")
-async def get_mappings(project_id: str, raw: bool = False):
+async def get_mappings(project_id: str, request: Request, response: Response, raw: bool = False):
     """
     Get the current mapping configuration for a project.
     """
     try:
-        from pathlib import Path
-        import yaml
-        mapping_file = Path(settings.DATA_DIR) / project_id / "mapping_config.yaml"
-        if not mapping_file.exists():
+        mapping_file = project_data_dir(project_id) / "mapping_config.yaml"
+        etag = file_etag(mapping_file, raw)
+        if etag is None:
             raise HTTPException(status_code=404, detail="No mappings found for project")
+        if is_not_modified(request, etag):
+            return Response(status_code=304, headers=cache_headers(etag))
         if raw:
-            return Response(content=mapping_file.read_text(), media_type="text/yaml")
-        with open(mapping_file, 'r') as f:
-            mapping_config = yaml.safe_load(f)
+            async with aiofiles.open(mapping_file, 'r') as f:
+                content = await f.read()
+            return Response(content=content, media_type="text/yaml", headers=cache_headers(etag))
+        mapping_config = await asyncio.to_thread(load_mapping, mapping_file)
+        response.headers.update(cache_headers(etag))
         return {
             "status": "success",
             "project_id": project_id,
@@ -121,13 +137,11 @@ async def override_mapping(project_id: str, column_name: str, property_uri: str)
     Updates mapping_config.yaml, sets matcher to manual_override, confidence to 1.0, and refreshes alignment_report match_details entry.
     """
     try:
-        from pathlib import Path
-        import yaml, json
-        project_dir = Path(settings.DATA_DIR) / project_id
+        project_dir = project_data_dir(project_id)
         mapping_file = project_dir / "mapping_config.yaml"
         if not mapping_file.exists():
             raise HTTPException(status_code=404, detail="No mapping config found")
-        raw = yaml.safe_load(mapping_file.read_text()) or {}
+        raw = copy.deepcopy(await asyncio.to_thread(load_mapping, mapping_file)) or {}
         # Only single-sheet support for override currently
         sheets = raw.get('sheets') or []
         if not sheets:
@@ -143,7 +157,7 @@ async def override_mapping(project_id: str, column_name: str, property_uri: str)
         raw['sheets'][0] = sheet0
         # Persist YAML
         with open(mapping_file, 'w') as f:
-            yaml.safe_dump(raw, f, sort_keys=False)
+            yaml.dump(raw, f, Dumper=SafeDumper, sort_keys=False)
         # Load alignment report JSON if exists, update match_details entry
         report_json = project_dir / 'alignment_report.json'
         updated_match_details = []
@@ -195,28 +209,20 @@ async def get_yarrrml(project_id: str):
     including x-alignment extensions for AI-powered metadata.
     """
     try:
-        from pathlib import Path
-        import yaml
-
-        project_dir = Path(settings.DATA_DIR) / project_id
+        project_dir = project_data_dir(project_id)
         mapping_file = project_dir / "mapping_config.yaml"
 
         if not mapping_file.exists():
             raise HTTPException(status_code=404, detail="No mappings found for project")
 
         # Load internal format
-        with open(mapping_file, 'r') as f:
-            internal_config = yaml.safe_load(f)
-
-        # Convert to YARRRML
-        from rdfmap.config.yarrrml_generator import internal_to_yarrrml
+        internal_config = await asyncio.to_thread(load_mapping, mapping_file)
 
         # Try to load alignment report for x-alignment metadata
         alignment_report = None
         report_json = project_dir / 'alignment_report.json'
         if report_json.exists():
             try:
-                import json
                 with open(report_json, 'r') as f:
                     alignment_report = json.load(f)
             except Exception as e:
@@ -228,6 +234,7 @@ async def get_yarrrml(project_id: str):
         # Serialize as YAML
         yaml_content = yaml.dump(
             yarrrml,
+            Dumper=SafeDumper,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True
@@ -261,10 +268,7 @@ async def get_column_evidence(project_id: str, column_name: str):
     - All matcher contributions
     """
     try:
-        from pathlib import Path
-        import json
-
-        project_dir = Path(settings.DATA_DIR) / project_id
+        project_dir = project_data_dir(project_id)
         report_json = project_dir / 'alignment_report.json'
 
         if not report_json.exists():
@@ -314,10 +318,7 @@ async def get_all_evidence(project_id: str):
     which includes rich evidence for all mapped columns.
     """
     try:
-        from pathlib import Path
-        import json
-
-        project_dir = Path(settings.DATA_DIR) / project_id
+        project_dir = project_data_dir(project_id)
         report_json = project_dir / 'alignment_report.json'
 
         if not report_json.exists():
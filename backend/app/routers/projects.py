@@ -1,21 +1,53 @@
 """Projects API router."""
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Request, Response
 from typing import List
 from pathlib import Path
 from sqlalchemy.orm import Session
+import aiofiles
+import asyncio
 import shutil
 import uuid
 import logging
 
+from rdfmap.parsers.data_source import create_parser
+
 from ..schemas.project import ProjectCreate, ProjectResponse
-from ..config import settings
+from ..paths import project_upload_dir
 from ..database import get_db
+from ..dependencies import get_rdfmap_service
+from ..http_cache import cache_headers, file_etag, is_not_modified
+from ..services.rdfmap_service import RDFMapService
 from ..models.project import Project
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB
+
+# Allowed upload extensions and their precomputed error messages
+_DATA_EXTENSIONS = (".csv", ".xlsx", ".json", ".xml")
+_ONTOLOGY_EXTENSIONS = (".ttl", ".owl", ".rdf")
+_RDF_EXTENSIONS = (".ttl", ".rdf", ".owl", ".trig", ".n3")
+_DATA_EXT = frozenset(_DATA_EXTENSIONS)
+_ONTOLOGY_EXT = frozenset(_ONTOLOGY_EXTENSIONS)
+_RDF_EXT = frozenset(_RDF_EXTENSIONS)
+_DATA_EXT_ERROR = f"Invalid file type. Allowed: {', '.join(_DATA_EXTENSIONS)}"
+_ONTOLOGY_EXT_ERROR = f"Invalid file type. Allowed: {', '.join(_ONTOLOGY_EXTENSIONS)}"
+_RDF_EXT_ERROR = f"Invalid file type. Allowed: {', '.join(_RDF_EXTENSIONS)}"
+
+
+async def _save_upload(file: UploadFile, file_path: Path) -> None:
+    """Stream an uploaded file to disk in chunks without blocking the event loop."""
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
+
+
+# Columns served by ProjectResponse, in schema order
+_PROJECT_COLUMNS = tuple(getattr(Project, name) for name in ProjectResponse.model_fields)
+
+
 # Helper to fetch project or 404
 def _get_project(db: Session, project_id: str) -> Project:
     project = db.get(Project, project_id)
@@ -43,52 +75,24 @@ async def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     db.refresh(db_project)
 
     # Create project directory
-    project_dir = Path(settings.UPLOAD_DIR) / project_id
+    project_dir = project_upload_dir(project_id)
     project_dir.mkdir(parents=True, exist_ok=True)
 
-    return {
-        "id": db_project.id,
-        "name": db_project.name,
-        "description": db_project.description,
-        "status": db_project.status,
-        "data_file": db_project.data_file,
-        "ontology_file": db_project.ontology_file,
-        "config": db_project.config,
-    }
+    return db_project
 
 
-@router.get("/", response_model=List[ProjectResponse])
+@router.get("/", response_model=None, responses={200: {"model": List[ProjectResponse]}})
 async def list_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all projects."""
-    projects = db.query(Project).offset(skip).limit(limit).all()
-    return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "description": p.description,
-            "status": p.status,
-            "data_file": p.data_file,
-            "ontology_file": p.ontology_file,
-            "config": p.config,
-        }
-        for p in projects
-    ]
+    # Select only the response columns as plain rows: no ORM instances, no per-row model validation
+    rows = db.query(*_PROJECT_COLUMNS).offset(skip).limit(limit).all()
+    return [row._asdict() for row in rows]
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(project_id: str, db: Session = Depends(get_db)):
     """Get a specific project."""
-    project = _get_project(db, project_id)
-
-    return {
-        "id": project.id,
-        "name": project.name,
-        "description": project.description,
-        "status": project.status,
-        "data_file": project.data_file,
-        "ontology_file": project.ontology_file,
-        "config": project.config,
-    }
+    return _get_project(db, project_id)
 
 
 @router.delete("/{project_id}")
@@ -97,9 +101,9 @@ async def delete_project(project_id: str, db: Session = Depends(get_db)):
     project = _get_project(db, project_id)
 
     # Delete project directory
-    project_dir = Path(settings.UPLOAD_DIR) / project_id
+    project_dir = project_upload_dir(project_id)
     if project_dir.exists():
-        shutil.rmtree(project_dir)
+        await asyncio.to_thread(shutil.rmtree, project_dir)
 
     # Delete database record
     db.delete(project)
@@ -118,21 +122,16 @@ async def upload_data_file(
     project = _get_project(db, project_id)
 
     # Validate file type
-    allowed_extensions = [".csv", ".xlsx", ".json", ".xml"]
     file_ext = Path(file.filename).suffix.lower()
 
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
-        )
+    if file_ext not in _DATA_EXT:
+        raise HTTPException(status_code=400, detail=_DATA_EXT_ERROR)
 
     # Save file
-    project_dir = Path(settings.UPLOAD_DIR) / project_id
+    project_dir = project_upload_dir(project_id)
     file_path = project_dir / f"data{file_ext}"
 
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    await _save_upload(file, file_path)
 
     # Update project in database
     project.data_file = str(file_path)
@@ -156,21 +155,16 @@ async def upload_ontology_file(
     project = _get_project(db, project_id)
 
     # Validate file type
-    allowed_extensions = [".ttl", ".owl", ".rdf"]
     file_ext = Path(file.filename).suffix.lower()
 
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
-        )
+    if file_ext not in _ONTOLOGY_EXT:
+        raise HTTPException(status_code=400, detail=_ONTOLOGY_EXT_ERROR)
 
     # Save file
-    project_dir = Path(settings.UPLOAD_DIR) / project_id
+    project_dir = project_upload_dir(project_id)
     file_path = project_dir / f"ontology{file_ext}"
 
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    await _save_upload(file, file_path)
 
     # Update project in database
     project.ontology_file = str(file_path)
@@ -193,15 +187,13 @@ async def upload_shapes_file(
     """Upload SHACL shapes file and associate it with the project (stored in project.config)."""
     project = _get_project(db, project_id)
 
-    allowed_extensions = [".ttl", ".rdf", ".owl", ".trig", ".n3"]
     file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in allowed_extensions:
-        raise HTTPException(status_code=400, detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}")
+    if file_ext not in _RDF_EXT:
+        raise HTTPException(status_code=400, detail=_RDF_EXT_ERROR)
 
-    project_dir = Path(settings.UPLOAD_DIR) / project_id
+    project_dir = project_upload_dir(project_id)
     file_path = project_dir / f"shapes{file_ext}"
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    await _save_upload(file, file_path)
 
     # Update project config
     cfg = dict(project.config or {})
@@ -221,12 +213,11 @@ async def upload_skos_file(
     """Upload a SKOS vocabulary file and associate it with the project (kept as a list in project.config['skos_files'])."""
     project = _get_project(db, project_id)
 
-    allowed_extensions = [".ttl", ".rdf", ".owl", ".trig", ".n3"]
     file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in allowed_extensions:
-        raise HTTPException(status_code=400, detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}")
+    if file_ext not in _RDF_EXT:
+        raise HTTPException(status_code=400, detail=_RDF_EXT_ERROR)
 
-    project_dir = Path(settings.UPLOAD_DIR) / project_id
+    project_dir = project_upload_dir(project_id)
     project_dir.mkdir(parents=True, exist_ok=True)
     # Name with increment to avoid overwriting
     base = "skos"
@@ -236,8 +227,7 @@ async def upload_skos_file(
         target = project_dir / f"{base}-{idx}{file_ext}"
         idx += 1
 
-    with open(target, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    await _save_upload(file, target)
 
     cfg = dict(project.config or {})
     skos_files = list(cfg.get('skos_files', []) or [])
@@ -250,30 +240,35 @@ async def upload_skos_file(
 
 
 @router.get("/{project_id}/data-preview")
-async def get_data_preview(project_id: str, limit: int = 10, db: Session = Depends(get_db)):
+async def get_data_preview(
+    project_id: str,
+    request: Request,
+    response: Response,
+    limit: int = 10,
+    db: Session = Depends(get_db),
+    service: RDFMapService = Depends(get_rdfmap_service),
+):
     """Get preview of data file (first N rows) with analysis."""
     project = _get_project(db, project_id)
 
     if not project.data_file:
         raise HTTPException(status_code=400, detail="No data file uploaded")
 
-    try:
-        from ..services.rdfmap_service import RDFMapService
-        from rdfmap.parsers.data_source import create_parser
+    # The preview only changes when the data file is re-uploaded
+    etag = file_etag(project.data_file, limit)
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag))
 
+    try:
         data_file = str(project.data_file)
 
-        service = RDFMapService(uploads_dir=settings.UPLOAD_DIR, data_dir=settings.DATA_DIR)
         analysis = service.analyze_data_file(data_file)
 
+        # Only the first `limit` rows are needed for the preview table
         parser = create_parser(Path(data_file))
-        dataframes = list(parser.parse())
-
-        rows = []
-        if dataframes:
-            df = dataframes[0]
-            rows = df.head(limit).to_dicts()
+        rows = parser.parse_head(limit).to_dicts()
 
+        response.headers.update(cache_headers(etag))
         return {
             **analysis,
             "rows": rows,
@@ -292,18 +287,28 @@ async def get_data_preview(project_id: str, limit: int = 10, db: Session = Depen
 
 
 @router.get("/{project_id}/ontology-analysis")
-async def get_ontology_analysis(project_id: str, db: Session = Depends(get_db)):
+async def get_ontology_analysis(
+    project_id: str,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    service: RDFMapService = Depends(get_rdfmap_service),
+):
     """Get analysis of the uploaded ontology using persisted project in DB."""
     project = _get_project(db, project_id)
 
     if not project.ontology_file:
         raise HTTPException(status_code=400, detail="No ontology file uploaded")
 
+    # Skip re-parsing the ontology when the client already has the current analysis
+    etag = file_etag(project.ontology_file)
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=cache_headers(etag))
+
     try:
-        from ..services.rdfmap_service import RDFMapService
         ontology_file = str(project.ontology_file)
-        service = RDFMapService(uploads_dir=settings.UPLOAD_DIR, data_dir=settings.DATA_DIR)
         analysis = service.analyze_ontology(ontology_file)
+        response.headers.update(cache_headers(etag))
         return analysis
     except Exception as e:
         logger.error(f"Error analyzing ontology: {e}", exc_info=True)
@@ -1,11 +1,96 @@
-"""WebSocket router - placeholder."""
-from fastapi import APIRouter, WebSocket
+"""WebSocket router - streams conversion progress events to clients."""
+import asyncio
+import logging
+
+import orjson
+import redis.asyncio as aioredis
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from ..config import settings
+from ..worker import progress_channel
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Progress events are coalesced so a long conversion doesn't cost one frame per event
+MAX_BATCH_SIZE = 64
+BATCH_WINDOW_SECONDS = 0.05
+QUEUE_SIZE = 1024
+
+
+async def _read_events(pubsub, queue: asyncio.Queue) -> None:
+    """Move published progress events from Redis into the connection's queue."""
+    async for message in pubsub.listen():
+        if message.get("type") != "message":
+            continue
+        try:
+            event = orjson.loads(message["data"])
+        except orjson.JSONDecodeError:
+            continue
+        if queue.full():
+            # Drop the oldest event rather than stalling the subscriber
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+async def _next_batch(queue: asyncio.Queue) -> list:
+    """Wait for one event, then collect more for up to BATCH_WINDOW_SECONDS."""
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + BATCH_WINDOW_SECONDS
+    while len(batch) < MAX_BATCH_SIZE:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
 
 @router.websocket("/{project_id}")
 async def websocket_endpoint(websocket: WebSocket, project_id: str):
+    """Push batched progress events (JSON arrays) for a project's conversions."""
     await websocket.accept()
     await websocket.send_json({"message": "Connected"})
-    await websocket.close()
 
+    client = aioredis.from_url(settings.REDIS_URL)
+    pubsub = client.pubsub()
+    reader = receiver = batch = None
+    try:
+        await pubsub.subscribe(progress_channel(project_id))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        # Watch the socket and the Redis reader alongside the batch wait, so a
+        # client disconnect or a Redis error ends the stream without waiting for
+        # the next event
+        reader = asyncio.create_task(_read_events(pubsub, queue))
+        receiver = asyncio.create_task(websocket.receive())
+        batch = asyncio.create_task(_next_batch(queue))
+        while True:
+            done, _ = await asyncio.wait({reader, receiver, batch}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                if receiver.result()["type"] == "websocket.disconnect":
+                    break
+                # Messages from the client are ignored
+                receiver = asyncio.create_task(websocket.receive())
+            if batch in done:
+                await websocket.send_text(orjson.dumps(batch.result()).decode())
+                batch = asyncio.create_task(_next_batch(queue))
+            if reader in done:
+                reader.result()  # Re-raises the Redis error, if any
+                raise RuntimeError("Progress subscription ended")
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Progress stream failed for project {project_id}: {e}")
+        try:
+            await websocket.close(code=1011)
+        except Exception:
+            pass  # Socket already closed
+    finally:
+        for task in (reader, receiver, batch):
+            if task:
+                task.cancel()
+        await pubsub.aclose()
+        await client.aclose()
@@ -0,0 +1,11 @@
+"""Pydantic schemas for RDF conversion."""
+
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class BulkConversionRequest(BaseModel):
+    """Schema for queueing conversions for several projects at once."""
+    project_ids: List[str] = Field(..., min_length=1)
+    output_format: str = Field("turtle", description="RDF format: turtle, json-ld, xml, nt")
+    validate_output: bool = Field(True, alias="validate", description="Validate output against ontology")
@@ -1,6 +1,6 @@
 """Pydantic schemas for projects."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
@@ -13,6 +13,8 @@ class ProjectCreate(BaseModel):
 
 class ProjectResponse(BaseModel):
     """Schema for project response."""
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     id: str
     name: str
     description: Optional[str] = None
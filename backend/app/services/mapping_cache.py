@@ -0,0 +1,67 @@
+"""In-process cache of parsed mapping_config.yaml files."""
+
+from pathlib import Path
+from typing import Any, Dict, Tuple
+import os
+
+import yaml
+from rdfmap.config.loader import load_mapping_config, mapping_config_from_data
+from rdfmap.models.mapping import MappingConfig
+
+# SafeDumper is re-exported for modules that write mapping YAML
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader, SafeDumper  # noqa: F401
+
+_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_mapping(path: Path) -> Any:
+    """Load and parse a mapping YAML file, reusing the last parse while the file is unchanged.
+
+    Entries are keyed by path and invalidated when the file's mtime or size
+    changes. The returned object is shared between callers, so copy it
+    before mutating.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    hit = _cache.get(key)
+    if hit and hit[0] == stamp:
+        return hit[1]
+    data = yaml.load(path.read_bytes(), Loader=SafeLoader)
+    _cache[key] = (stamp, data)
+    return data
+
+
+_configs: Dict[str, Tuple[Tuple[int, int], MappingConfig]] = {}
+
+
+def load_config(path: str) -> MappingConfig:
+    """Load and validate a mapping config, reusing the parsed model while the file is unchanged.
+
+    The (mtime, size) stamp is checked on every call, so an edited file is
+    re-parsed. The returned model is shared; treat it as read-only.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    hit = _configs.get(key)
+    if hit and hit[0] == stamp:
+        return hit[1]
+    config = load_mapping_config(path)
+    _configs[key] = (stamp, config)
+    return config
+
+
+def prime_config(path: str, text: str) -> MappingConfig:
+    """Cache the model for a mapping file this process has just written.
+
+    Builds the config from the in-memory YAML text, so the next load_config
+    for the unchanged file skips both the disk read and validation.
+    """
+    st = os.stat(path)
+    config = mapping_config_from_data(yaml.load(text, Loader=SafeLoader), Path(path).parent)
+    _configs[str(path)] = ((st.st_mtime_ns, st.st_size), config)
+    return config
@@ -1,19 +1,217 @@
 """RDFMap service layer - wraps core library functionality."""
 
+import json
 import logging
+import os
+import queue
+import re
+import shutil
+import threading
+from contextlib import nullcontext
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+import polars as pl
+import yaml
+from rdflib import Graph, Namespace, plugin
+from rdflib.parser import Parser
+from rdflib.serializer import Serializer
 
 # Import from correct module paths
 from rdfmap.generator.mapping_generator import MappingGenerator, GeneratorConfig
 from rdfmap.generator.ontology_analyzer import OntologyAnalyzer
+from rdfmap.generator.semantic_matcher import SemanticMatcher
 from rdfmap.emitter.graph_builder import RDFGraphBuilder, serialize_graph
+from rdfmap.emitter.nt_streaming import NTriplesStreamWriter
 from rdfmap.models.errors import ProcessingReport
+from rdfmap.models.mapping import MappingConfig
 from rdfmap.parsers.data_source import create_parser
-from rdfmap.config.loader import load_mapping_config
+
+try:
+    from rdfmap.validator.shacl import validate_rdf
+except ImportError:  # pySHACL not available
+    validate_rdf = None
+
+from .mapping_cache import SafeDumper, SafeLoader, load_config, prime_config
 
 logger = logging.getLogger(__name__)
 
+OUTPUT_META_FILE = "output.meta.json"
+
+# Per-sheet N-Triples files written by convert_sheet, removed once merged
+SHEET_PARTS_DIR = "parts"
+
+# Violations included in the conversion response; the full count is always reported
+SHACL_RESULT_SAMPLES = 50
+
+# Rows read by analyze_data_file; matches Polars' default schema inference window
+ANALYSIS_SAMPLE_ROWS = 100
+
+FORMAT_EXTENSIONS = {
+    "turtle": "ttl",
+    "json-ld": "jsonld",
+    "xml": "rdf",
+    "nt": "nt",
+    "n3": "n3",
+}
+
+# IRI template placeholders, and the ones that are template variables rather than columns
+_TEMPLATE_VAR_RE = re.compile(r'{(\w+)}')
+_TEMPLATE_BUILTINS = frozenset(('base_iri', 'base_uri', 'namespace'))
+
+# rdflib formats used for ontology uploads and conversion output
+RDF_PLUGIN_FORMATS = ("turtle", "xml", "json-ld", "nt", "n3")
+
+
+_CLASS_FIELDS = attrgetter('uri', 'label', 'pref_label', 'comment', 'alt_labels', 'hidden_labels')
+_PROPERTY_FIELDS = attrgetter(
+    'uri', 'label', 'pref_label', 'comment', 'is_object_property', 'domain', 'range_type',
+    'is_functional', 'is_inverse_functional', 'alt_labels', 'hidden_labels',
+)
+
+
+@lru_cache(maxsize=32)
+def _shapes_graph_cached(path: str, mtime_ns: int, size: int) -> Graph:
+    """Parsed SHACL shapes for one version (mtime, size) of a file; shared, do not mutate."""
+    shapes = Graph()
+    shapes.parse(path)
+    return shapes
+
+
+@lru_cache(maxsize=32)
+def _analyze_ontology_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Ontology analysis for one version (mtime, size) of a file.
+
+    The result is shared between requests; callers must not mutate it.
+    """
+    analyzer = OntologyAnalyzer(path)
+
+    # Read each entity's attributes with one attrgetter call instead of a getattr per field
+    classes = [
+        {
+            "uri": uri,
+            "label": label,
+            "pref_label": pref_label,
+            "comment": comment,
+            "skos_labels": {
+                "pref_label": pref_label,
+                "alt_labels": alt_labels,
+                "hidden_labels": hidden_labels,
+            },
+        }
+        for uri, label, pref_label, comment, alt_labels, hidden_labels
+        in map(_CLASS_FIELDS, analyzer.classes.values())
+    ]
+
+    properties = [
+        {
+            "uri": uri,
+            "label": label,
+            "pref_label": pref_label,
+            "comment": comment,
+            "is_object_property": is_object,
+            "property_kind": 'object' if is_object else 'data',
+            "domain": domain,
+            "range": range_type,
+            "is_functional": is_functional,
+            "is_inverse_functional": is_inverse_functional,
+            "skos_labels": {
+                "pref_label": pref_label,
+                "alt_labels": alt_labels,
+                "hidden_labels": hidden_labels,
+            },
+        }
+        for (uri, label, pref_label, comment, is_object, domain, range_type,
+             is_functional, is_inverse_functional, alt_labels, hidden_labels)
+        in map(_PROPERTY_FIELDS, analyzer.properties.values())
+    ]
+
+    return {
+        "total_classes": len(classes),
+        "total_properties": len(properties),
+        "classes": classes,
+        "properties": properties,
+    }
+
+
+# Dtypes whose Polars string cast matches str() of the Python value
+_STR_CASTABLE = (pl.Utf8, pl.Date, pl.Time, pl.Decimal)
+
+
+def _sample_strings(column: pl.Series, n: int = 5) -> List[str]:
+    """First n non-null values of a column as strings."""
+    head = column.drop_nulls().head(n)
+    if head.dtype.is_numeric() or head.dtype in _STR_CASTABLE:
+        return head.cast(pl.Utf8).to_list()
+    # Booleans, datetimes, durations and nested values keep their Python formatting
+    return [str(v) for v in head]
+
+
+_REPORT_COUNTERS = tuple(
+    name for name, field in ProcessingReport.model_fields.items() if field.annotation is int
+)
+
+
+def _merge_reports(reports: Iterable[ProcessingReport]) -> ProcessingReport:
+    """Fold per-sheet processing reports into one (counters summed, samples capped at 10)."""
+    merged = ProcessingReport()
+    for report in reports:
+        for name in _REPORT_COUNTERS:
+            setattr(merged, name, getattr(merged, name) + getattr(report, name))
+        merged.errors.extend(report.errors)
+        merged.structural_samples.extend(report.structural_samples[:10 - len(merged.structural_samples)])
+    return merged
+
+
+def _parse_sheets_in_background(sheets) -> Iterator[Tuple[Any, Any]]:
+    """Yield (DataFrame, sheet) pairs parsed by a producer thread.
+
+    Parsing (Polars, releases the GIL) overlaps with the caller's graph
+    building; at most two frames are buffered. Only the calling thread
+    touches the results, so the builder needs no locking.
+    """
+    frames: queue.Queue = queue.Queue(maxsize=2)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        # One parser per source; a source shared by several sheets is re-read for
+        # each (from the page cache) so frames stay streamed instead of buffered
+        parsers: Dict[str, Any] = {}
+        try:
+            for sheet in sheets:
+                parser = parsers.get(sheet.source)
+                if parser is None:
+                    parser = parsers[sheet.source] = create_parser(Path(sheet.source))
+                for df in parser.parse():
+                    if stop.is_set():
+                        return
+                    put((df, sheet))
+        except Exception as e:
+            put(e)
+        finally:
+            put(None)
+
+    thread = threading.Thread(target=produce, name="sheet-parser", daemon=True)
+    thread.start()
+    try:
+        while (item := frames.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
 
 class RDFMapService:
     """Service class for RDFMap operations."""
@@ -21,6 +219,30 @@ class RDFMapService:
     def __init__(self, uploads_dir: str = "/app/uploads", data_dir: str = "/app/data"):
         self.uploads_dir = Path(uploads_dir)
         self.data_dir = Path(data_dir)
+        self._semantic_matcher = None
+
+    @property
+    def encoder(self):
+        """Sentence-transformer model used for semantic matching, loaded on first access."""
+        if self._semantic_matcher is None:
+            self._semantic_matcher = SemanticMatcher()
+        return self._semantic_matcher.model
+
+    def warmup(self, load_encoder: bool = True) -> None:
+        """Preload rdflib parser/serializer plugins and the sentence-transformer model so the first request doesn't pay for them."""
+        for fmt in RDF_PLUGIN_FORMATS:
+            for kind in (Parser, Serializer):
+                try:
+                    plugin.get(fmt, kind)
+                except plugin.PluginException:
+                    pass
+        if not load_encoder:
+            return
+        try:
+            self.encoder.encode(["warmup"], convert_to_numpy=True)
+            logger.info("Semantic model loaded and warmed up")
+        except Exception as e:
+            logger.warning("Semantic model warmup failed: %s", e)
 
     def analyze_data_file(self, data_file_path: str) -> Dict[str, Any]:
         """
@@ -34,28 +256,21 @@ class RDFMapService:
         """
         try:
             # Use parser to get basic info - convert string to Path
-            from pathlib import Path as PathlibPath
-            file_path = PathlibPath(data_file_path) if isinstance(data_file_path, str) else data_file_path
+            file_path = Path(data_file_path) if isinstance(data_file_path, str) else data_file_path
             parser = create_parser(file_path)
-            dataframes = list(parser.parse())
+            # Types and samples only need a bounded head of the file
+            df = parser.parse_head(ANALYSIS_SAMPLE_ROWS)
 
-            if not dataframes:
+            if df.width == 0:
                 return {"total_columns": 0, "columns": [], "row_count": 0}
 
-            df = dataframes[0]
-
             # Get column information from dataframe
             columns = []
-            for col_name in df.columns:
-                col_data = df[col_name]
-
-                # Get sample values (first 5 non-null)
-                sample_values = col_data.drop_nulls().head(5).to_list()
-
+            for col_data in df.get_columns():
                 columns.append({
-                    "name": col_name,
+                    "name": col_data.name,
                     "inferred_type": str(col_data.dtype),
-                    "sample_values": [str(v) for v in sample_values],
+                    "sample_values": _sample_strings(col_data),
                     "is_identifier": False,  # TODO: detect identifiers
                     "is_foreign_key": False,  # TODO: detect FKs
                 })
@@ -63,10 +278,10 @@ class RDFMapService:
             return {
                 "total_columns": len(columns),
                 "columns": columns,
-                "row_count": len(df),
+                "row_count": parser.count_rows(),
             }
         except Exception as e:
-            logger.error(f"Error analyzing data file: {e}")
+            logger.error("Error analyzing data file: %s", e)
             raise
 
     def analyze_ontology(self, ontology_file_path: str) -> Dict[str, Any]:
@@ -80,52 +295,10 @@ class RDFMapService:
             Dictionary with classes, properties, and their metadata
         """
         try:
-            analyzer = OntologyAnalyzer(ontology_file_path)
-
-            # Get classes
-            classes = []
-            for class_uri, ont_class in analyzer.classes.items():
-                classes.append({
-                    "uri": class_uri,
-                    "label": getattr(ont_class, 'label', None),
-                    "pref_label": getattr(ont_class, 'pref_label', None),
-                    "comment": getattr(ont_class, 'comment', None),
-                    "skos_labels": {
-                        "pref_label": getattr(ont_class, 'skos_pref_label', None),
-                        "alt_labels": getattr(ont_class, 'skos_alt_labels', []),
-                        "hidden_labels": getattr(ont_class, 'skos_hidden_labels', []),
-                    }
-                })
-
-            # Get properties
-            properties = []
-            for prop_uri, ont_prop in analyzer.properties.items():
-                properties.append({
-                    "uri": prop_uri,
-                    "label": getattr(ont_prop, 'label', None),
-                    "pref_label": getattr(ont_prop, 'pref_label', None),
-                    "comment": getattr(ont_prop, 'comment', None),
-                    "is_object_property": getattr(ont_prop, 'is_object_property', False),
-                    "property_kind": 'object' if getattr(ont_prop, 'is_object_property', False) else 'data',
-                    "domain": getattr(ont_prop, 'domain', None),
-                    "range": getattr(ont_prop, 'range_type', getattr(ont_prop, 'range', None)),
-                    "is_functional": getattr(ont_prop, 'is_functional', False),
-                    "is_inverse_functional": getattr(ont_prop, 'is_inverse_functional', False),
-                    "skos_labels": {
-                        "pref_label": getattr(ont_prop, 'pref_label', None) or getattr(ont_prop, 'skos_pref_label', None),
-                        "alt_labels": getattr(ont_prop, 'alt_labels', []) or getattr(ont_prop, 'skos_alt_labels', []),
-                        "hidden_labels": getattr(ont_prop, 'hidden_labels', []) or getattr(ont_prop, 'skos_hidden_labels', []),
-                    }
-                })
-
-            return {
-                "total_classes": len(classes),
-                "total_properties": len(properties),
-                "classes": classes,
-                "properties": properties,
-            }
+            st = os.stat(ontology_file_path)
+            return _analyze_ontology_cached(str(ontology_file_path), st.st_mtime_ns, st.st_size)
         except Exception as e:
-            logger.error(f"Error analyzing ontology: {e}")
+            logger.error("Error analyzing ontology: %s", e)
             raise
 
     def _refine_mortgage_mapping(self, mapping_config: dict) -> dict:
@@ -157,11 +330,10 @@ class RDFMapService:
                     # Extract column names from iri_template (e.g., {BorrowerID})
                     # Exclude common template variables like base_iri
                     iri_template = obj_config.get('iri_template', '')
-                    import re
-                    fk_cols = re.findall(r'{(\w+)}', iri_template)
-                    # Filter out known template variables
-                    fk_cols = [col for col in fk_cols if col not in ('base_iri', 'base_uri', 'namespace')]
-                    object_columns_set.update(fk_cols)
+                    object_columns_set.update(
+                        col for col in _TEMPLATE_VAR_RE.findall(iri_template)
+                        if col not in _TEMPLATE_BUILTINS
+                    )
 
                     # Add columns from object properties
                     properties = obj_config.get('properties', []) or []
@@ -226,7 +398,7 @@ class RDFMapService:
             Dictionary with generated mappings and alignment report
         """
         try:
-            logger.info(f"Generating mappings for project {project_id}")
+            logger.info("Generating mappings for project %s", project_id)
             config = GeneratorConfig(base_iri=base_iri, min_confidence=min_confidence, imports=[ontology_file_path])
             generator = MappingGenerator(
                 ontology_file=ontology_file_path,
@@ -258,10 +430,15 @@ class RDFMapService:
                         if sk not in imports:
                             imports.append(sk)
                 except Exception as e:
-                    logger.warning(f"Failed to include SKOS files in imports: {e}")
+                    logger.warning("Failed to include SKOS files in imports: %s", e)
                 mapping_config['imports'] = imports
             generator.mapping = mapping_config
-            generator.save_yaml(str(mapping_file))
+            formatted_yaml = generator.save_yaml(str(mapping_file))
+            # A conversion usually follows; hand it the model instead of re-reading the YAML
+            try:
+                prime_config(str(mapping_file), formatted_yaml)
+            except Exception as e:
+                logger.warning("Generated mapping does not load as a config: %s", e)
             # Export alignment report artifacts
             report_json = self.data_dir / project_id / 'alignment_report.json'
             report_html = self.data_dir / project_id / 'alignment_report.html'
@@ -271,7 +448,7 @@ class RDFMapService:
                     generator.export_alignment_report(str(report_json))
                     generator.export_alignment_html(str(report_html))
             except Exception as e:
-                logger.warning(f"Failed to export alignment report: {e}")
+                logger.warning("Failed to export alignment report: %s", e)
             summary = self.summarize_mapping(mapping_config)
             # Extract match details for UI convenience
             match_details = []
@@ -279,10 +456,11 @@ class RDFMapService:
                 if alignment_report and hasattr(alignment_report, 'match_details'):
                     match_details = [md.dict() for md in alignment_report.match_details]
             except Exception as e:
-                logger.warning(f"Failed to serialize match details: {e}")
+                logger.warning("Failed to serialize match details: %s", e)
             return {
                 "mapping_config": mapping_config,
                 "mapping_file": str(mapping_file),
+                "formatted_yaml": formatted_yaml,
                 "alignment_report": alignment_report.to_dict() if alignment_report else {},
                 "alignment_report_json": str(report_json),
                 "alignment_report_html": str(report_html),
@@ -290,118 +468,313 @@ class RDFMapService:
                 "match_details": match_details,
             }
         except Exception as e:
-            logger.error(f"Error generating mappings: {e}", exc_info=True)
+            logger.error("Error generating mappings: %s", e, exc_info=True)
             raise
 
+    def _load_conversion_config(
+        self, project_id: str, mapping_file_path: Optional[str] = None
+    ) -> Tuple[str, MappingConfig, Optional[str]]:
+        """Load the mapping config and locate the ontology used for structural checks.
+
+        Returns:
+            (mapping file path, config, ontology path or None)
+        """
+        if not mapping_file_path:
+            mapping_file_path = str(self.data_dir / project_id / "mapping_config.yaml")
+
+        config = load_config(mapping_file_path)
+
+        # Attempt to discover ontology from imports or fallback to uploaded ontology
+        discovered_ontology_path = None
+        if config.imports and len(config.imports) > 0:
+            discovered_ontology_path = config.imports[0]
+        else:
+            # Fallback: look in uploads dir for ontology.*
+            uploads_project_dir = self.uploads_dir / project_id
+            candidates = list(uploads_project_dir.glob("ontology.*"))
+            if candidates:
+                discovered_ontology_path = str(candidates[0])
+                # Persist this into the mapping YAML for future runs
+                try:
+                    with open(mapping_file_path, 'r') as f:
+                        raw_cfg = yaml.load(f, Loader=SafeLoader) or {}
+                    raw_cfg.setdefault('imports', []).insert(0, discovered_ontology_path)
+                    text = yaml.dump(raw_cfg, Dumper=SafeDumper, sort_keys=False)
+                    with open(mapping_file_path, 'w') as f:
+                        f.write(text)
+                    # Rebuild config from the text just written to pick up new imports
+                    config = prime_config(mapping_file_path, text)
+                except Exception as pe:
+                    logger.warning("Failed to persist discovered ontology import: %s", pe)
+
+        return mapping_file_path, config, discovered_ontology_path
+
+    @staticmethod
+    def _ontology_analyzer(ontology_path: Optional[str], config: MappingConfig) -> Optional[OntologyAnalyzer]:
+        if not ontology_path:
+            return None
+        try:
+            return OntologyAnalyzer(ontology_path, imports=config.imports)
+        except Exception as e:
+            logger.warning("Failed to load ontology for structural validation: %s", e)
+            return None
+
+    @staticmethod
+    def _streams_nt(config: MappingConfig, output_format: str) -> bool:
+        # Like the CLI, N-Triples output streams straight to disk without an in-memory
+        # graph unless the mapping explicitly asks for aggregation (which structural
+        # validation and reasoning rely on)
+        options = config.options
+        return output_format == "nt" and not (
+            "aggregate_duplicates" in options.model_fields_set and options.aggregate_duplicates
+        )
+
     def convert_to_rdf(
         self,
         project_id: str,
         mapping_file_path: Optional[str] = None,
         output_format: str = "turtle",
         validate: bool = True,
+        validate_shapes: bool = False,
     ) -> Dict[str, Any]:
         """
         Convert data to RDF using mapping configuration.
+
+        SHACL validation against the project's uploaded shapes is opt-in
+        (validate_shapes) since it costs a full pySHACL run per conversion.
         """
         try:
-            logger.info(f"Converting project {project_id} to RDF")
-
-            # Load mapping config (validated pydantic model)
-            if not mapping_file_path:
-                project_dir = self.data_dir / project_id
-                mapping_file_path = str(project_dir / "mapping_config.yaml")
-
-            config = load_mapping_config(mapping_file_path)
+            logger.info("Converting project %s to RDF", project_id)
 
-            # Attempt to discover ontology from imports or fallback to uploaded ontology
-            discovered_ontology_path = None
-            if config.imports and len(config.imports) > 0:
-                discovered_ontology_path = config.imports[0]
-            else:
-                # Fallback: look in uploads dir for ontology.*
-                uploads_project_dir = self.uploads_dir / project_id
-                candidates = list(uploads_project_dir.glob("ontology.*"))
-                if candidates:
-                    discovered_ontology_path = str(candidates[0])
-                    # Persist this into the mapping YAML for future runs
-                    try:
-                        import yaml
-                        with open(mapping_file_path, 'r') as f:
-                            raw_cfg = yaml.safe_load(f) or {}
-                        raw_cfg.setdefault('imports', []).insert(0, discovered_ontology_path)
-                        with open(mapping_file_path, 'w') as f:
-                            yaml.safe_dump(raw_cfg, f, sort_keys=False)
-                        # Reload config to pick up new imports
-                        config = load_mapping_config(mapping_file_path)
-                    except Exception as pe:
-                        logger.warning(f"Failed to persist discovered ontology import: {pe}")
+            mapping_file_path, config, ontology_path = self._load_conversion_config(project_id, mapping_file_path)
 
             # Initialize report and builder
             report = ProcessingReport()
-            onto_analyzer = None
-            if discovered_ontology_path:
-                try:
-                    onto_analyzer = OntologyAnalyzer(discovered_ontology_path, imports=config.imports)
-                except Exception as e:
-                    logger.warning(f"Failed to load ontology for structural validation: {e}")
-            builder = RDFGraphBuilder(config, report, ontology_analyzer=onto_analyzer)
-
-            # For each sheet, parse its source into DataFrames and add to builder
-            for sheet in config.sheets:
-                source_path = Path(sheet.source)
-                parser = create_parser(source_path)
-                dataframes = list(parser.parse())
-                for df in dataframes:
-                    builder.add_dataframe(df, sheet)
-
+            onto_analyzer = self._ontology_analyzer(ontology_path, config)
             # Determine output format extension
-            format_extensions = {
-                "turtle": "ttl",
-                "json-ld": "jsonld",
-                "xml": "rdf",
-                "nt": "nt",
-                "n3": "n3",
-            }
-            ext = format_extensions.get(output_format, "ttl")
+            ext = FORMAT_EXTENSIONS.get(output_format, "ttl")
 
             # Save RDF output
-            project_dir = self.data_dir / project_id
-            output_file = project_dir / f"output.{ext}"
+            output_file = self.data_dir / project_id / f"output.{ext}"
 
-            graph = builder.get_graph()
-            if graph is None:
-                raise ValueError("Graph not available (streaming mode not enabled in this path)")
+            stream_nt = self._streams_nt(config, output_format)
+            nt_writer = NTriplesStreamWriter(output_file) if stream_nt else None
+            builder = RDFGraphBuilder(config, report, streaming_writer=nt_writer, ontology_analyzer=onto_analyzer)
 
-            serialize_graph(graph, output_format, output_file)
-            logger.info(f"RDF output saved to {output_file} with {builder.get_triple_count()} triples")
+            with nt_writer if nt_writer else nullcontext():
+                # Parse sheets on a background thread while this thread builds the graph
+                for df, sheet in _parse_sheets_in_background(config.sheets):
+                    builder.add_dataframe(df, sheet)
 
-            # Validation (optional)
-            ontology_structural = {
-                "domain_violations": report.domain_violations,
-                "range_violations": report.range_violations,
-                "samples": report.structural_samples,
-                "compliance_rate": 1.0 if builder.get_triple_count()==0 else (1.0 - ((report.domain_violations + report.range_violations) / builder.get_triple_count()))
-            }
-            reasoning_metrics = {
-                "inferred_types": report.inferred_types,
-                "inverse_links_added": report.inverse_links_added,
-                "transitive_links_added": report.transitive_links_added,
-                "symmetric_links_added": report.symmetric_links_added,
-                "cardinality_violations": report.cardinality_violations,
-                "min_cardinality_violations": report.min_cardinality_violations,
-                "max_cardinality_violations": report.max_cardinality_violations,
-                "exact_cardinality_violations": report.exact_cardinality_violations,
-            }
+            graph = None
+            if not stream_nt:
+                graph = builder.get_graph()
+                if graph is None:
+                    raise ValueError("Graph not available (streaming mode not enabled in this path)")
+                serialize_graph(graph, output_format, output_file)
+            logger.info("RDF output saved to %s with %s triples", output_file, builder.get_triple_count())
 
-            return {
-                "output_file": str(output_file),
-                "format": output_format,
-                "triple_count": builder.get_triple_count(),
-                "ontology_structural": ontology_structural,
-                "reasoning": reasoning_metrics,
-                "errors": [str(e) for e in report.errors] if report.errors else [],
-                "warnings": report.warnings,
-            }
+            return self._conversion_result(
+                project_id, output_file, output_format, builder.get_triple_count(), report, graph, validate_shapes
+            )
         except Exception as e:
-            logger.error(f"Error converting to RDF: {e}", exc_info=True)
+            logger.error("Error converting to RDF: %s", e, exc_info=True)
             raise
+
+    def resolve_ontology_import(self, project_id: str, mapping_file_path: Optional[str] = None) -> Optional[str]:
+        """
+        Locate the conversion ontology, persisting a discovered import into the mapping.
+
+        Called once before per-sheet tasks are dispatched, so the tasks only
+        read the mapping file while they run in parallel.
+        """
+        return self._load_conversion_config(project_id, mapping_file_path)[2]
+
+    def convert_sheet(
+        self,
+        project_id: str,
+        sheet_index: int,
+        mapping_file_path: Optional[str] = None,
+        output_format: str = "turtle",
+        ontology_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Convert one sheet of a mapping to an N-Triples part file.
+
+        Used to spread a multi-sheet conversion over several workers; the parts
+        are combined by merge_sheet_parts. Structural validation and reasoning
+        only see the triples of this sheet. The mapping file is read, never
+        written; ontology_path comes from resolve_ontology_import.
+
+        Returns:
+            Part file path, its triple count and the sheet's processing report
+        """
+        if not mapping_file_path:
+            mapping_file_path = str(self.data_dir / project_id / "mapping_config.yaml")
+        config = load_config(mapping_file_path)
+        sheet = config.sheets[sheet_index]
+
+        parts_dir = self.data_dir / project_id / SHEET_PARTS_DIR
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        part_file = parts_dir / f"sheet-{sheet_index}.nt"
+
+        report = ProcessingReport()
+        if self._streams_nt(config, output_format):
+            nt_writer = NTriplesStreamWriter(part_file)
+            builder = RDFGraphBuilder(config, report, streaming_writer=nt_writer)
+            with nt_writer:
+                for df, _ in _parse_sheets_in_background([sheet]):
+                    builder.add_dataframe(df, sheet)
+        else:
+            builder = RDFGraphBuilder(
+                config, report, ontology_analyzer=self._ontology_analyzer(ontology_path, config)
+            )
+            for df, _ in _parse_sheets_in_background([sheet]):
+                builder.add_dataframe(df, sheet)
+            builder.get_graph().serialize(destination=str(part_file), format="nt")
+        logger.info("Sheet %s of project %s converted with %s triples", sheet.name, project_id, builder.get_triple_count())
+
+        return {
+            "path": str(part_file),
+            "triple_count": builder.get_triple_count(),
+            "report": report.model_dump(mode="json", exclude={"start_time", "end_time"}),
+        }
+
+    def merge_sheet_parts(
+        self,
+        project_id: str,
+        parts: List[Dict[str, Any]],
+        mapping_file_path: Optional[str] = None,
+        output_format: str = "turtle",
+        validate: bool = True,
+        validate_shapes: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Combine the part files written by convert_sheet into the project output.
+
+        Streamed N-Triples parts are concatenated as-is; any other format is
+        parsed into one graph and serialized once. The part files are removed
+        afterwards, also when a sheet failed (an {"status": "error"} part).
+        """
+        try:
+            failed = [part for part in parts if part.get("status") == "error"]
+            if failed:
+                raise RuntimeError("; ".join(
+                    f"sheet {part['sheet_index']}: {part['error']}" for part in failed
+                ))
+
+            if not mapping_file_path:
+                mapping_file_path = str(self.data_dir / project_id / "mapping_config.yaml")
+            config = load_config(mapping_file_path)
+            report = _merge_reports(ProcessingReport(**part["report"]) for part in parts)
+
+            ext = FORMAT_EXTENSIONS.get(output_format, "ttl")
+            output_file = self.data_dir / project_id / f"output.{ext}"
+
+            graph = None
+            if self._streams_nt(config, output_format):
+                with open(output_file, 'wb') as out:
+                    for part in parts:
+                        with open(part["path"], 'rb') as f:
+                            shutil.copyfileobj(f, out)
+                triple_count = sum(part["triple_count"] for part in parts)
+            else:
+                graph = Graph()
+                # Keep the mapping's prefixes, as RDFGraphBuilder does
+                for prefix, namespace in config.namespaces.items():
+                    graph.bind(prefix, Namespace(namespace))
+                for part in parts:
+                    graph.parse(part["path"], format="nt")
+                serialize_graph(graph, output_format, output_file)
+                triple_count = len(graph)
+            logger.info("RDF output saved to %s with %s triples from %s sheets", output_file, triple_count, len(parts))
+
+            return self._conversion_result(
+                project_id, output_file, output_format, triple_count, report, graph, validate_shapes
+            )
+        except Exception as e:
+            logger.error("Error merging sheet outputs: %s", e, exc_info=True)
+            raise
+        finally:
+            shutil.rmtree(self.data_dir / project_id / SHEET_PARTS_DIR, ignore_errors=True)
+
+    def _conversion_result(
+        self,
+        project_id: str,
+        output_file: Path,
+        output_format: str,
+        triple_count: int,
+        report: ProcessingReport,
+        graph: Optional[Graph],
+        validate_shapes: bool,
+    ) -> Dict[str, Any]:
+        """Validate the output, record it as the project's latest, and build the response."""
+        # SHACL validation (opt-in)
+        shacl_validation = None
+        if validate_shapes:
+            shacl_validation = self._validate_shapes(project_id, graph)
+
+        # Record the latest output so downloads don't have to scan the project dir
+        (output_file.parent / OUTPUT_META_FILE).write_text(json.dumps({
+            "path": str(output_file),
+            "ext": output_file.suffix.lstrip("."),
+            "format": output_format,
+        }))
+
+        # Structural checks and reasoning, collected while building the graph
+        ontology_structural = {
+            "domain_violations": report.domain_violations,
+            "range_violations": report.range_violations,
+            "samples": report.structural_samples,
+            "compliance_rate": 1.0 if triple_count==0 else (1.0 - ((report.domain_violations + report.range_violations) / triple_count))
+        }
+        reasoning_metrics = {
+            "inferred_types": report.inferred_types,
+            "inverse_links_added": report.inverse_links_added,
+            "transitive_links_added": report.transitive_links_added,
+            "symmetric_links_added": report.symmetric_links_added,
+            "cardinality_violations": report.cardinality_violations,
+            "min_cardinality_violations": report.min_cardinality_violations,
+            "max_cardinality_violations": report.max_cardinality_violations,
+            "exact_cardinality_violations": report.exact_cardinality_violations,
+        }
+
+        return {
+            "output_file": str(output_file),
+            "format": output_format,
+            "triple_count": triple_count,
+            "ontology_structural": ontology_structural,
+            "reasoning": reasoning_metrics,
+            "shacl_validation": shacl_validation,
+            "errors": [str(e) for e in report.errors] if report.errors else [],
+            "warnings": report.warnings,
+        }
+
+    def _validate_shapes(self, project_id: str, graph) -> Dict[str, Any]:
+        """
+        Validate the in-memory output graph against the project's uploaded SHACL shapes.
+
+        Runs on the graph that was just serialized, so the output file is never re-read.
+        """
+        shapes = sorted((self.uploads_dir / project_id).glob("shapes.*"))
+        if not shapes:
+            return {"status": "skipped", "reason": "No SHACL shapes uploaded"}
+        if graph is None:
+            return {"status": "skipped", "reason": "N-Triples output is streamed without an in-memory graph"}
+        if validate_rdf is None:
+            return {"status": "skipped", "reason": "pySHACL is not installed"}
+        try:
+            st = shapes[0].stat()
+            shapes_graph = _shapes_graph_cached(str(shapes[0]), st.st_mtime_ns, st.st_size)
+            if len(shapes_graph) == 0:
+                return {"status": "skipped", "reason": "Uploaded SHACL shapes file is empty"}
+            report = validate_rdf(graph, shapes_graph=shapes_graph)
+        except Exception as e:
+            logger.warning("SHACL validation failed: %s", e)
+            return {"status": "error", "error": str(e)}
+        return {
+            "status": "completed",
+            "conforms": report.conforms,
+            "results_count": len(report.results),
+            "results": [r.model_dump() for r in report.results[:SHACL_RESULT_SAMPLES]],
+        }
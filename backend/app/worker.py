@@ -1,7 +1,12 @@
 """Celery worker configuration."""
 
+import json
 import logging
-from celery import Celery
+from celery import Celery, chord
+from kombu.serialization import register as register_serializer
+import msgpack
+import redis
+import zstandard
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -12,14 +17,48 @@ try:
     from .config import settings
     broker_url = settings.CELERY_BROKER_URL
     backend_url = settings.CELERY_RESULT_BACKEND
-    logger.info(f"Loaded settings: broker={broker_url}, backend={backend_url}")
+    redis_url = settings.REDIS_URL
+    upload_dir = settings.UPLOAD_DIR
+    data_dir = settings.DATA_DIR
+    logger.info("Loaded settings: broker=%s, backend=%s", broker_url, backend_url)
 except Exception as e:
-    logger.error(f"Error loading settings: {e}")
+    logger.error("Error loading settings: %s", e)
     # Fallback to environment variables
     import os
     broker_url = os.getenv("CELERY_BROKER_URL", "redis://redis:6379/0")
     backend_url = os.getenv("CELERY_RESULT_BACKEND", "redis://redis:6379/0")
-    logger.info(f"Using fallback: broker={broker_url}, backend={backend_url}")
+    redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
+    upload_dir = os.getenv("UPLOAD_DIR", "/app/uploads")
+    data_dir = os.getenv("DATA_DIR", "/app/data")
+    logger.info("Using fallback: broker=%s, backend=%s", broker_url, backend_url)
+
+# Results larger than this are zstd-compressed before they are stored in the result backend
+RESULT_COMPRESSION_THRESHOLD = 1024
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _pack_result(obj) -> bytes:
+    data = msgpack.packb(obj, use_bin_type=True)
+    if len(data) >= RESULT_COMPRESSION_THRESHOLD:
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _unpack_result(data: bytes):
+    # A msgpack document starting with the zstd magic byte would be a single 1-byte int
+    if data[:4] == _ZSTD_MAGIC:
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return msgpack.unpackb(data, raw=False)
+
+
+# Key-value result backends (Redis) ignore result_compression, so compress in the serializer
+register_serializer(
+    "msgpack-zstd",
+    _pack_result,
+    _unpack_result,
+    content_type="application/x-msgpack-zstd",
+    content_encoding="binary",
+)
 
 # Create Celery app
 celery_app = Celery(
@@ -30,9 +69,10 @@ celery_app = Celery(
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack is faster and more compact than JSON; JSON is still accepted from older clients
+    task_serializer="msgpack",
+    accept_content=["msgpack", "msgpack-zstd", "json"],
+    result_serializer="msgpack-zstd",
     timezone="UTC",
     enable_utc=True,
     worker_prefetch_multiplier=1,
@@ -41,6 +81,34 @@ celery_app.conf.update(
 
 logger.info("Celery app configured successfully")
 
+_progress_client = None
+_service = None
+
+
+def get_service():
+    """Process-wide RDFMapService for task execution, created on first use."""
+    global _service
+    if _service is None:
+        from .services.rdfmap_service import RDFMapService
+        _service = RDFMapService(uploads_dir=upload_dir, data_dir=data_dir)
+    return _service
+
+
+def progress_channel(project_id: str) -> str:
+    """Redis pub/sub channel carrying progress events for a project."""
+    return f"rdfmap:progress:{project_id}"
+
+
+def publish_progress(project_id: str, **event) -> None:
+    """Publish a progress event for WebSocket subscribers; failures are logged and ignored."""
+    global _progress_client
+    try:
+        if _progress_client is None:
+            _progress_client = redis.Redis.from_url(redis_url)
+        _progress_client.publish(progress_channel(project_id), json.dumps({"project_id": project_id, **event}))
+    except Exception as e:
+        logger.warning("Failed to publish progress for project %s: %s", project_id, e)
+
 # Auto-discover tasks (optional)
 # celery_app.autodiscover_tasks(['app.tasks'])
 
@@ -53,7 +121,7 @@ def test_task():
 
 
 @celery_app.task
-def convert_to_rdf_task(project_id: str, mapping_file_path: str | None = None, output_format: str = "turtle", validate: bool = True):
+def convert_to_rdf_task(project_id: str, mapping_file_path: str | None = None, output_format: str = "turtle", validate: bool = True, validate_shapes: bool = False):
     """
     Background task for RDF conversion using RDFMapService.
 
@@ -62,23 +130,98 @@ def convert_to_rdf_task(project_id: str, mapping_file_path: str | None = None, o
         mapping_file_path: Path to the mapping file (optional)
         output_format: Desired output format (default: "turtle")
         validate: Whether to validate the mapping (default: True)
+        validate_shapes: Whether to run SHACL validation against uploaded shapes (default: False)
 
     Returns:
         dict: Result with status and additional information
     """
-    logger.info(f"Starting RDF conversion for project {project_id}")
+    logger.info("Starting RDF conversion for project %s", project_id)
+    publish_progress(project_id, stage="started")
 
     try:
-        from .services.rdfmap_service import RDFMapService
-        service = RDFMapService()
-        result = service.convert_to_rdf(
+        result = get_service().convert_to_rdf(
+            project_id=project_id,
+            mapping_file_path=mapping_file_path,
+            output_format=output_format,
+            validate=validate,
+            validate_shapes=validate_shapes,
+        )
+        logger.info("RDF conversion completed for project %s", project_id)
+        publish_progress(project_id, stage="completed", triple_count=result.get("triple_count"))
+        return {"status": "success", **result}
+    except Exception as e:
+        logger.error("convert_to_rdf_task failed: %s", e)
+        publish_progress(project_id, stage="failed", error=str(e))
+        return {"status": "error", "error": str(e)}
+
+
+@celery_app.task
+def convert_sheet_task(project_id: str, sheet_index: int, mapping_file_path: str | None = None, output_format: str = "turtle", ontology_path: str | None = None):
+    """
+    Convert one sheet of a project's mapping to an N-Triples part file.
+
+    Runs as a chord header task; see merge_sheets_task. Errors are returned
+    rather than raised so the chord callback still runs and reports them.
+
+    Returns:
+        dict: Part file path, triple count and processing report for the sheet,
+        or {"status": "error", ...} if the sheet failed
+    """
+    try:
+        part = get_service().convert_sheet(
+            project_id=project_id,
+            sheet_index=sheet_index,
+            mapping_file_path=mapping_file_path,
+            output_format=output_format,
+            ontology_path=ontology_path,
+        )
+    except Exception as e:
+        logger.error("convert_sheet_task failed for sheet %s: %s", sheet_index, e)
+        publish_progress(project_id, stage="sheet_failed", sheet_index=sheet_index, error=str(e))
+        return {"status": "error", "sheet_index": sheet_index, "error": str(e)}
+    publish_progress(project_id, stage="sheet_completed", sheet_index=sheet_index, triple_count=part["triple_count"])
+    return part
+
+
+@celery_app.task
+def merge_sheets_task(parts: list, project_id: str, mapping_file_path: str | None = None, output_format: str = "turtle", validate: bool = True, validate_shapes: bool = False):
+    """
+    Chord callback combining per-sheet parts into the project's RDF output.
+
+    Returns:
+        dict: Same shape as convert_to_rdf_task's result
+    """
+    try:
+        result = get_service().merge_sheet_parts(
             project_id=project_id,
+            parts=parts,
             mapping_file_path=mapping_file_path,
             output_format=output_format,
             validate=validate,
+            validate_shapes=validate_shapes,
         )
-        logger.info(f"RDF conversion completed for project {project_id}")
+        logger.info("RDF conversion completed for project %s (%s sheets)", project_id, len(parts))
+        publish_progress(project_id, stage="completed", triple_count=result.get("triple_count"))
         return {"status": "success", **result}
     except Exception as e:
-        logger.error(f"convert_to_rdf_task failed: {e}")
+        logger.error("merge_sheets_task failed: %s", e)
+        publish_progress(project_id, stage="failed", error=str(e))
         return {"status": "error", "error": str(e)}
+
+
+def convert_sheets_in_parallel(project_id: str, sheet_count: int, mapping_file_path: str | None = None, output_format: str = "turtle", validate: bool = True, validate_shapes: bool = False, ontology_path: str | None = None):
+    """
+    Queue a conversion as one task per sheet plus a merge callback (a Celery chord).
+
+    ontology_path should come from RDFMapService.resolve_ontology_import, called
+    before this so the sheet tasks never write the mapping file.
+
+    Returns:
+        AsyncResult of the merge task, whose result matches convert_to_rdf_task's
+    """
+    publish_progress(project_id, stage="started", sheets=sheet_count)
+    header = [
+        convert_sheet_task.s(project_id, i, mapping_file_path, output_format, ontology_path)
+        for i in range(sheet_count)
+    ]
+    return chord(header)(merge_sheets_task.s(project_id, mapping_file_path, output_format, validate, validate_shapes))
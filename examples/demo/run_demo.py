@@ -16,6 +16,9 @@ Workflow:
 Requirements:
 - Run from project root directory
 - Package must be installed: pip install -e .
+
+Steps run the rdfmap CLI in-process; pass --subprocess to spawn the
+rdfmap executable for each step instead.
 """
 
 import sys
@@ -25,6 +28,11 @@ from datetime import datetime, timedelta
 import subprocess
 import shutil
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
 # Demo directories
 DEMO_DIR = Path("examples/demo")
 ONTOLOGY_DIR = DEMO_DIR / "ontology"
@@ -38,6 +46,9 @@ ENRICHED_ONTOLOGY_1 = ONTOLOGY_DIR / "hr_ontology_enriched_1.ttl"
 ENRICHED_ONTOLOGY_2 = ONTOLOGY_DIR / "hr_ontology_enriched_2.ttl"
 EMPLOYEE_DATA = DATA_DIR / "employees.csv"
 
+# Pass --subprocess to run each step through the installed rdfmap executable instead
+USE_SUBPROCESS = "--subprocess" in sys.argv[1:]
+
 
 def print_section(title: str):
     """Print a formatted section header."""
@@ -46,6 +57,24 @@ def print_section(title: str):
     print("=" * 80 + "\n")
 
 
+def run_cli(cmd: list[str]) -> int:
+    """Run an ``rdfmap`` command line in this process and return its exit code.
+
+    Avoids starting a new interpreter (and re-importing rdflib, Polars and
+    pySHACL) for every demo step.
+
+    Args:
+        cmd: Command and arguments, starting with "rdfmap"
+    """
+    from rdfmap.cli.main import app
+
+    try:
+        app(args=cmd[1:], prog_name=cmd[0])
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
 def run_command(cmd: list[str], description: str, allow_nonzero_exit=False):
     """Run a command and print output.
     
@@ -57,6 +86,11 @@ def run_command(cmd: list[str], description: str, allow_nonzero_exit=False):
     print(f"Running: {description}")
     print(f"Command: {' '.join(cmd)}\n")
     
+    if not USE_SUBPROCESS:
+        # Output goes straight to the console
+        returncode = run_cli(cmd)
+        return returncode == 0 or allow_nonzero_exit
+
     result = subprocess.run(cmd, capture_output=True, text=True)
     
     # Print stdout if available
@@ -80,6 +114,25 @@ def run_command(cmd: list[str], description: str, allow_nonzero_exit=False):
     return True
 
 
+def restamp_report(source: Path, dest: Path, generated_at: datetime):
+    """Move an alignment report to dest with its generated_at timestamp replaced.
+
+    Args:
+        source: Auto-generated report (removed afterwards)
+        dest: Destination path in the reports directory
+        generated_at: Timestamp to record in the report
+    """
+    if orjson:
+        report_data = orjson.loads(source.read_bytes())
+        report_data['generated_at'] = generated_at.isoformat()
+        dest.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+    else:
+        report_data = json.loads(source.read_text())
+        report_data['generated_at'] = generated_at.isoformat()
+        dest.write_text(json.dumps(report_data, indent=2))
+    source.unlink()
+
+
 def main():
     """Run the complete demo cycle."""
     
@@ -136,12 +189,7 @@ def main():
     
     # Move and adjust timestamp in report
     if auto_report_path.exists():
-        with open(auto_report_path) as f:
-            report_data = json.load(f)
-        report_data['generated_at'] = report_1_time.isoformat()
-        with open(report_1_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        auto_report_path.unlink()  # Remove the auto-generated one
+        restamp_report(auto_report_path, report_1_path, report_1_time)
     
     input("\n⏸️  Press Enter to continue to Step 3...\n")
     
@@ -206,12 +254,7 @@ def main():
     
     # Move and adjust timestamp
     if auto_report_path.exists():
-        with open(auto_report_path) as f:
-            report_data = json.load(f)
-        report_data['generated_at'] = report_2_time.isoformat()
-        with open(report_2_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
-        auto_report_path.unlink()
+        restamp_report(auto_report_path, report_2_path, report_2_time)
     
     input("\n⏸️  Press Enter to continue to Step 6...\n")
 
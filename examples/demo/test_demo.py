@@ -5,6 +5,12 @@ import subprocess
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from run_demo import run_cli  # noqa: E402
+
+# Pass --subprocess to spawn the rdfmap executable for each command instead
+USE_SUBPROCESS = "--subprocess" in sys.argv[1:]
+
 DEMO_DIR = Path("examples/demo")
 OUTPUT_DIR = DEMO_DIR / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -14,15 +20,20 @@ def run(cmd, desc):
     print(f"Testing: {desc}")
     print(f"Command: {' '.join(cmd)}")
     print('='*70)
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.stdout:
-        print(result.stdout[:500])  # First 500 chars
-    if result.returncode not in [0, 1]:  # 0=success, 1=validation failed (expected)
-        print(f"❌ FAILED with code {result.returncode}")
-        if result.stderr:
+    if USE_SUBPROCESS:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.stdout:
+            print(result.stdout[:500])  # First 500 chars
+        returncode = result.returncode
+    else:
+        result = None
+        returncode = run_cli(cmd)
+    if returncode not in [0, 1]:  # 0=success, 1=validation failed (expected)
+        print(f"❌ FAILED with code {returncode}")
+        if result is not None and result.stderr:
             print(result.stderr[:500])
         return False
-    print(f"✅ OK (exit code {result.returncode})")
+    print(f"✅ OK (exit code {returncode})")
     return True
 
 print("🧪 Testing Demo Commands\n")
@@ -34,6 +34,7 @@ export const api = {
     const qs = new URLSearchParams()
     if (params?.use_semantic !== undefined) qs.set('use_semantic', String(params.use_semantic))
     if (params?.min_confidence !== undefined) qs.set('min_confidence', String(params.min_confidence))
+    qs.set('include', 'full')
     return handle<any>(fetch(`/api/mappings/${projectId}/generate?${qs.toString()}`, { method: 'POST' }))
   },
   convertSync: (projectId: string, params?: { output_format?: string; validate?: boolean }) => {
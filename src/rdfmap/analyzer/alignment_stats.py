@@ -416,5 +416,5 @@ class AlignmentStatsAnalyzer:
             stats: Analyzed statistics to export
             output_path: Path for output JSON file
         """
-        with open(output_path, 'w') as f:
-            json.dump(stats.model_dump(mode='json'), f, indent=2, default=str)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(stats.model_dump_json(indent=2))
@@ -13,6 +13,7 @@ from rich.prompt import Confirm, Prompt
 from rich.panel import Panel
 from rich import box
 
+from ..config.loader import SafeDumper, SafeLoader
 from ..generator.mapping_generator import MappingGenerator, GeneratorConfig
 from ..models.alignment import AlignmentReport, WeakMatch
 
@@ -50,7 +51,7 @@ class InteractiveReviewer:
         """
         # Load the mapping
         with open(mapping_file, 'r') as f:
-            mapping = yaml.safe_load(f)
+            mapping = yaml.load(f, Loader=SafeLoader)
 
         if not mapping or 'sheets' not in mapping:
             self.console.print("[red]Error: Invalid mapping file[/red]")
@@ -72,7 +73,7 @@ class InteractiveReviewer:
 
             if Confirm.ask(f"\n[green]Save changes to {output_path}?[/green]", default=True):
                 with open(output_path, 'w') as f:
-                    yaml.dump(mapping, f, default_flow_style=False, sort_keys=False)
+                    yaml.dump(mapping, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
                 self.console.print(f"[green]✓ Saved to {output_path}[/green]")
             else:
                 self.console.print("[yellow]Changes not saved[/yellow]")
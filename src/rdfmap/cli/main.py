@@ -834,7 +834,7 @@ def generate(
         if format.lower() == "json":
             generator.save_json(str(output))
         else:
-            generator.save_yaml(str(output))
+            generator.save_yaml(str(output), return_text=False)
         
         console.print(f"\n[green]✓ Mapping configuration written to {output}[/green]")
         
@@ -1226,8 +1226,8 @@ def stats(
         if output or format.lower() in ("json", "both"):
             output_path = output or reports_dir / "alignment_statistics.json"
             
-            with open(output_path, 'w') as f:
-                json.dump(stats.model_dump(mode='json'), f, indent=2, default=str)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(stats.model_dump_json(indent=2))
             
             console.print(f"\n[green]✓ Statistics written to {output_path}[/green]")
         
@@ -1401,8 +1401,8 @@ def validate_ontology(
         
         # Export JSON
         if output:
-            with open(output, 'w') as f:
-                json.dump(report.model_dump(mode='json'), f, indent=2)
+            with open(output, 'w', encoding='utf-8') as f:
+                f.write(report.model_dump_json(indent=2))
             console.print(f"[green]✓ Coverage report written to {output}[/green]")
         
         # Pass/Fail
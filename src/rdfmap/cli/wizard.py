@@ -14,6 +14,8 @@ from rich.table import Table
 from rich import box
 import yaml
 
+from ..config.loader import SafeDumper
+
 console = Console()
 
 
@@ -639,7 +641,7 @@ class ConfigurationWizard:
             }
 
             # Use custom formatter
-            save_formatted_mapping(mapping, path, wizard_config)
+            save_formatted_mapping(mapping, path, wizard_config, return_text=False)
         except ImportError:
             # Fallback to simple YAML dump if formatter not available
             with open(path, 'w') as f:
@@ -656,7 +658,7 @@ class ConfigurationWizard:
 
         # Save as YAML
         with open(path, 'w') as f:
-            yaml.dump(mapping_config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(mapping_config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
     def _extract_base_iri(self) -> str:
         """Extract base IRI from target class or use default.
@@ -5,6 +5,12 @@ from typing import Union
 
 import yaml
 
+# SafeDumper is re-exported for modules that write mapping YAML
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader, SafeDumper  # noqa: F401
+
 from ..models.mapping import MappingConfig
 
 
@@ -32,20 +38,42 @@ def load_mapping_config(config_path: Union[str, Path]) -> MappingConfig:
     # Load YAML/JSON
     with config_path.open("r", encoding="utf-8") as f:
         if config_path.suffix in [".yaml", ".yml"]:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=SafeLoader)
         elif config_path.suffix == ".json":
             import json
             config_data = json.load(f)
         else:
             raise ValueError(f"Unsupported config file format: {config_path.suffix}")
     
+    return mapping_config_from_data(config_data, config_path.parent)
+
+
+def mapping_config_from_data(config_data: dict, config_dir: Union[str, Path]) -> MappingConfig:
+    """Validate already-parsed mapping configuration data.
+
+    Relative sheet sources and shapes paths are resolved against config_dir,
+    as if the data had been loaded from a file in that directory.
+
+    Args:
+        config_data: Parsed YAML/JSON configuration
+        config_dir: Directory the configuration belongs to
+
+    Returns:
+        Validated mapping configuration
+
+    Raises:
+        FileNotFoundError: If a data source file doesn't exist
+        ValueError: If config is invalid
+    """
+    config_dir = Path(config_dir)
+
     # Detect format and convert YARRRML if needed
     format_type = _detect_format(config_data)
 
     if format_type == 'yarrrml':
         # Convert YARRRML to internal format
         from .yarrrml_parser import yarrrml_to_internal
-        config_data = yarrrml_to_internal(config_data, config_path.parent)
+        config_data = yarrrml_to_internal(config_data, config_dir)
 
     # Validate with Pydantic
     try:
@@ -54,15 +82,17 @@ def load_mapping_config(config_path: Union[str, Path]) -> MappingConfig:
         raise ValueError(f"Invalid configuration: {e}")
     
     # Resolve relative paths in sheet sources
-    config_dir = config_path.parent
+    existing = set()  # sheets of one workbook share a source; stat it once
     for sheet in config.sheets:
         source_path = Path(sheet.source)
         if not source_path.is_absolute():
             sheet.source = str(config_dir / source_path)
         
         # Check if source file exists
-        if not Path(sheet.source).exists():
-            raise FileNotFoundError(f"Data source file not found: {sheet.source}")
+        if sheet.source not in existing:
+            if not Path(sheet.source).exists():
+                raise FileNotFoundError(f"Data source file not found: {sheet.source}")
+            existing.add(sheet.source)
     
     # Resolve validation shapes path
     if config.validation and config.validation.shacl:
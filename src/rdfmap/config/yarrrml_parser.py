@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 import yaml
 
+from .loader import SafeLoader
+
 
 def parse_yarrrml(yarrrml_path: Path) -> Dict[str, Any]:
     """
@@ -24,7 +26,7 @@ def parse_yarrrml(yarrrml_path: Path) -> Dict[str, Any]:
         Dictionary in internal mapping format (compatible with MappingConfig)
     """
     with open(yarrrml_path, 'r', encoding='utf-8') as f:
-        yarrrml = yaml.safe_load(f)
+        yarrrml = yaml.load(f, Loader=SafeLoader)
 
     return yarrrml_to_internal(yarrrml, yarrrml_path.parent)
 
@@ -248,7 +250,7 @@ def detect_format(config_path: Path) -> str:
         'yarrrml' or 'internal'
     """
     with open(config_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
 
     # YARRRML has 'prefixes' and 'mappings'
     if 'prefixes' in data and 'mappings' in data:
@@ -15,6 +15,10 @@ from ..transforms.functions import apply_transform
 from ..validator.datatypes import validate_datatype
 
 
+# Buffered triples are flushed to the graph in batches of at most this size
+TRIPLE_BATCH_SIZE = 50_000
+
+
 class RDFGraphBuilder:
     """Build RDF graphs from Polars DataFrames with high performance."""
 
@@ -40,6 +44,12 @@ class RDFGraphBuilder:
         else:
             self.graph = None
 
+        # CURIE/IRI reference -> URIRef, filled by _resolve_property
+        self._resolved: Dict[str, URIRef] = {}
+
+        # Triples buffered by add_dataframe when nothing reads the graph mid-batch
+        self._pending: Optional[set] = None
+
         # Track generated IRIs to detect duplicates (only when aggregating)
         self.iri_registry: Dict[str, List[int]] = {}  # iri -> [row_numbers]
 
@@ -47,7 +57,7 @@ class RDFGraphBuilder:
         self._prop_index = {}
         if ontology_analyzer:
             for prop in ontology_analyzer.properties.values():
-                self._prop_index[str(prop.uri)] = prop
+                self._prop_index[prop.uri_str] = prop
 
         self.enable_reasoning = getattr(config.defaults, 'enable_reasoning', True)
         self.transitive_depth = getattr(config.defaults, 'transitive_depth', 2)
@@ -93,6 +103,11 @@ class RDFGraphBuilder:
         if self.streaming_writer:
             # Stream directly to NT file
             self.streaming_writer.write_triple(subject, predicate, obj)
+        elif self._pending is not None:
+            # Set membership drops the per-row repeats (e.g. linked object types) before the store sees them
+            self._pending.add((subject, predicate, obj))
+            if len(self._pending) >= TRIPLE_BATCH_SIZE:
+                self._flush_pending()
         elif self.graph is not None:
             # Add to in-memory graph
             self.graph.add((subject, predicate, obj))
@@ -101,6 +116,13 @@ class RDFGraphBuilder:
         else:
             raise RuntimeError("Builder not properly configured")
 
+    def _flush_pending(self) -> None:
+        """Add buffered triples to the graph in one addN call."""
+        if self._pending:
+            graph = self.graph
+            graph.addN((s, p, o, graph) for s, p, o in self._pending)
+            self._pending.clear()
+
     def _resolve_property(self, property_ref: str) -> URIRef:
         """Resolve property reference (CURIE or IRI) to URIRef.
 
@@ -110,13 +132,19 @@ class RDFGraphBuilder:
         Returns:
             URIRef for the property
         """
+        # Mapping references repeat on every row; resolve each one once
+        uri = self._resolved.get(property_ref)
+        if uri is not None:
+            return uri
         if ":" in property_ref and not property_ref.startswith("http"):
             # Looks like a CURIE
             iri = curie_to_iri(property_ref, self.config.namespaces)
-            return URIRef(iri)
+            uri = URIRef(iri)
         else:
             # Full IRI
-            return URIRef(property_ref)
+            uri = URIRef(property_ref)
+        self._resolved[property_ref] = uri
+        return uri
 
     def _resolve_class(self, class_ref: str) -> URIRef:
         """Resolve class reference (CURIE or IRI) to URIRef.
@@ -306,18 +334,28 @@ class RDFGraphBuilder:
         # Future optimization: implement template rendering directly in Polars
         rows_data = df.to_dicts()
 
-        # Process each row (vectorized processing opportunities exist here)
-        for idx, row_data in enumerate(rows_data):
-            row_num = offset + idx + 1  # 1-indexed for users
-
-            # Add main resource
-            main_resource = self._add_row_resource(sheet, row_data, row_num)
+        # Structural checks and reasoning query the graph after every triple; without
+        # them, triples can be buffered and added in batches
+        if self.graph is not None and not self.ontology_analyzer:
+            self._pending = set()
 
-            if main_resource:
-                # Add linked objects
-                self._add_linked_objects(main_resource, sheet, row_data, row_num)
-
-                self.report.total_rows += 1
+        try:
+            # Process each row (vectorized processing opportunities exist here)
+            for idx, row_data in enumerate(rows_data):
+                row_num = offset + idx + 1  # 1-indexed for users
+
+                # Add main resource
+                main_resource = self._add_row_resource(sheet, row_data, row_num)
+
+                if main_resource:
+                    # Add linked objects
+                    self._add_linked_objects(main_resource, sheet, row_data, row_num)
+
+                    self.report.total_rows += 1
+        finally:
+            if self._pending is not None:
+                self._flush_pending()
+                self._pending = None
 
     def _add_row_resource(
         self,
@@ -29,12 +29,24 @@ class ConfidenceCalibrator:
         """Initialize the calibrator.
         
         Args:
-            history: MappingHistory instance for stats (creates default if None)
+            history: MappingHistory instance for stats (creates default on first use if None)
             min_samples: Minimum samples needed before calibrating
         """
-        self.history = history or MappingHistory()
+        self._history = history
         self.min_samples = min_samples
         self._calibration_cache: Dict[str, CalibrationStats] = {}
+
+    @property
+    def history(self) -> MappingHistory:
+        # The default database is opened when stats are first needed, not when the
+        # pipeline is built
+        if self._history is None:
+            self._history = MappingHistory()
+        return self._history
+
+    @history.setter
+    def history(self, value: MappingHistory) -> None:
+        self._history = value
     
     def calibrate_result(self, result: MatchResult) -> MatchResult:
         """Calibrate a match result's confidence score.
@@ -255,6 +267,6 @@ class ConfidenceCalibrator:
     
     def close(self):
         """Close the history database connection."""
-        if self.history:
-            self.history.close()
+        if self._history:
+            self._history.close()
 
@@ -3,14 +3,21 @@
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import os
+import re
 import json
+import hashlib
+from copy import deepcopy
 from difflib import SequenceMatcher
+from functools import cache
+import yaml
 from pydantic import BaseModel, Field
+from rdflib import URIRef
 
 from .ontology_analyzer import OntologyAnalyzer, OntologyClass, OntologyProperty
 from .data_analyzer import DataSourceAnalyzer, DataFieldAnalysis
 from .semantic_matcher import SemanticMatcher
 from .matchers import create_default_pipeline, MatcherPipeline, MatchContext
+from .matchers.base import _norm, _norm_compact, _norm_local
 from ..models.alignment import (
     AlignmentReport,
     AlignmentStatistics,
@@ -21,6 +28,37 @@ from ..models.alignment import (
     get_confidence_level,
 )
 
+try:
+    import orjson
+except ImportError:  # optional: pip install semantic-rdf-mapper[fastjson]
+    orjson = None
+
+# libyaml's C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@cache
+def _mapping_schema() -> Dict[str, Any]:
+    """JSON Schema of MappingConfig, built once per process."""
+    from ..models.mapping import MappingConfig
+
+    return MappingConfig.model_json_schema()
+
+
+def _write_json(data: Any, output_file: str):
+    """Write data as 2-space indented JSON, through orjson when it is installed."""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            payload = None  # e.g. non-string keys; the stdlib handles those
+        if payload is not None:
+            with open(output_file, 'wb') as f:
+                f.write(payload)
+            return
+    with open(output_file, 'w') as f:
+        json.dump(data, f, indent=2)
+
 
 class GeneratorConfig(BaseModel):
     """Configuration for the mapping generator."""
@@ -37,6 +75,10 @@ class GeneratorConfig(BaseModel):
     min_confidence: float = Field(
         0.5, description="Minimum confidence score for automatic suggestions (0-1)"
     )
+    cache_dir: Optional[str] = Field(
+        None,
+        description="Directory for cached mappings keyed by input file hashes (disabled if unset)"
+    )
 
 
 class MappingGenerator:
@@ -49,6 +91,7 @@ class MappingGenerator:
         config: GeneratorConfig,
         matcher_pipeline: Optional[MatcherPipeline] = None,
         use_semantic_matching: bool = True,
+        ontology_analyzer: Optional[OntologyAnalyzer] = None,
     ):
         """
         Initialize the mapping generator.
@@ -59,12 +102,22 @@ class MappingGenerator:
             config: Generator configuration
             matcher_pipeline: Optional custom matcher pipeline (creates default if None)
             use_semantic_matching: Whether to use semantic embeddings (default: True)
+            ontology_analyzer: Already loaded analyzer for ontology_file (and config.imports)
+                to reuse, along with the matcher label indexes built for it
         """
         self.config = config
         self.ontology_file = ontology_file
         self.data_file = data_file
-        self.ontology = OntologyAnalyzer(ontology_file, imports=config.imports)
+        self.ontology = ontology_analyzer or OntologyAnalyzer(ontology_file, imports=config.imports)
         self.data_source = DataSourceAnalyzer(data_file)
+        # Column analyses in column order, read once; the data source is fixed after init
+        self._analyses: Dict[str, DataFieldAnalysis] = {
+            col: self.data_source.get_analysis(col) for col in self.data_source.get_column_names()
+        }
+        self._lower_names: Dict[str, str] = {col: col.lower() for col in self._analyses}
+        self._columns_by_lower: Dict[str, List[str]] = {}
+        for col, col_lower in self._lower_names.items():
+            self._columns_by_lower.setdefault(col_lower, []).append(col)
         # Initialize matcher pipeline
         if matcher_pipeline:
             self.matcher_pipeline = matcher_pipeline
@@ -86,6 +139,29 @@ class MappingGenerator:
         self._mapped_columns: Dict[str, Tuple[OntologyProperty, MatchType, float]] = {}
         self._unmapped_columns: List[str] = []
         self._match_extras: Dict[str, Dict[str, Any]] = {}  # evidence/alternates/adjustments per column
+        # On-disk mapping cache file for the last generate() and the entry it hit
+        self._cache_path: Optional[Path] = None
+        self._cache_entry: Optional[Dict[str, Any]] = None
+        # Per-run caches for _match_column_to_property (ontology and data are fixed after init)
+        self._identifier_props: Optional[List[OntologyProperty]] = None
+        # Datatype properties per class, shared by every matching call for that class
+        self._properties_by_class: Dict[URIRef, List[OntologyProperty]] = {}
+        # id(properties) -> (properties, properties plus identifier-like ones)
+        self._id_candidates: Dict[int, Tuple[List[OntologyProperty], List[OntologyProperty]]] = {}
+        self._column_analyses: List[DataFieldAnalysis] = list(self._analyses.values())
+        # Fallback target class for _auto_detect_class
+        self._first_class: Optional[OntologyClass] = next(iter(self.ontology.classes.values()), None)
+        # Target class of the last uncached generate(), reused for the alignment report
+        self._resolved_class: Optional[OntologyClass] = None
+        # Resolved data file and config directories (resolve() stats and reads links)
+        self._resolved_source: Optional[Path] = None
+        self._resolved_dirs: Dict[Path, Path] = {}
+        # _find_columns_for_object results per range class (asked for by column and object mapping)
+        self._object_columns: Dict[URIRef, List[Tuple[str, OntologyProperty]]] = {}
+        # Namespace prefix matcher (built on first use) and formatted CURIEs
+        self._ns_pattern: Optional[re.Pattern] = None
+        self._ns_prefixes: Dict[str, str] = {}
+        self._curies: Dict[str, str] = {}
 
     def generate(
         self,
@@ -105,6 +181,15 @@ class MappingGenerator:
             Dictionary representation of the mapping configuration
         """
         self.output_path = Path(output_path) if output_path else None
+        self._cache_path = self._cache_file(target_class)
+        self._cache_entry = self._read_cache(self._cache_path)
+        if self._cache_entry is not None:
+            self.mapping = self._cache_entry['mapping']
+            return self.mapping
+        return self._generate_uncached(target_class)
+
+    def _generate_uncached(self, target_class: Optional[str]) -> Dict[str, Any]:
+        """Run class resolution and matching for generate(), then store the result."""
         # Find target class
         if target_class:
             cls = self._resolve_class(target_class)
@@ -114,7 +199,8 @@ class MappingGenerator:
             cls = self._auto_detect_class()
             if not cls:
                 raise ValueError("Could not auto-detect target class. Please specify target_class.")
-        
+        self._resolved_class = cls
+
         # Build mapping
         self.mapping = {
             "namespaces": self._generate_namespaces(),
@@ -128,7 +214,59 @@ class MappingGenerator:
             # Ensure imports is captured at top-level mapping (list of strings)
             self.mapping["imports"] = list(self.config.imports)
 
+        self._write_cache({"mapping": self.mapping})
         return self.mapping
+
+    def _cache_file(self, target_class: Optional[str]) -> Optional[Path]:
+        """Cache entry for the current inputs, or None when caching is disabled.
+
+        The key covers the ontology, imports and data file contents, the
+        generator config, the target class, where the config will be saved
+        (the source path is relative to it), the matchers and the package version.
+        """
+        if not self.config.cache_dir:
+            return None
+        from .. import __version__
+
+        digest = hashlib.sha256()
+        for source in [self.ontology_file, *(self.config.imports or []), self.data_file]:
+            path = Path(source)
+            if path.is_file():
+                with open(path, 'rb') as f:
+                    digest.update(hashlib.file_digest(f, 'sha256').digest())
+            else:
+                digest.update(str(source).encode('utf-8'))  # remote import: key on the URI
+        digest.update(self.config.model_dump_json(exclude={'cache_dir'}).encode('utf-8'))
+        digest.update(json.dumps([
+            target_class,
+            self._source_path(self.output_path),
+            [m.name() for m in self.matcher_pipeline.matchers],
+            __version__,
+        ]).encode('utf-8'))
+        return Path(self.config.cache_dir) / f"{digest.hexdigest()}.json"
+
+    @staticmethod
+    def _read_cache(cache_file: Optional[Path]) -> Optional[Dict[str, Any]]:
+        if cache_file is None or not cache_file.is_file():
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None  # unreadable entry: regenerate and overwrite
+        return entry if isinstance(entry, dict) and 'mapping' in entry else None
+
+    def _write_cache(self, entry: Dict[str, Any]):
+        """Store a cache entry; failures only cost the next run a regeneration."""
+        if self._cache_path is None:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_path.with_suffix('.tmp')
+            _write_json(entry, str(tmp))
+            os.replace(tmp, self._cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
     
     def generate_multisheet(
         self,
@@ -283,11 +421,7 @@ class MappingGenerator:
             return cls
         
         # Try to find by URI match
-        for cls in self.ontology.classes.values():
-            if str(cls.uri) == identifier or str(cls.uri).endswith(f"#{identifier}") or str(cls.uri).endswith(f"/{identifier}"):
-                return cls
-        
-        return None
+        return self.ontology.get_class_by_uri(identifier)
     
     def _auto_detect_class(self) -> Optional[OntologyClass]:
         """Attempt to auto-detect the target class based on file name."""
@@ -302,10 +436,7 @@ class MappingGenerator:
             return suggestions[0]
         
         # Fall back to first class in ontology
-        if self.ontology.classes:
-            return next(iter(self.ontology.classes.values()))
-        
-        return None
+        return self._first_class
     
     def _generate_namespaces(self) -> Dict[str, str]:
         """Generate namespace declarations - only essential ones."""
@@ -350,18 +481,8 @@ class MappingGenerator:
         sheet_name = Path(self.data_source.file_path).stem
 
         # Calculate relative path for source if output_path is provided
-        source_path = Path(self.data_source.file_path)
-        if self.output_path:
-            # Get relative path from config location to data file
-            config_dir = self.output_path.parent
-            try:
-                # Use os.path.relpath to handle paths not in subpath
-                rel_path = os.path.relpath(source_path.resolve(), config_dir.resolve())
-                source_path = Path(rel_path)
-            except (ValueError, OSError):
-                # If not possible (e.g., different drives on Windows), use absolute path
-                pass
-        
+        source_path = self._source_path(self.output_path)
+
         # Generate IRI template
         iri_template = self._generate_iri_template(target_class)
 
@@ -373,7 +494,7 @@ class MappingGenerator:
         
         sheet = {
             "name": sheet_name,
-            "source": str(source_path),
+            "source": source_path,
             "row_resource": {
                 "class": self._format_uri(target_class.uri),
                 "iri_template": iri_template,
@@ -385,6 +506,46 @@ class MappingGenerator:
 
         return sheet
 
+    def _source_path(self, output_path: Optional[Path]) -> str:
+        """Data file path as written in a config saved at output_path."""
+        source_path = Path(self.data_source.file_path)
+        if output_path:
+            # Get relative path from config location to data file
+            try:
+                if self._resolved_source is None:
+                    self._resolved_source = source_path.resolve()
+                # Use os.path.relpath to handle paths not in subpath
+                rel_path = os.path.relpath(self._resolved_source, self._resolve_dir(output_path.parent))
+                source_path = Path(rel_path)
+            except (ValueError, OSError):
+                # If not possible (e.g., different drives on Windows), use absolute path
+                pass
+        return str(source_path)
+
+    def _resolve_dir(self, directory: Path) -> Path:
+        resolved = self._resolved_dirs.get(directory)
+        if resolved is None:
+            resolved = self._resolved_dirs[directory] = directory.resolve()
+        return resolved
+
+    def _relocate_sources(self, output_file: str):
+        """Re-point relative sheet sources when saving somewhere other than output_path.
+
+        Only the source path depends on where the config is written, so it is
+        patched in place instead of regenerating the mapping. Absolute sources
+        (generated without an output_path) are valid anywhere and left alone.
+        """
+        old_path = getattr(self, 'output_path', None)
+        new_path = Path(output_file)
+        if not old_path or self._resolve_dir(old_path.parent) == self._resolve_dir(new_path.parent):
+            return
+        old_source = self._source_path(old_path)
+        new_source = self._source_path(new_path)
+        for sheet in self.mapping.get('sheets', []):
+            if sheet.get('source') == old_source:
+                sheet['source'] = new_source
+        self.output_path = new_path
+
     def _generate_iri_template(self, target_class: OntologyClass, for_object: bool = False,
                                object_class: Optional[OntologyClass] = None) -> str:
         """Generate IRI template for the target class.
@@ -402,15 +563,14 @@ class MappingGenerator:
 
         if not id_cols:
             # Fallback to first column
-            id_cols = [self.data_source.get_column_names()[0]]
+            id_cols = [next(iter(self._analyses))]
 
         # Use class name or default prefix
         if for_object and object_class:
             class_name = object_class.label or "object"
             # For objects, try to find ID column that matches the object class
             class_name_lower = class_name.lower()
-            object_id_cols = [col for col in self.data_source.get_column_names()
-                            if col.lower() == class_name_lower + 'id']
+            object_id_cols = self._columns_by_lower.get(class_name_lower + 'id', [])
             if object_id_cols:
                 id_cols = [object_id_cols[0]]
         else:
@@ -428,7 +588,7 @@ class MappingGenerator:
         used_properties = set()
 
         # Get datatype properties for this class
-        properties = self.ontology.get_datatype_properties(target_class.uri)
+        properties = self._class_properties(target_class.uri)
         
         # First, identify which columns belong to linked objects
         columns_in_objects = set()
@@ -446,19 +606,14 @@ class MappingGenerator:
                 columns_in_objects.update(col_name for col_name, _ in potential_cols)
 
                 # Also track FK ID columns (e.g., BorrowerID, PropertyID)
-                for col_name in self.data_source.get_column_names():
-                    col_lower = col_name.lower()
-                    if col_lower.endswith('id') and col_lower == class_name + 'id':
-                        fk_id_columns.add(col_name)
+                fk_id_columns.update(self._columns_by_lower.get(class_name + 'id', ()))
 
         # Match columns to properties (excluding those in linked objects and FK IDs)
-        for col_name in self.data_source.get_column_names():
+        for col_name, col_analysis in self._analyses.items():
             # Skip columns that belong to linked objects or are FK IDs
             if col_name in columns_in_objects or col_name in fk_id_columns:
                 continue
 
-            col_analysis = self.data_source.get_analysis(col_name)
-
             # Find matching property
             match_result = self._match_column_to_property(col_name, col_analysis, properties)
             
@@ -527,7 +682,7 @@ class MappingGenerator:
         # Group by property
         grouped: Dict[str, Dict[str, any]] = {}
         for r in results:
-            key = str(r.property.uri)
+            key = r.property.uri_str
             if key not in grouped:
                 grouped[key] = {
                     'prop': r.property,
@@ -665,7 +820,7 @@ class MappingGenerator:
             evidence_groups = categorize_evidence(evidence_items)
 
             # Generate reasoning summary
-            prop_label = best_prop.label or best_prop.pref_label or str(best_prop.uri).split('#')[-1]
+            prop_label = best_prop.label or best_prop.pref_label or best_prop.uri_str.split('#')[-1]
             reasoning_summary = generate_reasoning_summary(
                 base_result.matcher_name,
                 float(final_score),
@@ -721,35 +876,29 @@ class MappingGenerator:
         Returns:
             Tuple of (property, match_type, matched_via, confidence) or None if no match found
         """
-        # Broaden candidate set for identifier-like columns to avoid missing cross-class identifiers
-        candidate_props = list(properties)
+        # Broaden candidate set for identifier-like columns to avoid missing cross-class identifiers.
+        # The same list objects are reused across columns so matcher indexes built for
+        # them are found by identity.
+        candidate_props = properties
         name_lower = col_name.lower()
         is_id_like = col_analysis.is_identifier or name_lower.endswith('id') or name_lower.endswith('_id') or 'identifier' in name_lower
         if is_id_like:
-            try:
-                # Pull all datatype properties from ontology and filter for identifier-like labels
-                all_dt_props = [p for p in self.ontology.properties.values() if not p.is_object_property]
-                def is_identifier_prop(p: OntologyProperty) -> bool:
-                    label = (p.label or str(p.uri).split('#')[-1]).lower()
-                    local = str(p.uri).split('#')[-1].lower()
-                    return (
-                        any(tok in label for tok in ('id','identifier','number','code','key','ref','reference'))
-                        or any(tok in local for tok in ('id','identifier','number','code','key','ref','reference'))
-                    )
-                id_props = [p for p in all_dt_props if is_identifier_prop(p)]
+            cached = self._id_candidates.get(id(properties))
+            if cached is not None and cached[0] is properties:
+                candidate_props = cached[1]
+            else:
+                candidate_props = list(properties)
                 # Merge, preserving order and uniqueness
-                seen = {str(p.uri) for p in candidate_props}
-                for p in id_props:
-                    if str(p.uri) not in seen:
+                seen = {p.uri_str for p in candidate_props}
+                for p in self._get_identifier_props():
+                    if p.uri_str not in seen:
                         candidate_props.append(p)
-                        seen.add(str(p.uri))
-            except Exception:
-                # Safe fallback: ignore augmentation if ontology structure differs
-                pass
+                        seen.add(p.uri_str)
+                self._id_candidates[id(properties)] = (properties, candidate_props)
 
         context = MatchContext(
             column=col_analysis,
-            all_columns=[self.data_source.get_analysis(c) for c in self.data_source.get_column_names()],
+            all_columns=self._column_analyses,
             available_properties=candidate_props,
             domain_hints=None
         )
@@ -764,6 +913,36 @@ class MappingGenerator:
             return agg
         return None
     
+    def _class_properties(self, class_uri: URIRef) -> List[OntologyProperty]:
+        """Datatype properties of a class as one shared list (treat as read-only).
+
+        Passing the same list object for every column lets the matchers reuse
+        the label indexes they built for it.
+        """
+        props = self._properties_by_class.get(class_uri)
+        if props is None:
+            props = self._properties_by_class[class_uri] = self.ontology.get_datatype_properties(class_uri)
+        return props
+
+    def _get_identifier_props(self) -> List[OntologyProperty]:
+        """Datatype properties with identifier-like labels, computed once per generator."""
+        if self._identifier_props is None:
+            tokens = ('id', 'identifier', 'number', 'code', 'key', 'ref', 'reference')
+            id_props = []
+            try:
+                for p in self.ontology.properties.values():
+                    if p.is_object_property:
+                        continue
+                    label = (p.label or p.uri_str.split('#')[-1]).lower()
+                    local = p.uri_str.split('#')[-1].lower()
+                    if any(tok in label for tok in tokens) or any(tok in local for tok in tokens):
+                        id_props.append(p)
+            except Exception:
+                # Safe fallback: ignore augmentation if ontology structure differs
+                id_props = []
+            self._identifier_props = id_props
+        return self._identifier_props
+
     def _build_ontology_context(self, target_class: OntologyClass) -> 'OntologyContext':
         """Build comprehensive ontology context for human mapping decisions.
 
@@ -777,13 +956,13 @@ class MappingGenerator:
 
         # Build target class context
         target_properties = self.ontology.get_datatype_properties(target_class.uri)
-        target_prop_contexts = [self._build_property_context(prop, str(target_class.uri)) for prop in target_properties]
+        target_prop_contexts = [self._build_property_context(prop, target_class.uri_str) for prop in target_properties]
 
         target_context = ClassContext(
-            uri=str(target_class.uri),
+            uri=target_class.uri_str,
             label=target_class.label,
             comment=target_class.comment,
-            local_name=str(target_class.uri).split("#")[-1].split("/")[-1],
+            local_name=target_class.local_name,
             properties=target_prop_contexts
         )
 
@@ -798,30 +977,34 @@ class MappingGenerator:
                 related_prop_contexts = [self._build_property_context(prop, obj_prop.range_type) for prop in related_properties]
 
                 related_context = ClassContext(
-                    uri=str(related_class.uri),
+                    uri=related_class.uri_str,
                     label=related_class.label,
                     comment=related_class.comment,
-                    local_name=str(related_class.uri).split("#")[-1].split("/")[-1],
+                    local_name=related_class.local_name,
                     properties=related_prop_contexts
                 )
                 related_contexts.append(related_context)
 
         # Get all properties in ontology (for comprehensive reference)
         all_properties = []
+        seen_uris = set()
         for class_uri, ontology_class in self.ontology.classes.items():
             class_properties = self.ontology.get_properties_for_class(class_uri)
             for prop in class_properties:
-                if not any(p.uri == prop.uri for p in all_properties):  # Avoid duplicates
+                if prop.uri not in seen_uris:  # Avoid duplicates
+                    seen_uris.add(prop.uri)
                     all_properties.append(prop)
 
         all_prop_contexts = [self._build_property_context(prop) for prop in all_properties]
 
         # Get object properties for relationship mapping
         all_obj_properties = []
+        seen_uris = set()
         for class_uri, ontology_class in self.ontology.classes.items():
             obj_props = self.ontology.get_object_properties(class_uri)
             for prop in obj_props:
-                if not any(p.uri == prop.uri for p in all_obj_properties):  # Avoid duplicates
+                if prop.uri not in seen_uris:  # Avoid duplicates
+                    seen_uris.add(prop.uri)
                     all_obj_properties.append(prop)
 
         obj_prop_contexts = [self._build_property_context(prop) for prop in all_obj_properties]
@@ -838,7 +1021,7 @@ class MappingGenerator:
         from ..models.alignment import PropertyContext
 
         return PropertyContext(
-            uri=str(prop.uri),
+            uri=prop.uri_str,
             label=prop.label,
             pref_label=prop.pref_label,
             alt_labels=prop.alt_labels,
@@ -846,7 +1029,7 @@ class MappingGenerator:
             comment=prop.comment,
             domain_class=domain_class,
             range_type=prop.range_type,
-            local_name=str(prop.uri).split("#")[-1].split("/")[-1]
+            local_name=prop.local_name
         )
 
     def _find_obvious_skos_suggestions(
@@ -868,7 +1051,7 @@ class MappingGenerator:
         """
         from ..models.alignment import SKOSEnrichmentSuggestion
 
-        properties = self.ontology.get_datatype_properties(target_class.uri)
+        properties = self._class_properties(target_class.uri)
 
         # Very conservative abbreviation mappings (only obvious ones)
         obvious_mappings = {
@@ -892,15 +1075,16 @@ class MappingGenerator:
             return None
 
         possible_matches = obvious_mappings[col_lower]
+        normalized_matches = {_norm_local(m) for m in possible_matches}
 
         # Look for exact matches with property local names or labels
         for prop in properties:
-            local_name = str(prop.uri).split("#")[-1].split("/")[-1]
+            local_name = prop.local_name
 
             # Check if property local name matches any of the possible matches
-            if local_name.lower() in [m.lower().replace('_', '') for m in possible_matches]:
+            if local_name.lower() in normalized_matches:
                 return SKOSEnrichmentSuggestion(
-                    property_uri=str(prop.uri),
+                    property_uri=prop.uri_str,
                     property_label=prop.label or local_name,
                     suggested_label_type="skos:hiddenLabel",
                     suggested_label_value=col_name,
@@ -910,10 +1094,9 @@ class MappingGenerator:
 
             # Check labels too
             if prop.label:
-                label_normalized = prop.label.lower().replace(' ', '').replace('_', '')
-                if label_normalized in [m.lower().replace('_', '') for m in possible_matches]:
+                if _norm(prop.label) in normalized_matches:
                     return SKOSEnrichmentSuggestion(
-                        property_uri=str(prop.uri),
+                        property_uri=prop.uri_str,
                         property_label=prop.label or local_name,
                         suggested_label_type="skos:hiddenLabel",
                         suggested_label_value=col_name,
@@ -947,8 +1130,8 @@ class MappingGenerator:
         ]
 
         # Normalize both for comparison
-        col_norm = col_lower.replace('_', '').replace('-', '').replace(' ', '')
-        prop_norm = prop_lower.replace('_', '').replace('-', '').replace(' ', '')
+        col_norm = _norm_compact(col_lower)
+        prop_norm = _norm_compact(prop_lower)
 
         # Check exact abbreviation matches
         for abbr, full in abbreviation_pairs:
@@ -976,8 +1159,8 @@ class MappingGenerator:
     def _is_semantically_reasonable_match(self, col_name: str, prop: OntologyProperty, similarity: float) -> bool:
         """Check if a column-to-property match is semantically reasonable."""
         col_lower = col_name.lower()
-        prop_label = (prop.label or prop.pref_label or str(prop.uri).split('#')[-1]).lower()
-        prop_local = str(prop.uri).split('#')[-1].split('/')[-1].lower()
+        prop_label = (prop.label or prop.pref_label or prop.uri_str.split('#')[-1]).lower()
+        prop_local = prop.local_name.lower()
 
         # For low similarity matches, apply stricter semantic checks
         if similarity < 0.6:
@@ -1018,7 +1201,9 @@ class MappingGenerator:
         
         # Get object properties for this class
         obj_properties = self.ontology.get_object_properties(target_class.uri)
-        
+        if not obj_properties:
+            return object_mappings
+
         # For each object property, check if we can create a linked object
         for prop in obj_properties:
             if not prop.range_type or prop.range_type not in self.ontology.classes:
@@ -1030,12 +1215,12 @@ class MappingGenerator:
             potential_cols = self._find_columns_for_object(range_class)
             
             if potential_cols:
-                obj_name = prop.label or str(prop.uri).split("#")[-1].split("/")[-1]
+                obj_name = prop.label or prop.local_name
                 
                 # Build properties list with full metadata
                 properties = []
                 for col_name, matched_prop in potential_cols:
-                    col_analysis = self.data_source.get_analysis(col_name)
+                    col_analysis = self._analyses[col_name]
                     prop_mapping = {
                         "column": col_name,
                         "as": self._format_uri(matched_prop.uri),  # Use matched_prop not prop!
@@ -1080,54 +1265,73 @@ class MappingGenerator:
 
         Skips pure ID columns (e.g., BorrowerID, PropertyID) as these are foreign keys.
         """
+        cached = self._object_columns.get(range_class.uri)
+        if cached is not None:
+            return list(cached)
+
         potential = []
-        range_props = self.ontology.get_datatype_properties(range_class.uri)
         class_name = range_class.label.lower() if range_class.label else ""
 
-        for col_name in self.data_source.get_column_names():
-            col_analysis = self.data_source.get_analysis(col_name)
-            col_lower = col_name.lower()
-
-            # Check if column name contains the class name
-            # E.g., "borrowerid" contains "borrower", "propertyaddress" contains "property"
-            if class_name not in col_lower:
-                continue
-
-            # Skip pure ID columns (they're foreign keys, not properties to map)
-            # E.g., BorrowerID, PropertyID
-            if col_lower.endswith('id') and col_lower == class_name + 'id':
-                continue
+        # Check if column name contains the class name
+        # E.g., "borrowerid" contains "borrower", "propertyaddress" contains "property"
+        # Skip pure ID columns (they're foreign keys, not properties to map)
+        # E.g., BorrowerID, PropertyID
+        candidates = [
+            col_name for col_name, col_lower in self._lower_names.items()
+            if class_name in col_lower and col_lower != class_name + 'id'
+        ]
+        # Range class properties are only looked up when some column names the class
+        range_props = self._class_properties(range_class.uri) if candidates else []
 
+        for col_name in candidates:
             # Try to match to object's properties
-            match_result = self._match_column_to_property(col_name, col_analysis, range_props)
+            match_result = self._match_column_to_property(col_name, self._analyses[col_name], range_props)
             
             if match_result:
                 matched_prop, _, _, _ = match_result  # property, match_type, matched_via, confidence
                 potential.append((col_name, matched_prop))
-        
-        return potential
+
+        self._object_columns[range_class.uri] = potential
+        return list(potential)
     
     def _format_uri(self, uri) -> str:
-        """Format a URI as a CURIE if possible."""
+        """Format a URI as a CURIE if possible (the most specific namespace wins)."""
         uri_str = str(uri)
-        
+        cached = self._curies.get(uri_str)
+        if cached is not None:
+            return cached
+
+        if self._ns_pattern is None:
+            for prefix, namespace in self.ontology.get_namespaces().items():
+                self._ns_prefixes.setdefault(namespace, prefix)
+            # One anchored alternation, longest namespace first, so a single
+            # match() finds the most specific namespace
+            self._ns_pattern = re.compile("|".join(
+                re.escape(ns) for ns in sorted(self._ns_prefixes, key=len, reverse=True)
+            ) or r"(?!)")
+
+        formatted = uri_str  # full URI if no prefix found
         # Try to use namespaces to create CURIE
-        for prefix, namespace in self.ontology.get_namespaces().items():
-            if uri_str.startswith(namespace):
-                local_name = uri_str[len(namespace):]
-                return f"{prefix}:{local_name}"
-        
-        # Return full URI if no prefix found
-        return uri_str
-    
-    def save_yaml(self, output_file: str):
-        """Save the mapping to a YAML file with clean formatting."""
+        m = self._ns_pattern.match(uri_str)
+        if m:
+            namespace = m.group(0)
+            formatted = f"{self._ns_prefixes[namespace]}:{uri_str[len(namespace):]}"
+        self._curies[uri_str] = formatted
+        return formatted
+
+    def save_yaml(self, output_file: str, return_text: bool = True) -> Optional[str]:
+        """Save the mapping to a YAML file with clean formatting and return the written text.
+
+        With return_text=False the YAML is streamed to the file and None is returned.
+        """
         if not self.mapping:
             raise ValueError("No mapping generated. Call generate() first.")
         
+        self._relocate_sources(output_file)
+
         # Use custom formatter for clean output
         from .yaml_formatter import save_formatted_mapping
-        save_formatted_mapping(self.mapping, output_file, wizard_config=None)
+        return save_formatted_mapping(self.mapping, output_file, wizard_config=None, return_text=return_text)
 
     def save_yarrrml(self, output_file: str):
         """Save the mapping in YARRRML standard format.
@@ -1142,8 +1346,9 @@ class MappingGenerator:
         if not self.mapping:
             raise ValueError("No mapping generated. Call generate() first.")
 
+        self._relocate_sources(output_file)
+
         from ..config.yarrrml_generator import internal_to_yarrrml
-        import yaml
 
         # Convert internal format to YARRRML
         yarrrml = internal_to_yarrrml(
@@ -1152,16 +1357,22 @@ class MappingGenerator:
         )
 
         # Save as YAML with clean formatting
+        options = dict(default_flow_style=False, sort_keys=False, allow_unicode=True)
+        try:
+            text = yaml.dump(yarrrml, Dumper=_YAML_DUMPER, **options)
+        except yaml.representer.RepresenterError:
+            # Values such as rdflib terms need the full (Python-tagging) dumper
+            text = yaml.dump(yarrrml, **options)
         with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(yarrrml, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            f.write(text)
 
     def save_json(self, output_file: str):
         """Save the mapping to a JSON file."""
         if not self.mapping:
             raise ValueError("No mapping generated. Call generate() first.")
-        
-        with open(output_file, 'w') as f:
-            json.dump(self.mapping, f, indent=2)
+
+        self._relocate_sources(output_file)
+        _write_json(self.mapping, output_file)
     
     def get_json_schema(self) -> Dict[str, Any]:
         """
@@ -1169,9 +1380,8 @@ class MappingGenerator:
         
         This can be used to validate generated mapping configurations.
         """
-        from ..models.mapping import MappingConfig
-        
-        return MappingConfig.model_json_schema()
+        # The schema is cached; hand out a copy so callers may modify it
+        return deepcopy(_mapping_schema())
     
     def _build_alignment_report(self, target_class: OntologyClass) -> AlignmentReport:
         """Build alignment report after mapping generation."""
@@ -1183,7 +1393,7 @@ class MappingGenerator:
         skos_suggestions = []
         
         for col_name in self._unmapped_columns:
-            col_analysis = self.data_source.get_analysis(col_name)
+            col_analysis = self._analyses.get(col_name)
             unmapped_details.append(
                 UnmappedColumn(
                     column_name=col_name,
@@ -1203,14 +1413,24 @@ class MappingGenerator:
         weak_matches = []
         match_details = []  # new: record reasons for all mapped columns
 
-        confidence_scores = []
+        # Confidence buckets and total, counted as the mapped columns are visited
+        high_conf = medium_conf = low_conf = very_low_conf = 0
+        confidence_total = 0.0
         for col_name, (prop, match_type, confidence) in self._mapped_columns.items():
-            confidence_scores.append(confidence)
+            confidence_total += confidence
+            if confidence >= 0.8:
+                high_conf += 1
+            elif confidence >= 0.5:
+                medium_conf += 1
+            elif confidence >= 0.3:
+                low_conf += 1
+            elif confidence < 0.3:
+                very_low_conf += 1
             confidence_level = get_confidence_level(confidence)
 
             # Get matcher name from evidence that matches the chosen base_type
             matcher_name = 'pipeline'
-            matched_via = prop.label or str(prop.uri).split('#')[-1]
+            matched_via = prop.label or prop.uri_str.split('#')[-1]
 
             extra = self._match_extras.get(col_name, {})
             evidence_list = extra.get('evidence', [])
@@ -1265,7 +1485,7 @@ class MappingGenerator:
 
             match_details.append(MatchDetail(
                 column_name=col_name,
-                matched_property=str(prop.uri),
+                matched_property=prop.uri_str,
                 match_type=match_type,
                 confidence_score=confidence,
                 matcher_name=matcher_name,
@@ -1294,17 +1514,17 @@ class MappingGenerator:
 
             # Track weak matches (confidence < 0.8)
             if confidence < 0.8:
-                col_analysis = self.data_source.get_analysis(col_name)
+                col_analysis = self._analyses.get(col_name)
                 suggestion = self._generate_skos_suggestion(
                     col_name, prop, match_type
                 )
                 weak_match = WeakMatch(
                     column_name=col_name,
-                    matched_property=str(prop.uri),
+                    matched_property=prop.uri_str,
                     match_type=match_type,
                     confidence_score=confidence,
                     confidence_level=confidence_level,
-                    matched_via=prop.label or str(prop.uri).split("#")[-1],
+                    matched_via=prop.label or prop.uri_str.split("#")[-1],
                     sample_values=col_analysis.sample_values[:5],
                     suggestions=[suggestion] if suggestion else []
                 )
@@ -1313,14 +1533,14 @@ class MappingGenerator:
                     skos_suggestions.append(suggestion)
 
         # Calculate statistics
-        total_columns = len(self.data_source.get_column_names())
+        total_columns = len(self._analyses)
 
         # Include direct mapped columns + object property columns + FK columns from object iri_templates
         direct_mapped_cols = set(self._mapped_columns.keys())
         object_prop_cols = set()
         fk_cols = set()
         # Get actual data columns for validation
-        data_cols = set(self.data_source.get_column_names())
+        data_cols = set(self._analyses)
 
         try:
             # Extract from current mapping (sheets[0])
@@ -1375,12 +1595,8 @@ class MappingGenerator:
         mapped_columns = len((direct_mapped_cols | object_prop_cols | fk_cols) & data_cols)
         unmapped_columns = max(0, total_columns - mapped_columns)
 
-        high_conf = sum(1 for c in confidence_scores if c >= 0.8)
-        medium_conf = sum(1 for c in confidence_scores if 0.5 <= c < 0.8)
-        low_conf = sum(1 for c in confidence_scores if 0.3 <= c < 0.5)
-        very_low_conf = sum(1 for c in confidence_scores if c < 0.3)
-
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
+        mapped_count = len(self._mapped_columns)
+        avg_confidence = confidence_total / mapped_count if mapped_count else 0.0
         success_rate = mapped_columns / total_columns if total_columns > 0 else 0.0
 
         # Calculate matcher firing statistics
@@ -1430,7 +1646,7 @@ class MappingGenerator:
         return AlignmentReport(
             ontology_file=self.ontology_file,
             spreadsheet_file=self.data_file,
-            target_class=target_class.label or str(target_class.uri),
+            target_class=target_class.label or target_class.uri_str,
             statistics=statistics,
             unmapped_columns=unmapped_details,
             weak_matches=weak_matches,
@@ -1449,7 +1665,7 @@ class MappingGenerator:
         import re
 
         # Get property local name for readability
-        local_name = str(prop.uri).split("#")[-1].split("/")[-1]
+        local_name = prop.local_name
         property_label = prop.label or prop.pref_label or local_name
 
         # Determine appropriate label type and justification based on match type and patterns
@@ -1497,7 +1713,7 @@ class MappingGenerator:
         turtle_snippet = f'{prop_prefix} {label_type} "{col_name}" .'
 
         return SKOSEnrichmentSuggestion(
-            property_uri=str(prop.uri),
+            property_uri=prop.uri_str,
             property_label=property_label,
             suggested_label_type=label_type,
             suggested_label_value=col_name,
@@ -1523,16 +1739,18 @@ class MappingGenerator:
         # Generate mapping first
         mapping = self.generate(target_class=target_class, output_path=output_path)
 
-        # Find resolved target class
-        resolved_class = None
-        if target_class:
-            resolved_class = self._resolve_class(target_class)
-        else:
-            resolved_class = self._auto_detect_class()
+        # A cache hit skips matching, so the report has to come from the cache too
+        if self._cache_entry is not None:
+            if self._cache_entry.get('alignment_report') is not None:
+                self.alignment_report = AlignmentReport.model_validate(self._cache_entry['alignment_report'])
+                return mapping, self.alignment_report
+            # Cached mapping without a report: rerun the matching
+            mapping = self._generate_uncached(target_class)
 
-        # Build alignment report
-        if resolved_class:
-            self.alignment_report = self._build_alignment_report(resolved_class)
+        # Build alignment report for the class generate() resolved
+        if self._resolved_class:
+            self.alignment_report = self._build_alignment_report(self._resolved_class)
+            self._write_cache({"mapping": mapping, "alignment_report": self.alignment_report.to_dict()})
 
         return mapping, self.alignment_report
 
@@ -1545,8 +1763,7 @@ class MappingGenerator:
         if not self.alignment_report:
             raise ValueError("No alignment report available. Call generate_with_alignment_report() first.")
 
-        with open(output_file, 'w') as f:
-            json.dump(self.alignment_report.to_dict(), f, indent=2)
+        _write_json(self.alignment_report.to_dict(), output_file)
 
     def export_alignment_html(self, output_file: str):
         """Export alignment report to HTML file.
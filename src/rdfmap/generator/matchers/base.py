@@ -5,17 +5,95 @@ where different matching strategies can be composed and prioritized.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
-from dataclasses import dataclass
+from typing import Any, Callable, Optional, List, Dict, Set, Tuple
+from dataclasses import dataclass, field
 from enum import IntEnum
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from functools import lru_cache
 import time
 import os
 
+import numpy as np
+
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
 
+_DROP_SEPARATORS = str.maketrans("", "", "_ ")
+_DROP_UNDERSCORES = str.maketrans("", "", "_")
+_DROP_SEPARATORS_AND_HYPHENS = str.maketrans("", "", "_- ")
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+_SEPARATORS_TO_SPACE = str.maketrans("_-", "  ")
+
+
+@lru_cache(maxsize=4096)
+def _norm(text: str) -> str:
+    """Normalize a column name or label for comparison (lowercase, no '_' or spaces)."""
+    return text.lower().translate(_DROP_SEPARATORS)
+
+
+@lru_cache(maxsize=4096)
+def _norm_compact(text: str) -> str:
+    """Normalize for comparison ignoring '_', '-' and spaces (lowercase)."""
+    return text.lower().translate(_DROP_SEPARATORS_AND_HYPHENS)
+
+
+@lru_cache(maxsize=4096)
+def _norm_local(text: str) -> str:
+    """Normalize a local name for comparison (lowercase, no '_'; spaces kept)."""
+    return text.lower().translate(_DROP_UNDERSCORES)
+
+
+@lru_cache(maxsize=4096)
+def _norm_words(text: str) -> str:
+    """Normalize for word-level comparison (lowercase, '_' and '-' become spaces)."""
+    return text.lower().translate(_SEPARATORS_TO_SPACE)
+
+
+@lru_cache(maxsize=4096)
+def _uri_local_name(uri: str) -> str:
+    """Lowercased local name of a URI string (after the last '#' or '/')."""
+    return uri.split("#")[-1].split("/")[-1].lower()
+
+
+@lru_cache(maxsize=4096)
+def _norm_spaced(text: str) -> str:
+    """Lowercase with '_' turned into spaces ('-' kept)."""
+    return text.lower().translate(_UNDERSCORE_TO_SPACE)
+
+
+class _SetIndex:
+    """Fixed collection of string sets, scored against one query set at a time.
+
+    Each item maps to the positions of the sets containing it (the columns of a
+    sparse boolean set-by-item matrix), so the overlap of a query with every set
+    is one ``bincount`` over the postings of the query's items.
+    """
+
+    __slots__ = ('sizes', 'postings')
+
+    def __init__(self, sets: List[Set[str]]):
+        postings: Dict[str, List[int]] = {}
+        for position, items in enumerate(sets):
+            for item in items:
+                postings.setdefault(item, []).append(position)
+        self.postings = {item: np.array(rows, dtype=np.intp) for item, rows in postings.items()}
+        self.sizes = np.array([len(items) for items in sets], dtype=np.int64)
+
+    def overlap(self, query: Set[str]) -> np.ndarray:
+        """Number of items of query in each set."""
+        hits = [self.postings[item] for item in query if item in self.postings]
+        if hits:
+            return np.bincount(np.concatenate(hits), minlength=len(self.sizes))
+        return np.zeros(len(self.sizes), dtype=np.int64)
+
+    def jaccard(self, query: Set[str]):
+        """Return (overlap counts, Jaccard similarities) of query with every set."""
+        overlap = self.overlap(query)
+        union = self.sizes + len(query) - overlap
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return overlap, overlap / union
+
 
 class MatchPriority(IntEnum):
     """Priority levels for matchers (lower = higher priority)."""
@@ -60,11 +138,31 @@ class MatchContext:
     available_properties: List[OntologyProperty]
     domain_hints: Optional[str] = None  # "finance", "healthcare", etc.
     matched_properties: Optional[Dict[str, str]] = None  # column_name -> property_uri mapping
+    # Bump after changing matched_properties in place so values derived from it are rebuilt
+    version: int = 0
+    _derived: Dict[Any, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def derived(self, key: Any, build: Callable[[], Any]) -> Any:
+        """Value built from matched_properties, cached on the context until it changes.
+
+        A context is typically shared by many columns; this keeps matchers from
+        recomputing the same sets and counts for each of them.
+        """
+        matched = self.matched_properties
+        state = (len(matched) if matched else 0, self.version)
+        entry = self._derived.get(key)
+        if entry is None or entry[0] is not matched or entry[1] != state:
+            entry = self._derived[key] = (matched, state, build())
+        return entry[2]
 
 
 class ColumnPropertyMatcher(ABC):
     """Abstract base class for all matching strategies."""
 
+    # Cheap matchers (index lookups) run on the calling thread in
+    # match_all(parallel=True); a thread hand-off would cost more than the match.
+    inline: bool = False
+
     def __init__(self, enabled: bool = True, threshold: float = 0.5):
         """Initialize matcher.
 
@@ -129,13 +227,13 @@ class MatcherPipeline:
         """Initialize pipeline with matchers.
 
         Args:
-            matchers: List of matchers to use (will be sorted by priority)
+            matchers: Matchers to use (kept as a tuple sorted by priority)
             logger: Optional MatchingLogger instance for detailed logging
             calibrator: Optional ConfidenceCalibrator for dynamic confidence adjustment
             max_workers: Max threads for parallel execution (auto-tuned if None)
             matcher_timeout: Timeout per matcher in seconds (default 2.0)
         """
-        self.matchers = matchers or []
+        self.matchers: Tuple[ColumnPropertyMatcher, ...] = tuple(matchers or ())
         self.logger = logger
         self.calibrator = calibrator
         self.matcher_timeout = matcher_timeout
@@ -152,16 +250,17 @@ class MatcherPipeline:
 
     def _sort_matchers(self):
         """Sort matchers by priority (lower = higher priority)."""
-        self.matchers.sort(key=lambda m: m.priority())
+        # An immutable tuple: iterated for every column, replaced only on add/remove
+        self.matchers = tuple(sorted(self.matchers, key=lambda m: m.priority()))
 
     def add_matcher(self, matcher: ColumnPropertyMatcher):
         """Add a matcher to the pipeline."""
-        self.matchers.append(matcher)
+        self.matchers += (matcher,)
         self._sort_matchers()
 
     def remove_matcher(self, matcher_name: str):
         """Remove a matcher by name."""
-        self.matchers = [m for m in self.matchers if m.name() != matcher_name]
+        self.matchers = tuple(m for m in self.matchers if m.name() != matcher_name)
 
     def match(
         self,
@@ -293,6 +392,7 @@ class MatcherPipeline:
         # Filter enabled matchers
         active_matchers = [m for m in self.matchers if m.enabled and m.can_match(column)]
         metrics.matchers_fired = len(active_matchers)
+        pooled_matchers = [m for m in active_matchers if not m.inline]
 
         def run_matcher(matcher: ColumnPropertyMatcher) -> Optional[MatchResult]:
             """Run a single matcher with timeout protection."""
@@ -304,12 +404,23 @@ class MatcherPipeline:
                     self.logger.log_error(e, column)
                 return None
 
-        # Execute matchers in parallel with timeout
+        # Cheap matchers in one pass on this thread
+        for matcher in active_matchers:
+            if matcher.inline:
+                result = run_matcher(matcher)
+                if result:
+                    results.append(result)
+                    metrics.matchers_succeeded += 1
+
+        if not pooled_matchers:
+            return self._finish_parallel(results, metrics, start_time, len(active_matchers), top_k)
+
+        # Execute the remaining matchers in parallel with timeout
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all matcher tasks
             future_to_matcher = {
                 executor.submit(run_matcher, matcher): matcher
-                for matcher in active_matchers
+                for matcher in pooled_matchers
             }
 
             # Collect results as they complete
@@ -332,13 +443,24 @@ class MatcherPipeline:
                     if self.logger:
                         self.logger.log_error(e, column)
 
+        return self._finish_parallel(results, metrics, start_time, len(active_matchers), top_k)
+
+    def _finish_parallel(
+        self,
+        results: List[MatchResult],
+        metrics: PerformanceMetrics,
+        start_time: float,
+        matcher_count: int,
+        top_k: int
+    ) -> List[MatchResult]:
+        """Record performance metrics and return the top results."""
         # Calculate performance metrics
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
         metrics.execution_time_ms = execution_time
 
         # Estimate sequential time (rough approximation)
-        avg_matcher_time = execution_time / max(1.0, float(len(active_matchers)))
-        estimated_sequential = avg_matcher_time * len(active_matchers)
+        avg_matcher_time = execution_time / max(1.0, float(matcher_count))
+        estimated_sequential = avg_matcher_time * matcher_count
         metrics.parallel_speedup = estimated_sequential / max(1.0, execution_time)
 
         self._last_performance_metrics = metrics
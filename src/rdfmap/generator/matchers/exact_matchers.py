@@ -1,13 +1,63 @@
 """Exact label matching strategies (SKOS and rdfs:label)."""
 
-from typing import Optional, List
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+from abc import abstractmethod
+from typing import Dict, Iterable, Optional, List, Tuple
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _norm, _norm_local
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
 
-
-class ExactPrefLabelMatcher(ColumnPropertyMatcher):
+# Label indexes shared by all matcher instances, so generators working on the
+# same OntologyAnalyzer reuse them: (matcher class, property ids) -> (properties, index)
+_INDEX_CACHE_SIZE = 64
+_INDEXES: Dict[Tuple[type, Tuple[int, ...]], Tuple[tuple, Dict[str, Tuple[OntologyProperty, str]]]] = {}
+
+
+class _IndexedLabelMatcher(ColumnPropertyMatcher):
+    """Base for exact matchers: looks columns up in a normalized label -> property index.
+
+    The index for a property list is built once and reused for every column
+    matched against the same properties, by any instance of the matcher class
+    (e.g. later generators sharing an OntologyAnalyzer). The first property
+    (in list order) with a given normalized label wins, as with a linear
+    scan. Callers pass the same list object for every column of a class, so
+    the last list is checked by identity before computing the content key.
+    """
+
+    inline = True
+
+    def __init__(self, enabled: bool = True, threshold: float = 0.5):
+        super().__init__(enabled, threshold)
+        self._last: Tuple[Optional[list], Dict[str, Tuple[OntologyProperty, str]]] = (None, {})
+
+    @abstractmethod
+    def _labels(self, prop: OntologyProperty) -> Iterable[str]:
+        """Labels of a property this matcher compares against."""
+        pass
+
+    def _normalize(self, text: str) -> str:
+        return _norm(text)
+
+    def _lookup(self, column_name: str, properties: List[OntologyProperty]) -> Optional[Tuple[OntologyProperty, str]]:
+        last_properties, index = self._last
+        if properties is last_properties:
+            return index.get(self._normalize(column_name))
+        key = (type(self), tuple(map(id, properties)))
+        entry = _INDEXES.get(key)
+        if entry is None:
+            index: Dict[str, Tuple[OntologyProperty, str]] = {}
+            for prop in properties:
+                for label in self._labels(prop):
+                    index.setdefault(self._normalize(label), (prop, label))
+            if len(_INDEXES) >= _INDEX_CACHE_SIZE:
+                _INDEXES.clear()
+            # Holding the properties keeps their ids from being reused while cached
+            entry = _INDEXES[key] = (tuple(properties), index)
+        self._last = (properties, entry[1])
+        return entry[1].get(self._normalize(column_name))
+
+
+class ExactPrefLabelMatcher(_IndexedLabelMatcher):
     """Matches columns to SKOS prefLabel exactly."""
 
     def name(self) -> str:
@@ -16,30 +66,29 @@ class ExactPrefLabelMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.CRITICAL
 
+    def _labels(self, prop: OntologyProperty) -> Iterable[str]:
+        return (prop.pref_label,) if prop.pref_label else ()
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "").replace(" ", "")
-
-        for prop in properties:
-            if prop.pref_label:
-                label_clean = prop.pref_label.lower().replace("_", "").replace(" ", "")
-                if col_clean == label_clean:
-                    return MatchResult(
-                        property=prop,
-                        match_type=MatchType.EXACT_PREF_LABEL,
-                        confidence=0.98,
-                        matched_via=prop.pref_label,
-                        matcher_name=self.name()
-                    )
-
-        return None
-
-
-class ExactRdfsLabelMatcher(ColumnPropertyMatcher):
+        hit = self._lookup(column.name, properties)
+        if hit is None:
+            return None
+        prop, label = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.EXACT_PREF_LABEL,
+            confidence=0.98,
+            matched_via=label,
+            matcher_name=self.name()
+        )
+
+
+class ExactRdfsLabelMatcher(_IndexedLabelMatcher):
     """Matches columns to rdfs:label exactly."""
 
     def name(self) -> str:
@@ -48,30 +97,29 @@ class ExactRdfsLabelMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.HIGH
 
+    def _labels(self, prop: OntologyProperty) -> Iterable[str]:
+        return (prop.label,) if prop.label else ()
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "").replace(" ", "")
-
-        for prop in properties:
-            if prop.label:
-                label_clean = prop.label.lower().replace("_", "").replace(" ", "")
-                if col_clean == label_clean:
-                    return MatchResult(
-                        property=prop,
-                        match_type=MatchType.EXACT_LABEL,
-                        confidence=0.95,
-                        matched_via=prop.label,
-                        matcher_name=self.name()
-                    )
-
-        return None
-
-
-class ExactAltLabelMatcher(ColumnPropertyMatcher):
+        hit = self._lookup(column.name, properties)
+        if hit is None:
+            return None
+        prop, label = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.EXACT_LABEL,
+            confidence=0.95,
+            matched_via=label,
+            matcher_name=self.name()
+        )
+
+
+class ExactAltLabelMatcher(_IndexedLabelMatcher):
     """Matches columns to SKOS altLabel exactly."""
 
     def name(self) -> str:
@@ -80,30 +128,29 @@ class ExactAltLabelMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.HIGH
 
+    def _labels(self, prop: OntologyProperty) -> Iterable[str]:
+        return prop.alt_labels
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "").replace(" ", "")
-
-        for prop in properties:
-            for alt_label in prop.alt_labels:
-                label_clean = alt_label.lower().replace("_", "").replace(" ", "")
-                if col_clean == label_clean:
-                    return MatchResult(
-                        property=prop,
-                        match_type=MatchType.EXACT_ALT_LABEL,
-                        confidence=0.90,
-                        matched_via=alt_label,
-                        matcher_name=self.name()
-                    )
-
-        return None
-
-
-class ExactHiddenLabelMatcher(ColumnPropertyMatcher):
+        hit = self._lookup(column.name, properties)
+        if hit is None:
+            return None
+        prop, label = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.EXACT_ALT_LABEL,
+            confidence=0.90,
+            matched_via=label,
+            matcher_name=self.name()
+        )
+
+
+class ExactHiddenLabelMatcher(_IndexedLabelMatcher):
     """Matches columns to SKOS hiddenLabel exactly."""
 
     def name(self) -> str:
@@ -112,30 +159,29 @@ class ExactHiddenLabelMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.HIGH
 
+    def _labels(self, prop: OntologyProperty) -> Iterable[str]:
+        return prop.hidden_labels
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "").replace(" ", "")
-
-        for prop in properties:
-            for hidden_label in prop.hidden_labels:
-                label_clean = hidden_label.lower().replace("_", "").replace(" ", "")
-                if col_clean == label_clean:
-                    return MatchResult(
-                        property=prop,
-                        match_type=MatchType.EXACT_HIDDEN_LABEL,
-                        confidence=0.85,
-                        matched_via=hidden_label,
-                        matcher_name=self.name()
-                    )
-
-        return None
-
-
-class ExactLocalNameMatcher(ColumnPropertyMatcher):
+        hit = self._lookup(column.name, properties)
+        if hit is None:
+            return None
+        prop, label = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.EXACT_HIDDEN_LABEL,
+            confidence=0.85,
+            matched_via=label,
+            matcher_name=self.name()
+        )
+
+
+class ExactLocalNameMatcher(_IndexedLabelMatcher):
     """Matches columns to property local name exactly."""
 
     def name(self) -> str:
@@ -144,25 +190,27 @@ class ExactLocalNameMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.HIGH
 
+    def _labels(self, prop: OntologyProperty) -> Iterable[str]:
+        return (prop.local_name,)
+
+    def _normalize(self, text: str) -> str:
+        # Local names keep spaces significant
+        return _norm_local(text)
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "")
-
-        for prop in properties:
-            local_name = str(prop.uri).split("#")[-1].split("/")[-1]
-            local_clean = local_name.lower().replace("_", "")
-            if col_clean == local_clean:
-                return MatchResult(
-                    property=prop,
-                    match_type=MatchType.EXACT_LOCAL_NAME,
-                    confidence=0.80,
-                    matched_via=local_name,
-                    matcher_name=self.name()
-                )
-
-        return None
-
+        hit = self._lookup(column.name, properties)
+        if hit is None:
+            return None
+        prop, label = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.EXACT_LOCAL_NAME,
+            confidence=0.80,
+            matched_via=label,
+            matcher_name=self.name()
+        )
@@ -1,13 +1,165 @@
 """Partial and fuzzy matching strategies."""
 
-from typing import Optional, List
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+from abc import abstractmethod
+from typing import Dict, Optional, List, Tuple
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _norm, _norm_local
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # optional: pip install semantic-rdf-mapper[fuzzy]
+    process = None
+
+# Choice indexes shared by all matcher instances (see exact_matchers._INDEXES)
+_CHOICES_CACHE_SIZE = 32
+_CHOICES: Dict[Tuple[type, Tuple[int, ...]], "_ChoiceIndex"] = {}
+# Minimum edit similarity ratio for a near-miss local name (e.g. "adress" vs "address")
+_TYPO_CUTOFF = 85
+
+
+def _similarity_ratio(a: str, b: str) -> float:
+    """Same score as rapidfuzz's fuzz.ratio: 100 * (1 - indel distance / total length)."""
+    total = len(a) + len(b)
+    if not total:
+        return 100.0
+    # Longest common subsequence, one row at a time
+    row = [0] * (len(b) + 1)
+    for ch in a:
+        prev_diag = 0
+        for j, other in enumerate(b, 1):
+            prev_diag, row[j] = row[j], prev_diag + 1 if ch == other else max(row[j], row[j - 1])
+    return 100 * (1 - (total - 2 * row[-1]) / total)
+
+
+def _closest_choice(query: str, choices: List[str], cutoff: float) -> Optional[int]:
+    """Index of the first choice with the highest ratio to query, if it reaches cutoff.
+
+    Uses rapidfuzz when installed; the Python path gives the same result.
+    """
+    if process is not None:
+        hit = process.extractOne(query, choices, scorer=fuzz.ratio, score_cutoff=cutoff)
+        return hit[2] if hit else None
+    best, best_score = None, cutoff
+    for i, choice in enumerate(choices):
+        # Upper bound from the lengths alone skips most choices without the full comparison
+        total = len(query) + len(choice)
+        if total and 200 * min(len(query), len(choice)) / total < best_score:
+            continue
+        score = _similarity_ratio(query, choice)
+        if score >= best_score and (best is None or score > best_score):
+            best, best_score = i, score
+    return best
+
+
+def _first_containing(query: str, choices: List[str]) -> Optional[int]:
+    """Index of the first choice that contains query or is contained in it.
+
+    With rapidfuzz installed the scan runs in C: partial_ratio is 100 exactly
+    when the shorter string is a substring of the longer one. Empty strings
+    (which partial_ratio scores 0) take the plain Python path.
+    """
+    if process is not None and query and all(choices):
+        hit = process.extractOne(query, choices, scorer=fuzz.partial_ratio, score_cutoff=100)
+        return hit[2] if hit else None
+    for i, choice in enumerate(choices):
+        if query in choice or choice in query:
+            return i
+    return None
+
+
+class _ChoiceIndex:
+    """Normalized labels of a property list, bucketed by character for pruning.
+
+    A label can only sit inside the column name if its first character occurs
+    in the name, and can only contain the name if it contains the name's first
+    character, so only those buckets need the substring test.
+    """
+
+    __slots__ = ('properties', 'cleaned', 'owners', 'by_first', 'by_char', 'empty')
+
+    def __init__(self, properties: tuple, cleaned: List[str], owners: List[Tuple[OntologyProperty, str]]):
+        self.properties = properties  # keeps the ids in the cache key from being reused
+        self.cleaned = cleaned
+        self.owners = owners
+        self.by_first: Dict[str, List[int]] = {}
+        self.by_char: Dict[str, List[int]] = {}
+        self.empty: List[int] = []
+        for i, label in enumerate(cleaned):
+            if not label:
+                self.empty.append(i)
+                continue
+            self.by_first.setdefault(label[0], []).append(i)
+            for ch in set(label):
+                self.by_char.setdefault(ch, []).append(i)
+
+    def candidates(self, query: str) -> List[int]:
+        """Indexes (in label order) of labels that may contain or be contained in query."""
+        if not query:
+            return list(range(len(self.cleaned)))
+        found = set(self.empty)
+        found.update(self.by_char.get(query[0], ()))
+        for ch in set(query):
+            found.update(self.by_first.get(ch, ()))
+        return sorted(found)
+
+
+class _ContainmentMatcher(ColumnPropertyMatcher):
+    """Base for matchers that look for a normalized label containing (or inside) the column name."""
+
+    inline = True
+
+    def __init__(self, enabled: bool = True, threshold: float = 0.5):
+        super().__init__(enabled, threshold)
+        self._last: Tuple[Optional[list], Optional[_ChoiceIndex]] = (None, None)
+
+    @abstractmethod
+    def _labels(self, prop: OntologyProperty) -> List[str]:
+        """Labels of a property this matcher compares against."""
+        pass
+
+    def _normalize(self, text: str) -> str:
+        return _norm(text)
+
+    def _find(self, column_name: str, properties: List[OntologyProperty]) -> Optional[Tuple[OntologyProperty, str]]:
+        last_properties, index = self._last
+        if properties is not last_properties:
+            index = self._index_for(properties)
+            self._last = (properties, index)
+        query = _norm(column_name)
+        candidates = index.candidates(query)
+        i = _first_containing(query, [index.cleaned[c] for c in candidates])
+        if i is None:
+            return self._closest(query, index)
+        return index.owners[candidates[i]]
+
+    def _closest(self, query: str, index: _ChoiceIndex) -> Optional[Tuple[OntologyProperty, str]]:
+        """Fallback when no label contains (or sits inside) the column name."""
+        return None
 
-class PartialStringMatcher(ColumnPropertyMatcher):
+    def _index_for(self, properties: List[OntologyProperty]) -> _ChoiceIndex:
+        key = (type(self), tuple(map(id, properties)))
+        index = _CHOICES.get(key)
+        if index is None:
+            cleaned, owners, seen = [], [], set()
+            for prop in properties:
+                for label in self._labels(prop):
+                    # A repeated normalized label (e.g. prefLabel == rdfs:label) can never
+                    # be picked over its first occurrence, so it is left out
+                    norm = self._normalize(label)
+                    if norm in seen:
+                        continue
+                    seen.add(norm)
+                    cleaned.append(norm)
+                    owners.append((prop, label))
+            if len(_CHOICES) >= _CHOICES_CACHE_SIZE:
+                _CHOICES.clear()
+            index = _CHOICES[key] = _ChoiceIndex(tuple(properties), cleaned, owners)
+        return index
+
+
+class PartialStringMatcher(_ContainmentMatcher):
     """Matches columns using partial string matching."""
 
     def name(self) -> str:
@@ -16,37 +168,35 @@ class PartialStringMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.MEDIUM
 
+    def _labels(self, prop: OntologyProperty) -> List[str]:
+        all_labels = []
+        if prop.pref_label:
+            all_labels.append(prop.pref_label)
+        if prop.label:
+            all_labels.append(prop.label)
+        all_labels.extend(prop.alt_labels)
+        return all_labels
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "").replace(" ", "")
-
-        for prop in properties:
-            all_labels = []
-            if prop.pref_label:
-                all_labels.append(prop.pref_label)
-            if prop.label:
-                all_labels.append(prop.label)
-            all_labels.extend(prop.alt_labels)
-
-            for label in all_labels:
-                label_clean = label.lower().replace("_", "").replace(" ", "")
-                if col_clean in label_clean or label_clean in col_clean:
-                    return MatchResult(
-                        property=prop,
-                        match_type=MatchType.PARTIAL,
-                        confidence=0.60,
-                        matched_via=label,
-                        matcher_name=self.name()
-                    )
-
-        return None
-
-
-class FuzzyStringMatcher(ColumnPropertyMatcher):
+        hit = self._find(column.name, properties)
+        if hit is None:
+            return None
+        prop, label = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.PARTIAL,
+            confidence=0.60,
+            matched_via=label,
+            matcher_name=self.name()
+        )
+
+
+class FuzzyStringMatcher(_ContainmentMatcher):
     """Matches columns using fuzzy string matching on local names."""
 
     def name(self) -> str:
@@ -55,27 +205,34 @@ class FuzzyStringMatcher(ColumnPropertyMatcher):
     def priority(self) -> MatchPriority:
         return MatchPriority.LOW
 
+    def _labels(self, prop: OntologyProperty) -> List[str]:
+        return [prop.local_name]
+
+    def _normalize(self, text: str) -> str:
+        return _norm_local(text)
+
+    def _closest(self, query: str, index: _ChoiceIndex) -> Optional[Tuple[OntologyProperty, str]]:
+        # Tolerate small misspellings
+        if not query:
+            return None
+        hit = _closest_choice(query, index.cleaned, _TYPO_CUTOFF)
+        return index.owners[hit] if hit is not None else None
+
     def match(
         self,
         column: DataFieldAnalysis,
         properties: List[OntologyProperty],
         context: Optional[MatchContext] = None
     ) -> Optional[MatchResult]:
-        col_clean = column.name.lower().replace("_", "").replace(" ", "")
-
-        for prop in properties:
-            local_name = str(prop.uri).split("#")[-1].split("/")[-1]
-            local_clean = local_name.lower().replace("_", "")
-
-            # Simple fuzzy: check if one contains the other
-            if col_clean in local_clean or local_clean in col_clean:
-                return MatchResult(
-                    property=prop,
-                    match_type=MatchType.FUZZY,
-                    confidence=0.40,
-                    matched_via=local_name,
-                    matcher_name=self.name()
-                )
-
-        return None
-
+        # Containment first, then the closest local name by edit similarity
+        hit = self._find(column.name, properties)
+        if hit is None:
+            return None
+        prop, local_name = hit
+        return MatchResult(
+            property=prop,
+            match_type=MatchType.FUZZY,
+            confidence=0.40,
+            matched_via=local_name,
+            matcher_name=self.name()
+        )
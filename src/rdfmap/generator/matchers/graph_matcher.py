@@ -8,19 +8,133 @@ intelligent matching decisions based on:
 - Semantic distance and relevance
 """
 
-from typing import List, Optional, Dict, Set, Tuple
-from collections import defaultdict
+from typing import FrozenSet, List, Optional, Dict, Set, Tuple
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from functools import lru_cache
+import re
+
+import numpy as np
 from .base import (
     ColumnPropertyMatcher,
     MatchResult,
     MatchContext,
-    MatchPriority
+    MatchPriority,
+    _SetIndex,
+    _norm_spaced,
+    _norm_words,
 )
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ..graph_reasoner import GraphReasoner
 from ...models.alignment import MatchType
 
+# Abbreviation and synonym expansions used by GraphContextMatcher label scoring
+_LABEL_EXPANSIONS = {
+    'fname': 'first name',
+    'first name': 'first name',
+    'lname': 'last name',
+    'last name': 'last name',
+    'mname': 'middle name',
+    'middle initial': 'middle name',
+    'dob': 'birth date',
+    'birth date': 'birth date',
+    'birth city': 'birth place',
+    'birth place': 'birth place',
+    'email address': 'email',
+    'phone': 'phone number',
+    'phone number': 'phone number',
+    'postal code': 'zip code',
+    'zipcode': 'zip code',
+    'zip': 'zip code',
+    'city name': 'city',
+    'address': 'street address',
+}
+# Every occurrence of every key, overlapping ones included ("email address" also
+# contains "address"). Keys that share a start position ("zip"/"zipcode",
+# "phone"/"phone number") expand to the same term, so one match per position suffices.
+_EXPANSION_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_LABEL_EXPANSIONS, key=len, reverse=True))) + '))'
+)
+
+
+@lru_cache(maxsize=4096)
+def _expanded_terms(name: str) -> FrozenSet[str]:
+    """Expansions of every abbreviation/synonym key contained in a normalized name."""
+    return frozenset(_LABEL_EXPANSIONS[m.group(1)] for m in _EXPANSION_RE.finditer(name))
+
+
+class _LabelTable:
+    """Normalized labels of a property list, flattened, with word and substring indexes."""
+
+    __slots__ = ('labels', 'owners', 'size', 'words', 'positions', 'lengths', 'joined', 'starts')
+
+    def __init__(self, properties: List[OntologyProperty]):
+        self.labels: List[str] = []
+        owners = []  # property position of each label
+        for i, prop in enumerate(properties):
+            labels = [_norm_words(label) for label in prop.get_all_labels()]
+            self.labels.extend(labels)
+            owners.extend([i] * len(labels))
+        self.owners = np.array(owners, dtype=np.intp)
+        self.size = len(properties)
+        self.words = _SetIndex([set(label.split()) for label in self.labels])
+
+        # Label -> its positions, and the label lengths present, for finding the
+        # labels contained in a name by looking up the name's substrings
+        self.positions: Dict[str, List[int]] = defaultdict(list)
+        for i, label in enumerate(self.labels):
+            self.positions[label].append(i)
+        self.positions = dict(self.positions)
+        self.lengths = sorted({len(label) for label in self.labels})
+        # All labels in one string, for finding the labels containing a name in one scan
+        self.joined = '\0'.join(self.labels)
+        self.starts = []
+        offset = 0
+        for label in self.labels:
+            self.starts.append(offset)
+            offset += len(label) + 1
+
+    def substring_matches(self, name: str) -> List[int]:
+        """Positions of the labels that contain name or are contained in it."""
+        if not name:
+            return list(range(len(self.labels)))
+        found = set()
+        for length in self.lengths:
+            if length > len(name):
+                break
+            for start in range(len(name) - length + 1):
+                found.update(self.positions.get(name[start:start + length], ()))
+        pos = self.joined.find(name)
+        while pos >= 0:
+            i = bisect_right(self.starts, pos) - 1
+            found.add(i)
+            # Continue after this label; it is already matched
+            pos = self.joined.find(name, self.starts[i] + len(self.labels[i]) + 1)
+        return list(found)
+
+    def property_max(self, label_scores: np.ndarray) -> List[float]:
+        """Highest label score of each property (0.0 for properties without labels)."""
+        best = np.zeros(self.size)
+        np.maximum.at(best, self.owners, label_scores)
+        return best.tolist()
+
+
+# Label tables are built once per property list and shared by all graph matchers
+_LABEL_TABLE_CACHE_SIZE = 16
+_LABEL_TABLES: Dict[Tuple[int, ...], Tuple[tuple, _LabelTable]] = {}
+
+
+def _label_table(properties: List[OntologyProperty]) -> _LabelTable:
+    key = tuple(map(id, properties))
+    entry = _LABEL_TABLES.get(key)
+    if entry is None:
+        if len(_LABEL_TABLES) >= _LABEL_TABLE_CACHE_SIZE:
+            _LABEL_TABLES.clear()
+        # Holding the properties keeps their ids from being reused while cached
+        entry = _LABEL_TABLES[key] = (tuple(properties), _LabelTable(properties))
+    return entry[1]
+
 
 class GraphReasoningMatcher(ColumnPropertyMatcher):
     """Advanced matcher using ontology graph structure for reasoning.
@@ -90,8 +204,9 @@ class GraphReasoningMatcher(ColumnPropertyMatcher):
         best_match = None
         best_score = 0.0
 
-        for prop in properties:
-            score = self._score_property(column, prop, context)
+        label_scores = self._label_similarities(column, properties)
+        for prop, label_score in zip(properties, label_scores):
+            score = self._score_property(column, prop, context, label_score)
 
             if score > best_score and score >= self.threshold:
                 best_score = score
@@ -112,10 +227,14 @@ class GraphReasoningMatcher(ColumnPropertyMatcher):
         self,
         column: DataFieldAnalysis,
         prop: OntologyProperty,
-        context: Optional[MatchContext]
+        context: Optional[MatchContext],
+        label_score: float
     ) -> float:
         """Score a property based on graph reasoning.
 
+        Args:
+            label_score: The property's label similarity from _label_similarities
+
         Returns:
             Score from 0.0 to 1.0
         """
@@ -147,7 +266,6 @@ class GraphReasoningMatcher(ColumnPropertyMatcher):
             weights.append(0.2)
 
         # 4. Semantic label similarity (as baseline)
-        label_score = self._score_label_similarity(column, prop)
         scores.append(label_score)
         weights.append(0.25)
 
@@ -260,49 +378,36 @@ class GraphReasoningMatcher(ColumnPropertyMatcher):
 
         return min(score, 1.0)
 
-    def _score_label_similarity(
+    def _label_similarities(
         self,
         column: DataFieldAnalysis,
-        prop: OntologyProperty
-    ) -> float:
-        """Basic label-based similarity as fallback."""
-        col_name_lower = column.name.lower().replace('_', ' ').replace('-', ' ')
-
-        # Check all labels
-        all_labels = prop.get_all_labels()
-
-        max_similarity = 0.0
-        for label in all_labels:
-            label_lower = label.lower().replace('_', ' ').replace('-', ' ')
-
-            # Exact match
-            if col_name_lower == label_lower:
-                max_similarity = max(max_similarity, 1.0)
-                continue
-
-            # Substring match
-            if col_name_lower in label_lower or label_lower in col_name_lower:
-                max_similarity = max(max_similarity, 0.7)
-                continue
-
-            # Word overlap
-            col_words = set(col_name_lower.split())
-            label_words = set(label_lower.split())
-
-            if col_words and label_words:
-                overlap = len(col_words & label_words)
-                max_words = max(len(col_words), len(label_words))
-                word_score = overlap / max_words
-                max_similarity = max(max_similarity, word_score * 0.6)
-
-        return max_similarity
+        properties: List[OntologyProperty]
+    ) -> List[float]:
+        """Basic label-based similarity as fallback, for each property."""
+        col_name_lower = _norm_words(column.name)
+        table = _label_table(properties)
+
+        # Word overlap (relative to the larger word set) with every label at once
+        col_words = set(col_name_lower.split())
+        scores = np.zeros(len(table.labels))
+        if col_words:
+            sizes = table.words.sizes
+            ratio = table.words.overlap(col_words) / np.maximum(sizes, len(col_words))
+            scores = np.where(sizes > 0, ratio * 0.6, 0.0)
+
+        # Substring match, then exact match, take precedence over word overlap
+        scores[table.substring_matches(col_name_lower)] = 0.7
+        scores[table.positions.get(col_name_lower, [])] = 1.0
+
+        # Best label of each property
+        return table.property_max(scores)
 
     def _columns_match_roughly(self, column_name: str, prop: OntologyProperty) -> bool:
         """Quick check if column name roughly matches property."""
-        col_lower = column_name.lower().replace('_', ' ')
+        col_lower = _norm_spaced(column_name)
 
         for label in prop.get_all_labels():
-            label_lower = label.lower().replace('_', ' ')
+            label_lower = _norm_spaced(label)
             if col_lower in label_lower or label_lower in col_lower:
                 return True
 
@@ -412,10 +517,10 @@ class InheritanceAwareMatcher(ColumnPropertyMatcher):
 
     def _score_property(self, column: DataFieldAnalysis, prop: OntologyProperty) -> float:
         """Score property match."""
-        col_name_lower = column.name.lower().replace('_', ' ')
+        col_name_lower = _norm_spaced(column.name)
 
         for label in prop.get_all_labels():
-            label_lower = label.lower().replace('_', ' ')
+            label_lower = _norm_spaced(label)
 
             # Exact match
             if col_name_lower == label_lower:
@@ -474,6 +579,12 @@ class GraphContextMatcher(ColumnPropertyMatcher):
 
         # Build co-occurrence cache
         self.cooccurrence_patterns: Dict[str, Set[str]] = {}
+        # Property URI -> integer id of its domain group; co-occurring properties share one
+        self._prop_domain_id: Dict[str, int] = {}
+        self._domain_count = 0
+        # Property list ids -> (properties, domain id per property (-1 if none),
+        # positions of each URI that belongs to a domain group)
+        self._list_domains: Dict[Tuple[int, ...], tuple] = {}
         self.cooccurrence_probabilities: Dict[str, Dict[str, float]] = {}
         self.property_similarities: Dict[str, List[Tuple[str, float]]] = {}
 
@@ -508,13 +619,15 @@ class GraphContextMatcher(ColumnPropertyMatcher):
                     domain_groups[str(prop.domain)].append(prop)
 
             # Build co-occurrence sets as strings for consistency with tests
-            for _domain, props in domain_groups.items():
+            self._domain_count = len(domain_groups)
+            for domain_id, props in enumerate(domain_groups.values()):
                 for prop in props:
+                    self._prop_domain_id[prop.uri_str] = domain_id
                     cooccurring: Set[str] = set()
                     for other_prop in props:
                         if other_prop.uri != prop.uri:
-                            cooccurring.add(str(other_prop.uri))
-                    self.cooccurrence_patterns[str(prop.uri)] = cooccurring
+                            cooccurring.add(other_prop.uri_str)
+                    self.cooccurrence_patterns[prop.uri_str] = cooccurring
         except Exception as e:
             import warnings
             warnings.warn(f"Failed to build co-occurrence cache: {e}")
@@ -534,26 +647,24 @@ class GraphContextMatcher(ColumnPropertyMatcher):
         base_score = 0.0
         context_boost = 0.0
 
-        for prop in properties:
-            # Base score from label similarity
-            prop_base_score = self._score_label_similarity(column, prop)
-
-            if prop_base_score < 0.3:  # Skip if label match is too weak
-                continue
-
-            # Apply context-based boosting
-            prop_context_boost = 0.0
-            if context and self.use_cooccurrence:
-                prop_context_boost = self._calculate_cooccurrence_score(prop, context)
-
-            # Final score
-            final_score = min(prop_base_score + prop_context_boost, 1.0)
-
-            if final_score > best_score and final_score >= self.threshold:
-                best_score = final_score
-                best_match = prop
-                base_score = prop_base_score
-                context_boost = prop_context_boost
+        # Base score from label similarity
+        label_scores = np.array(self._label_similarities(column, properties), dtype=np.float64)
+
+        # Apply context-based boosting
+        boosts = np.zeros(len(properties))
+        if context and self.use_cooccurrence and context.matched_properties:
+            boosts = self._cooccurrence_boosts(properties, context)
+
+        # Final score; skip properties whose label match is too weak
+        final_scores = np.minimum(label_scores + boosts, 1.0)
+        eligible = (label_scores >= 0.3) & (final_scores >= self.threshold) & (final_scores > 0.0)
+        if eligible.any():
+            # First property with the highest eligible score
+            best = int(np.argmax(np.where(eligible, final_scores, -1.0)))
+            best_match = properties[best]
+            best_score = float(final_scores[best])
+            base_score = float(label_scores[best])
+            context_boost = float(boosts[best])
 
         if best_match:
             # Determine match via string
@@ -572,6 +683,52 @@ class GraphContextMatcher(ColumnPropertyMatcher):
 
         return None
 
+    def _cooccurrence_boosts(self, properties: List[OntologyProperty], context: MatchContext) -> np.ndarray:
+        """Co-occurrence boost of every property, as _calculate_cooccurrence_score."""
+        key = tuple(map(id, properties))
+        entry = self._list_domains.get(key)
+        if entry is None:
+            positions: Dict[str, List[int]] = {}
+            domain_ids = np.full(len(properties), -1, dtype=np.intp)
+            for i, prop in enumerate(properties):
+                domain_id = self._prop_domain_id.get(prop.uri_str)
+                if domain_id is not None:
+                    domain_ids[i] = domain_id
+                    positions.setdefault(prop.uri_str, []).append(i)
+            if len(self._list_domains) >= 16:
+                self._list_domains.clear()
+            # Holding the properties keeps their ids from being reused while cached
+            entry = self._list_domains[key] = (tuple(properties), domain_ids, positions)
+        _, domain_ids, positions = entry
+
+        # Matched properties in each property's domain group, other than itself;
+        # the extra last slot (index -1) is for properties without a domain
+        domain_counts, uri_counts = self._count_matched_domains(context)
+        per_domain = np.zeros(self._domain_count + 1, dtype=np.int64)
+        for domain_id, count in domain_counts.items():
+            per_domain[domain_id] = count
+        matched_cooccurring = per_domain[domain_ids]
+        for uri, count in uri_counts.items():
+            for i in positions.get(uri, ()):
+                matched_cooccurring[i] -= count
+
+        boost_ratio = np.minimum(matched_cooccurring / 3.0, 1.0)
+        return np.where(matched_cooccurring > 0, boost_ratio * self.cooccurrence_boost, 0.0)
+
+    def _count_matched_domains(self, context: MatchContext) -> Tuple[Counter, Counter]:
+        """Count already matched properties per domain id and per URI (cached on the context)."""
+        def build() -> Tuple[Counter, Counter]:
+            uri_counts = Counter(context.matched_properties.values())
+            domain_counts: Counter = Counter()
+            for uri, count in uri_counts.items():
+                domain_id = self._prop_domain_id.get(uri)
+                if domain_id is not None:
+                    domain_counts[domain_id] += count
+            return domain_counts, uri_counts
+
+        # Domain ids are per matcher, so the matcher is part of the key
+        return context.derived(('matched_domains', self), build)
+
     def _calculate_cooccurrence_score(
         self,
         prop: OntologyProperty,
@@ -589,85 +746,47 @@ class GraphContextMatcher(ColumnPropertyMatcher):
         if not context.matched_properties:
             return 0.0
 
-        cooccurring = self.cooccurrence_patterns.get(str(prop.uri), set())
-        if not cooccurring:
+        domain_id = self._prop_domain_id.get(prop.uri_str)
+        if domain_id is None:
             return 0.0
 
-        matched_cooccurring = 0
-        for matched_prop_uri in context.matched_properties.values():
-            if matched_prop_uri in cooccurring:
-                matched_cooccurring += 1
+        # Co-occurring properties are the others in the same domain group
+        domain_counts, uri_counts = self._count_matched_domains(context)
+        matched_cooccurring = domain_counts[domain_id] - uri_counts[prop.uri_str]
         if matched_cooccurring == 0:
             return 0.0
         boost_ratio = min(matched_cooccurring / 3.0, 1.0)
         return boost_ratio * self.cooccurrence_boost
 
-    def _score_label_similarity(
+    def _label_similarities(
         self,
         column: DataFieldAnalysis,
-        prop: OntologyProperty
-    ) -> float:
-        # Enhanced label similarity with common abbreviations
-        col_name_lower = column.name.lower().replace('_', ' ').replace('-', ' ')
-
-        # Abbreviation and synonym expansions
-        expansions = {
-            'fname': 'first name',
-            'first name': 'first name',
-            'lname': 'last name',
-            'last name': 'last name',
-            'mname': 'middle name',
-            'middle initial': 'middle name',
-            'dob': 'birth date',
-            'birth date': 'birth date',
-            'birth city': 'birth place',
-            'birth place': 'birth place',
-            'email address': 'email',
-            'phone': 'phone number',
-            'phone number': 'phone number',
-            'postal code': 'zip code',
-            'zipcode': 'zip code',
-            'zip': 'zip code',
-            'city name': 'city',
-            'address': 'street address',
-        }
-
-        expanded_terms = set()
-        for key, val in expansions.items():
-            if key in col_name_lower:
-                expanded_terms.add(val)
-
-        all_labels = prop.get_all_labels()
-        max_similarity = 0.0
-        for label in all_labels:
-            label_lower = label.lower().replace('_', ' ').replace('-', ' ')
-
-            # Direct abbreviation/synonym match boost
-            if label_lower in expanded_terms:
-                max_similarity = max(max_similarity, 0.85)
-                continue
-
-            # Exact match
-            if col_name_lower == label_lower:
-                max_similarity = max(max_similarity, 1.0)
-                continue
-
-            # Substring match
-            if col_name_lower in label_lower or label_lower in col_name_lower:
-                max_similarity = max(max_similarity, 0.8)
-                continue
-
-            # Word overlap
-            col_words = set(col_name_lower.split())
-            label_words = set(label_lower.split())
-            if col_words and label_words:
-                overlap = len(col_words & label_words)
-                total = len(col_words | label_words)
-                if total > 0:
-                    word_score = overlap / total
-                    max_similarity = max(max_similarity, word_score * 0.7)
-
-        return max_similarity
+        properties: List[OntologyProperty]
+    ) -> List[float]:
+        # Enhanced label similarity with common abbreviations, for each property
+        col_name_lower = _norm_words(column.name)
+
+        # Abbreviation and synonym expansions found in the column name
+        expanded_terms = _expanded_terms(col_name_lower)
+
+        table = _label_table(properties)
+
+        # Word overlap (Jaccard) with every label at once
+        col_words = set(col_name_lower.split())
+        scores = np.zeros(len(table.labels))
+        if col_words:
+            _, jaccard = table.words.jaccard(col_words)
+            scores = np.where(table.words.sizes > 0, jaccard * 0.7, 0.0)
+
+        # Later assignments take precedence: substring, exact, then a direct
+        # abbreviation/synonym match (0.85 even for a label that is also exact)
+        scores[table.substring_matches(col_name_lower)] = 0.8
+        scores[table.positions.get(col_name_lower, [])] = 1.0
+        for term in expanded_terms:
+            scores[table.positions.get(term, [])] = 0.85
+
+        # Best label of each property
+        return table.property_max(scores)
 
     def _build_probabilistic_knowledge_base(self):
         """Build probabilistic knowledge base for Bayesian reasoning."""
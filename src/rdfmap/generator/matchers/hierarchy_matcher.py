@@ -9,7 +9,7 @@ This matcher leverages property hierarchies defined in ontologies to:
 
 from typing import Optional, List, Dict, Set
 from rdflib import RDF, RDFS, Namespace
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _norm_compact, _norm_local
 from ..ontology_analyzer import OntologyProperty, OntologyAnalyzer
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
@@ -159,7 +159,7 @@ class PropertyHierarchyMatcher(ColumnPropertyMatcher):
 
     def _get_hierarchy_info(self, prop: OntologyProperty) -> Dict:
         """Get hierarchy information for a property."""
-        return self._hierarchy_cache.get(str(prop.uri), {
+        return self._hierarchy_cache.get(prop.uri_str, {
             'parents': set(),
             'children': set(),
             'ancestors': set(),
@@ -228,7 +228,8 @@ class PropertyHierarchyMatcher(ColumnPropertyMatcher):
             return None
 
         col_name_lower = column.name.lower()
-        col_name_normalized = col_name_lower.replace('_', '').replace('-', '').replace(' ', '')
+        col_name_normalized = _norm_compact(col_name_lower)
+        col_name_no_underscores = _norm_local(col_name_lower)
         best_match = None
         best_confidence = 0.0
         alternatives = []
@@ -239,8 +240,7 @@ class PropertyHierarchyMatcher(ColumnPropertyMatcher):
             labels = prop.get_all_labels()
             if not labels:
                 # If no labels, try to extract from URI
-                uri_str = str(prop.uri)
-                local_name = uri_str.split('#')[-1].split('/')[-1]
+                local_name = prop.local_name
                 if local_name:
                     labels = [local_name]
 
@@ -252,7 +252,7 @@ class PropertyHierarchyMatcher(ColumnPropertyMatcher):
                     continue
 
                 label_lower = label.lower()
-                label_normalized = label_lower.replace('_', '').replace('-', '').replace(' ', '')
+                label_normalized = _norm_compact(label_lower)
 
                 # Also create version without common prefixes
                 label_no_has = label_lower
@@ -261,7 +261,7 @@ class PropertyHierarchyMatcher(ColumnPropertyMatcher):
                 elif label_lower.startswith('has'):
                     label_no_has = label_lower[3:]  # Remove "has"
 
-                label_no_has_normalized = label_no_has.replace('_', '').replace('-', '').replace(' ', '')
+                label_no_has_normalized = _norm_compact(label_no_has)
 
                 # Try multiple matching strategies
                 is_exact = (
@@ -275,8 +275,8 @@ class PropertyHierarchyMatcher(ColumnPropertyMatcher):
                     col_name_normalized == label_normalized or
                     col_name_normalized == label_no_has_normalized or
                     # Column with underscores matches label without spaces
-                    col_name_lower.replace('_', '') == label_lower.replace(' ', '') or
-                    col_name_lower.replace('_', '') == label_no_has.replace(' ', '')
+                    col_name_no_underscores == label_lower.replace(' ', '') or
+                    col_name_no_underscores == label_no_has.replace(' ', '')
                 )
 
                 if is_exact:
@@ -27,10 +27,22 @@ class HistoryAwareMatcher(ColumnPropertyMatcher):
         Args:
             enabled: Whether this matcher is active
             threshold: Minimum confidence for matches (0-1)
-            history_db: MappingHistory instance (creates default if None)
+            history_db: MappingHistory instance (creates default on first use if None)
         """
         super().__init__(enabled, threshold)
-        self.history = history_db or MappingHistory()
+        # Opening the default database creates ~/.rdfmap and its tables, so a
+        # disabled matcher never does it and an enabled one waits until it matches
+        self._history = history_db
+
+    @property
+    def history(self) -> MappingHistory:
+        if self._history is None:
+            self._history = MappingHistory()
+        return self._history
+
+    @history.setter
+    def history(self, value: MappingHistory) -> None:
+        self._history = value
 
     def name(self) -> str:
         return "HistoryAwareMatcher"
@@ -65,39 +77,42 @@ class HistoryAwareMatcher(ColumnPropertyMatcher):
             return None
 
         # Look for matching properties in current options
+        by_uri: Dict[str, OntologyProperty] = {}
+        for prop in properties:
+            by_uri.setdefault(prop.uri_str, prop)
         for historical in similar_mappings:
-            for prop in properties:
-                if str(prop.uri) == historical['property_uri']:
-                    # Found a historical match!
-
-                    # Get success rate for this property
-                    success_rate = self.history.get_property_success_rate(
-                        historical['property_uri']
+            prop = by_uri.get(historical['property_uri'])
+            if prop is not None:
+                # Found a historical match!
+
+                # Get success rate for this property
+                success_rate = self.history.get_property_success_rate(
+                    historical['property_uri']
+                )
+
+                # Calculate confidence based on:
+                # - Historical confidence (50%)
+                # - Success rate (30%)
+                # - Recency bonus (20%)
+                base_confidence = historical['confidence']
+                confidence = (
+                    base_confidence * 0.5 +
+                    success_rate * 0.3 +
+                    0.2  # Recency bonus for exact match
+                )
+
+                # Cap at 0.95 (never claim perfect certainty from history alone)
+                confidence = min(confidence, 0.95)
+
+                if confidence >= self.threshold:
+                    return MatchResult(
+                        property=prop,
+                        match_type=MatchType.SEMANTIC_SIMILARITY,  # Could add HISTORICAL
+                        confidence=confidence,
+                        matched_via=f"historical match (success rate: {success_rate:.2f})",
+                        matcher_name=self.name()
                     )
 
-                    # Calculate confidence based on:
-                    # - Historical confidence (50%)
-                    # - Success rate (30%)
-                    # - Recency bonus (20%)
-                    base_confidence = historical['confidence']
-                    confidence = (
-                        base_confidence * 0.5 +
-                        success_rate * 0.3 +
-                        0.2  # Recency bonus for exact match
-                    )
-
-                    # Cap at 0.95 (never claim perfect certainty from history alone)
-                    confidence = min(confidence, 0.95)
-
-                    if confidence >= self.threshold:
-                        return MatchResult(
-                            property=prop,
-                            match_type=MatchType.SEMANTIC_SIMILARITY,  # Could add HISTORICAL
-                            confidence=confidence,
-                            matched_via=f"historical match (success rate: {success_rate:.2f})",
-                            matcher_name=self.name()
-                        )
-
         return None
 
     def boost_confidence(
@@ -118,7 +133,7 @@ class HistoryAwareMatcher(ColumnPropertyMatcher):
         """
         # Check if this property was successful historically
         success_rate = self.history.get_property_success_rate(
-            str(result.property.uri)
+            result.property.uri_str
         )
 
         if success_rate > 0.7:  # High historical success
@@ -175,6 +190,6 @@ class HistoryAwareMatcher(ColumnPropertyMatcher):
 
     def close(self):
         """Close the history database connection."""
-        if self.history:
-            self.history.close()
+        if self._history:
+            self._history.close()
 
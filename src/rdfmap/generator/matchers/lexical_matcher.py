@@ -4,11 +4,45 @@ from typing import Optional, List, Dict, Set
 from difflib import SequenceMatcher
 import re
 
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+import numpy as np
+
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _SetIndex, _norm_words
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
 
+# Normalized forms kept per matcher before the cache is reset
+_FORMS_CACHE_SIZE = 16384
+
+
+class _TextForms:
+    """Normalized variants of one text used by the lexical algorithms."""
+
+    __slots__ = ('norm', 'compact', 'tokens', 'bigrams')
+
+    def __init__(self, norm: str, compact: str, tokens: Set[str], bigrams: Set[str]):
+        self.norm = norm  # lowercase, '_' and '-' as spaces, stripped
+        self.compact = compact  # norm without spaces
+        self.tokens = tokens  # words of norm with id/identifier/num synonyms folded
+        self.bigrams = bigrams  # character bigrams of compact
+
+
+class _PropertyTable:
+    """Forms of every text of a property list, flattened, with set indexes over them."""
+
+    __slots__ = ('properties', 'forms', 'spans', 'tokens', 'bigrams')
+
+    def __init__(self, properties: List[OntologyProperty], prop_forms: List[List[_TextForms]]):
+        self.properties = properties
+        self.forms: List[_TextForms] = []
+        self.spans: List[range] = []
+        for texts in prop_forms:
+            start = len(self.forms)
+            self.forms.extend(texts)
+            self.spans.append(range(start, len(self.forms)))
+        self.tokens = _SetIndex([forms.tokens for forms in self.forms])
+        self.bigrams = _SetIndex([forms.bigrams for forms in self.forms])
+
 
 class LexicalMatcher(ColumnPropertyMatcher):
     """Pure lexical/string similarity matching using multiple algorithms.
@@ -50,6 +84,12 @@ class LexicalMatcher(ColumnPropertyMatcher):
         self.token_weight = token_weight
         self.edit_distance_weight = edit_distance_weight
         self.ngram_weight = ngram_weight
+        # Text -> normalized forms, and property id -> (property, forms of its texts);
+        # property texts do not change between columns
+        self._forms: Dict[str, _TextForms] = {}
+        self._prop_forms: Dict[int, tuple] = {}
+        # Property list identity -> flattened table; the same list is scored for every column
+        self._tables: Dict[tuple, _PropertyTable] = {}
 
     def name(self) -> str:
         return "LexicalMatcher"
@@ -78,16 +118,17 @@ class LexicalMatcher(ColumnPropertyMatcher):
 
         scores = self._compute_all_scores(column, properties)
 
-        # Find best match
+        # Find best match: first property with the highest positive final score
+        uris = list(scores)
+        final_scores = np.fromiter(
+            (info['final_score'] for info in scores.values()), dtype=np.float64, count=len(uris)
+        )
+        best = int(np.argmax(final_scores))
+        best_score = float(final_scores[best])
         best_prop = None
-        best_score = 0.0
-        best_method = None
-
-        for prop_uri, score_info in scores.items():
-            if score_info['final_score'] > best_score:
-                best_score = score_info['final_score']
-                best_prop = next(p for p in properties if str(p.uri) == prop_uri)
-                best_method = score_info['best_method']
+        if best_score > 0.0:
+            best_prop = next(p for p in properties if p.uri_str == uris[best])
+            best_method = scores[uris[best]]['best_method']
 
         if best_score >= self.threshold and best_prop:
             return MatchResult(
@@ -119,14 +160,15 @@ class LexicalMatcher(ColumnPropertyMatcher):
                 'ngram': float
             }
         """
-        col_name = column.name
+        col = self._text_forms(column.name)
+        table = self._property_table(properties)
+        # Token and bigram Jaccard for every property text at once
+        token_scores = self._token_scores(col, table.tokens).tolist()
+        ngram_scores = self._ngram_scores(col, table.bigrams).tolist()
         scores = {}
 
-        for prop in properties:
-            prop_uri = str(prop.uri)
-
-            # Get all text representations of the property
-            prop_texts = self._get_property_texts(prop)
+        for prop, span in zip(properties, table.spans):
+            prop_uri = prop.uri_str
 
             # Compute scores using all algorithms
             algo_scores = {
@@ -137,17 +179,17 @@ class LexicalMatcher(ColumnPropertyMatcher):
                 'ngram': 0.0
             }
 
-            for prop_text in prop_texts:
+            # Every text representation of the property
+            for i in span:
+                prop_text = table.forms[i]
                 algo_scores['exact'] = max(algo_scores['exact'],
-                                          self._exact_match(col_name, prop_text))
+                                          self._exact_match(col, prop_text))
                 algo_scores['substring'] = max(algo_scores['substring'],
-                                               self._substring_match(col_name, prop_text))
-                algo_scores['token'] = max(algo_scores['token'],
-                                          self._token_match(col_name, prop_text))
+                                               self._substring_match(col, prop_text))
+                algo_scores['token'] = max(algo_scores['token'], token_scores[i])
                 algo_scores['edit_distance'] = max(algo_scores['edit_distance'],
-                                                   self._edit_distance_match(col_name, prop_text))
-                algo_scores['ngram'] = max(algo_scores['ngram'],
-                                          self._ngram_match(col_name, prop_text))
+                                                   self._edit_distance_match(col, prop_text))
+                algo_scores['ngram'] = max(algo_scores['ngram'], ngram_scores[i])
 
             # Apply weights and find best
             weighted_scores = {
@@ -187,7 +229,7 @@ class LexicalMatcher(ColumnPropertyMatcher):
             texts.append(label.lower().strip())
 
         # Add local name with camelCase splitting
-        local_name = str(prop.uri).split('#')[-1].split('/')[-1]
+        local_name = prop.local_name
         local_split = re.sub(r'([a-z])([A-Z])', r'\1 \2', local_name).lower()
         texts.append(local_split)
         if local_split != local_name.lower():
@@ -195,20 +237,55 @@ class LexicalMatcher(ColumnPropertyMatcher):
 
         return texts
 
+    def _property_forms(self, prop: OntologyProperty) -> List[_TextForms]:
+        """Normalized forms of a property's texts, computed once per property."""
+        entry = self._prop_forms.get(id(prop))
+        if entry is None or entry[0] is not prop:
+            if len(self._prop_forms) >= _FORMS_CACHE_SIZE:
+                self._prop_forms.clear()
+            entry = self._prop_forms[id(prop)] = (
+                prop, [self._text_forms(text) for text in self._get_property_texts(prop)]
+            )
+        return entry[1]
+
+    def _property_table(self, properties: List[OntologyProperty]) -> _PropertyTable:
+        key = tuple(map(id, properties))
+        table = self._tables.get(key)
+        if table is None or any(a is not b for a, b in zip(table.properties, properties)):
+            if len(self._tables) >= 16:
+                self._tables.clear()
+            table = self._tables[key] = _PropertyTable(
+                list(properties), [self._property_forms(prop) for prop in properties]
+            )
+        return table
+
+    def _text_forms(self, text: str) -> _TextForms:
+        forms = self._forms.get(text)
+        if forms is None:
+            norm = self._normalize(text)
+            compact = norm.replace(' ', '')
+            if len(self._forms) >= _FORMS_CACHE_SIZE:
+                self._forms.clear()
+            forms = self._forms[text] = _TextForms(
+                norm,
+                compact,
+                self._normalize_tokens(set(norm.split())),
+                self._get_ngrams(compact, 2),
+            )
+        return forms
+
     def _normalize(self, text: str) -> str:
         """Normalize text for matching."""
-        return text.lower().replace('_', ' ').replace('-', ' ').strip()
+        return _norm_words(text).strip()
 
-    def _exact_match(self, col_name: str, prop_text: str) -> float:
+    def _exact_match(self, col: _TextForms, prop: _TextForms) -> float:
         """Algorithm 1: Exact match (normalized)."""
-        col_norm = self._normalize(col_name).replace(' ', '')
-        prop_norm = self._normalize(prop_text).replace(' ', '')
-        return 0.95 if col_norm == prop_norm else 0.0
+        return 0.95 if col.compact == prop.compact else 0.0
 
-    def _substring_match(self, col_name: str, prop_text: str) -> float:
+    def _substring_match(self, col: _TextForms, prop: _TextForms) -> float:
         """Algorithm 2: Substring containment with ratio scoring."""
-        col_norm = self._normalize(col_name)
-        prop_norm = self._normalize(prop_text)
+        col_norm = col.norm
+        prop_norm = prop.norm
 
         if col_norm in prop_norm:
             # Column is substring of property
@@ -221,31 +298,17 @@ class LexicalMatcher(ColumnPropertyMatcher):
 
         return 0.0
 
-    def _token_match(self, col_name: str, prop_text: str) -> float:
+    def _token_scores(self, col: _TextForms, index: _SetIndex) -> np.ndarray:
         """Algorithm 3: Token-based Jaccard with synonym normalization."""
-        col_tokens = set(self._normalize(col_name).split())
-        prop_tokens = set(self._normalize(prop_text).split())
-
-        # Normalize synonyms (id/identifier/number are equivalent)
-        col_tokens_norm = self._normalize_tokens(col_tokens)
-        prop_tokens_norm = self._normalize_tokens(prop_tokens)
-
-        if not col_tokens_norm or not prop_tokens_norm:
-            return 0.0
-
-        intersection = col_tokens_norm & prop_tokens_norm
-        union = col_tokens_norm | prop_tokens_norm
-
-        if len(intersection) == 0:
-            return 0.0
-
-        jaccard = len(intersection) / len(union)
+        # Synonyms (id/identifier/number are equivalent) are already folded
+        col_tokens_norm = col.tokens
+        if not col_tokens_norm:
+            return np.zeros(len(index.sizes))
 
+        overlap, jaccard = index.jaccard(col_tokens_norm)
         # Boost if all column tokens are in property
-        if col_tokens_norm.issubset(prop_tokens_norm):
-            return 0.75 + (jaccard * 0.15)
-
-        return jaccard * 0.70
+        scores = np.where(overlap == len(col_tokens_norm), 0.75 + (jaccard * 0.15), jaccard * 0.70)
+        return np.where((overlap > 0) & (index.sizes > 0), scores, 0.0)
 
     def _normalize_tokens(self, tokens: Set[str]) -> Set[str]:
         """Normalize tokens with synonym equivalence."""
@@ -258,12 +321,13 @@ class LexicalMatcher(ColumnPropertyMatcher):
                 normalized.add(token)
         return normalized
 
-    def _edit_distance_match(self, col_name: str, prop_text: str) -> float:
+    def _edit_distance_match(self, col: _TextForms, prop: _TextForms) -> float:
         """Algorithm 4: Edit distance (SequenceMatcher)."""
-        col_norm = self._normalize(col_name)
-        prop_norm = self._normalize(prop_text)
-
-        ratio = SequenceMatcher(None, col_norm, prop_norm).ratio()
+        # ratio() never exceeds 2*min(len)/total, so clearly dissimilar lengths skip the diff
+        total = len(col.norm) + len(prop.norm)
+        if total and 2 * min(len(col.norm), len(prop.norm)) / total <= 0.60:
+            return 0.0
+        ratio = SequenceMatcher(None, col.norm, prop.norm).ratio()
 
         # Only consider if reasonably similar
         if ratio > 0.60:
@@ -271,26 +335,11 @@ class LexicalMatcher(ColumnPropertyMatcher):
 
         return 0.0
 
-    def _ngram_match(self, col_name: str, prop_text: str) -> float:
+    def _ngram_scores(self, col: _TextForms, index: _SetIndex) -> np.ndarray:
         """Algorithm 5: Character n-gram similarity (bigrams)."""
-        col_norm = self._normalize(col_name).replace(' ', '')
-        prop_norm = self._normalize(prop_text).replace(' ', '')
-
-        col_bigrams = self._get_ngrams(col_norm, 2)
-        prop_bigrams = self._get_ngrams(prop_norm, 2)
-
-        if not col_bigrams or not prop_bigrams:
-            return 0.0
-
-        intersection = col_bigrams & prop_bigrams
-        union = col_bigrams | prop_bigrams
-
-        jaccard = len(intersection) / len(union)
-
-        if jaccard > 0.50:
-            return jaccard * 0.75
-
-        return 0.0
+        # _get_ngrams never returns an empty set
+        _, jaccard = index.jaccard(col.bigrams)
+        return np.where(jaccard > 0.50, jaccard * 0.75, 0.0)
 
     def _get_ngrams(self, text: str, n: int) -> Set[str]:
         """Generate character n-grams from text."""
@@ -9,7 +9,7 @@ This matcher leverages OWL property characteristics to:
 
 from typing import Optional, List, Dict, Set
 from rdflib import OWL, RDF
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _norm_compact, _norm_local
 from ..ontology_analyzer import OntologyProperty, OntologyAnalyzer
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
@@ -117,7 +117,7 @@ class OWLCharacteristicsMatcher(ColumnPropertyMatcher):
 
     def _get_owl_info(self, prop: OntologyProperty) -> Dict:
         """Get OWL characteristics for a property."""
-        return self._owl_cache.get(str(prop.uri), {
+        return self._owl_cache.get(prop.uri_str, {
             'is_functional': False,
             'is_inverse_functional': False,
             'is_transitive': False,
@@ -226,7 +226,8 @@ class OWLCharacteristicsMatcher(ColumnPropertyMatcher):
             return None
 
         col_name_lower = column.name.lower()
-        col_name_normalized = col_name_lower.replace('_', '').replace('-', '').replace(' ', '')
+        col_name_normalized = _norm_compact(col_name_lower)
+        col_name_no_underscores = _norm_local(col_name_lower)
 
         # Calculate column characteristics
         uniqueness_ratio = self._calculate_uniqueness_ratio(column)
@@ -242,8 +243,7 @@ class OWLCharacteristicsMatcher(ColumnPropertyMatcher):
             # Get all labels
             labels = prop.get_all_labels()
             if not labels:
-                uri_str = str(prop.uri)
-                local_name = uri_str.split('#')[-1].split('/')[-1]
+                local_name = prop.local_name
                 if local_name:
                     labels = [local_name]
 
@@ -255,14 +255,14 @@ class OWLCharacteristicsMatcher(ColumnPropertyMatcher):
                 label_lower = label.lower()
                 label_no_has = label_lower[4:] if label_lower.startswith('has ') else label_lower
                 label_no_has = label_no_has[3:] if label_no_has.startswith('has') else label_no_has
-                label_normalized = label_no_has.replace('_', '').replace('-', '').replace(' ', '')
+                label_normalized = _norm_compact(label_no_has)
 
                 # Check for label match
                 is_match = (
                     col_name_lower == label_lower or
                     col_name_lower == label_no_has or
                     col_name_normalized == label_normalized or
-                    col_name_lower.replace('_', '') == label_no_has.replace(' ', '') or
+                    col_name_no_underscores == label_no_has.replace(' ', '') or
                     label_no_has in col_name_lower or
                     col_name_lower in label_no_has
                 )
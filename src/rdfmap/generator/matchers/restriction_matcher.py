@@ -44,7 +44,7 @@ class RestrictionBasedMatcher(ColumnPropertyMatcher):
 
     def _score_property(self, column: DataFieldAnalysis, prop: OntologyProperty) -> float:
         base = 0.0
-        uri = str(prop.uri)
+        uri = prop.uri_str
         restrictions = self.ontology.property_restrictions.get(uri, [])
         if not restrictions:
             return base  # no boost if no restrictions known
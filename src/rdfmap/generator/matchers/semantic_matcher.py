@@ -5,11 +5,18 @@ import logging
 from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
-from ..semantic_matcher import SemanticMatcher as EmbeddingsMatcher
+from ..semantic_matcher import (
+    SemanticMatcher as EmbeddingsMatcher,
+    default_embeddings_dir,
+    persist_embeddings_enabled,
+)
 from ...models.alignment import MatchType
 
 logger = logging.getLogger(__name__)
 
+# Best-match entries kept per matcher before the cache is reset
+_BEST_CACHE_SIZE = 4096
+
 
 class SemanticSimilarityMatcher(ColumnPropertyMatcher):
     """Pure embedding-based semantic matcher.
@@ -29,9 +36,13 @@ class SemanticSimilarityMatcher(ColumnPropertyMatcher):
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         reasoner=None,
         domain_boost: float = 0.1,
-        cooccurrence_boost: float = 0.05
+        cooccurrence_boost: float = 0.05,
+        use_fp16: bool = True,
+        persist_embeddings: Optional[bool] = None
     ):
         super().__init__(enabled, threshold)
+        if persist_embeddings is None:
+            persist_embeddings = persist_embeddings_enabled()
         self.reasoner = reasoner
         self.domain_boost = domain_boost
         self.cooccurrence_boost = cooccurrence_boost
@@ -40,11 +51,20 @@ class SemanticSimilarityMatcher(ColumnPropertyMatcher):
         self._embeddings_matcher = None
         if enabled:
             try:
-                self._embeddings_matcher = EmbeddingsMatcher(model_name)
+                self._embeddings_matcher = EmbeddingsMatcher(
+                    model_name,
+                    use_fp16=use_fp16,
+                    # Opt-in: property embeddings are saved and reloaded on later runs
+                    persist_dir=default_embeddings_dir() if persist_embeddings else None
+                )
             except Exception as e:
                 logger.warning(f"Failed to load embeddings model: {e}. SemanticSimilarityMatcher will be disabled.")
                 self.enabled = False
 
+        # (column text, column name, property ids) -> (properties, best entry); repeated
+        # columns against the same property list skip encoding and scoring
+        self._best_cache: Dict[tuple, tuple] = {}
+
         # Build property domain cache for context awareness
         self._prop_domain: Dict[str, Optional[str]] = {}
         if reasoner:
@@ -73,13 +93,12 @@ class SemanticSimilarityMatcher(ColumnPropertyMatcher):
         if not self.enabled or not properties or not self._embeddings_matcher:
             return None
 
-        # Use enhanced scoring (phrase + token + id_boost)
-        enriched = self._embeddings_matcher.enhanced_score_all(column, properties)
-        if not enriched:
+        # Use enhanced scoring (phrase + token + id_boost); only the best entry is built
+        best = self._best_score(column, properties)
+        if best is None:
             return None
 
         # Pick best combined score above threshold
-        best = enriched[0]
         if best['combined'] >= self.threshold:
             matched_prop = best['property']
 
@@ -101,3 +120,14 @@ class SemanticSimilarityMatcher(ColumnPropertyMatcher):
 
         return None
 
+    def _best_score(self, column: DataFieldAnalysis, properties: List[OntologyProperty]) -> Optional[dict]:
+        embeddings = self._embeddings_matcher
+        key = (embeddings._column_text(column), column.name, tuple(map(id, properties)))
+        entry = self._best_cache.get(key)
+        if entry is None or any(a is not b for a, b in zip(entry[0], properties)):
+            if len(self._best_cache) >= _BEST_CACHE_SIZE:
+                self._best_cache.clear()
+            entry = self._best_cache[key] = (
+                tuple(properties), embeddings.best_enhanced_score(column, properties)
+            )
+        return entry[1]
@@ -3,7 +3,7 @@
 Boosts properties whose SKOS relations align with column naming or context.
 """
 from typing import Optional, List
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _norm_words, _uri_local_name
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
@@ -21,7 +21,7 @@ class SKOSRelationsMatcher(ColumnPropertyMatcher):
     def match(self, column: DataFieldAnalysis, properties: List[OntologyProperty], context: Optional[MatchContext] = None) -> Optional[MatchResult]:
         if not self.enabled:
             return None
-        col_norm = column.name.lower().replace('_',' ').replace('-',' ')
+        col_norm = _norm_words(column.name)
         best_prop = None
         best_score = 0.0
         for prop in properties:
@@ -43,7 +43,7 @@ class SKOSRelationsMatcher(ColumnPropertyMatcher):
         score = 0.0
         # Direct label overlap baseline
         for label in prop.get_all_labels():
-            lnorm = label.lower().replace('_',' ').replace('-',' ')
+            lnorm = _norm_words(label)
             if col_norm == lnorm:
                 score = max(score, 0.8)
             elif col_norm in lnorm or lnorm in col_norm:
@@ -57,7 +57,7 @@ class SKOSRelationsMatcher(ColumnPropertyMatcher):
             (prop.related, 0.1)
         ]:
             for uri in rel_list:
-                local = uri.split('#')[-1].split('/')[-1].lower()
+                local = _uri_local_name(uri)
                 if local in col_norm or col_norm in local:
                     score += boost
         return min(score, 1.0)
@@ -8,7 +8,7 @@ import re
 from typing import Optional, List, Set, Tuple
 from collections import Counter
 
-from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority
+from .base import ColumnPropertyMatcher, MatchResult, MatchContext, MatchPriority, _norm, _norm_local
 from ..ontology_analyzer import OntologyProperty
 from ..data_analyzer import DataFieldAnalysis
 from ...models.alignment import MatchType
@@ -218,11 +218,11 @@ class StructuralMatcher(ColumnPropertyMatcher):
         Returns:
             Confidence score (0-1)
         """
-        base_clean = base_name.lower().replace('_', '').replace(' ', '')
+        base_clean = _norm(base_name)
 
         # Check property label
         if prop.label:
-            prop_clean = prop.label.lower().replace('_', '').replace(' ', '')
+            prop_clean = _norm(prop.label)
 
             # Check for "has" prefix pattern: "hasBorrower" matches "borrower"
             if prop_clean.startswith('has') and base_clean in prop_clean:
@@ -234,7 +234,7 @@ class StructuralMatcher(ColumnPropertyMatcher):
 
         # Check prefLabel
         if prop.pref_label:
-            pref_clean = prop.pref_label.lower().replace('_', '').replace(' ', '')
+            pref_clean = _norm(prop.pref_label)
             if prop_clean.startswith('has') and base_clean in pref_clean:
                 return 0.88
             if base_clean in pref_clean or pref_clean in base_clean:
@@ -242,13 +242,12 @@ class StructuralMatcher(ColumnPropertyMatcher):
 
         # Check altLabels
         for alt_label in prop.alt_labels:
-            alt_clean = alt_label.lower().replace('_', '').replace(' ', '')
+            alt_clean = _norm(alt_label)
             if base_clean in alt_clean or alt_clean in base_clean:
                 return 0.80
 
         # Check local name
-        local_name = str(prop.uri).split('#')[-1].split('/')[-1]
-        local_clean = local_name.lower().replace('_', '')
+        local_clean = _norm_local(prop.local_name)
 
         if base_clean in local_clean or local_clean in base_clean:
             return 0.75
@@ -1,6 +1,6 @@
 """Ontology analyzer for extracting classes and properties."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from rdflib import Graph, Namespace, RDF, RDFS, OWL
 from rdflib.term import URIRef
 
@@ -10,7 +10,12 @@ SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
 
 class OntologyClass:
     """Represents a class from the ontology."""
-    
+
+    __slots__ = (
+        'uri', 'label', 'comment', 'pref_label', 'alt_labels', 'hidden_labels', 'properties',
+        'uri_str', 'local_name',
+    )
+
     def __init__(
         self, 
         uri: URIRef, 
@@ -27,6 +32,8 @@ class OntologyClass:
         self.alt_labels = alt_labels or []  # SKOS alternative labels
         self.hidden_labels = hidden_labels or []  # SKOS hidden labels
         self.properties: List['OntologyProperty'] = []
+        self.uri_str = str(uri)
+        self.local_name = self.uri_str.split("#")[-1].split("/")[-1]
     
     def get_all_labels(self) -> List[str]:
         """Get all labels (preferred, rdfs, alternative) for matching."""
@@ -45,7 +52,15 @@ class OntologyClass:
 
 class OntologyProperty:
     """Represents a property from the ontology."""
-    
+
+    __slots__ = (
+        'uri', 'label', 'comment', 'domain', 'range_type', 'is_object_property',
+        'pref_label', 'alt_labels', 'hidden_labels', 'broader', 'narrower', 'related',
+        'exact_matches', 'close_matches', 'definition', 'is_functional',
+        'is_inverse_functional', 'is_symmetric', 'is_transitive', 'inverse_of',
+        'uri_str', 'local_name',
+    )
+
     def __init__(
         self,
         uri: URIRef,
@@ -89,6 +104,9 @@ class OntologyProperty:
         self.is_symmetric = is_symmetric
         self.is_transitive = is_transitive
         self.inverse_of = inverse_of
+        # Computed once here; matchers compare against these for every column
+        self.uri_str = str(uri)
+        self.local_name = self.uri_str.split("#")[-1].split("/")[-1]
 
     def get_all_labels(self) -> List[str]:
         """Get all labels (preferred, rdfs, alternative, hidden) for matching."""
@@ -136,6 +154,11 @@ class OntologyAnalyzer:
         self.classes: Dict[URIRef, OntologyClass] = {}
         self.properties: Dict[URIRef, OntologyProperty] = {}
         self.property_restrictions: Dict[str, List[Dict[str, any]]] = {}
+        # Lookups memoized after analysis; the graph is not modified afterwards
+        self._class_props: Dict[Tuple[Optional[URIRef], bool], List[OntologyProperty]] = {}
+        self._namespaces: Optional[Dict[str, str]] = None
+        self._classes_by_label: Optional[Dict[str, OntologyClass]] = None
+        self._classes_by_uri: Optional[Dict[str, OntologyClass]] = None
 
         self._analyze()
     
@@ -286,11 +309,26 @@ class OntologyAnalyzer:
     
     def get_class_by_label(self, label: str) -> Optional[OntologyClass]:
         """Get a class by its label (case-insensitive)."""
-        label_lower = label.lower()
-        for cls in self.classes.values():
-            if cls.label and cls.label.lower() == label_lower:
-                return cls
-        return None
+        if self._classes_by_label is None:
+            by_label: Dict[str, OntologyClass] = {}
+            for cls in self.classes.values():
+                if cls.label:
+                    by_label.setdefault(cls.label.lower(), cls)
+            self._classes_by_label = by_label
+        return self._classes_by_label.get(label.lower())
+
+    def get_class_by_uri(self, identifier: str) -> Optional[OntologyClass]:
+        """Get a class by its full URI or by whatever follows any '#' or '/' in it."""
+        if self._classes_by_uri is None:
+            by_uri: Dict[str, OntologyClass] = {}
+            for cls in self.classes.values():
+                uri = cls.uri_str
+                by_uri.setdefault(uri, cls)
+                for i, ch in enumerate(uri):
+                    if ch in '#/':
+                        by_uri.setdefault(uri[i + 1:], cls)
+            self._classes_by_uri = by_uri
+        return self._classes_by_uri.get(identifier)
     
     def get_properties_for_class(self, class_uri: URIRef) -> List[OntologyProperty]:
         """Get all properties with the given class as domain."""
@@ -302,25 +340,26 @@ class OntologyAnalyzer:
         
         If class_uri is provided, includes properties from the class and all its parent classes.
         """
-        props = [p for p in self.properties.values() if not p.is_object_property]
-        if class_uri:
-            # Get all parent classes (including the class itself)
-            parent_classes = self._get_class_ancestors(class_uri)
-            # Include properties whose domain is this class or any parent class
-            props = [p for p in props if p.domain in parent_classes]
-        return props
+        return list(self._props_for(class_uri, False))
     
     def get_object_properties(self, class_uri: Optional[URIRef] = None) -> List[OntologyProperty]:
         """Get all object properties, optionally filtered by class domain.
         
         If class_uri is provided, includes properties from the class and all its parent classes.
         """
-        props = [p for p in self.properties.values() if p.is_object_property]
-        if class_uri:
-            # Get all parent classes (including the class itself)
-            parent_classes = self._get_class_ancestors(class_uri)
-            # Include properties whose domain is this class or any parent class
-            props = [p for p in props if p.domain in parent_classes]
+        return list(self._props_for(class_uri, True))
+
+    def _props_for(self, class_uri: Optional[URIRef], is_object_property: bool) -> List[OntologyProperty]:
+        key = (class_uri or None, is_object_property)
+        props = self._class_props.get(key)
+        if props is None:
+            props = [p for p in self.properties.values() if p.is_object_property == is_object_property]
+            if class_uri:
+                # Get all parent classes (including the class itself)
+                parent_classes = self._get_class_ancestors(class_uri)
+                # Include properties whose domain is this class or any parent class
+                props = [p for p in props if p.domain in parent_classes]
+            self._class_props[key] = props
         return props
     
     def _get_class_ancestors(self, class_uri: URIRef) -> set:
@@ -355,19 +394,20 @@ class OntologyAnalyzer:
                 continue
             
             # Check URI local name
-            local_name = str(cls.uri).split("#")[-1].split("/")[-1]
-            if name_lower in local_name.lower():
+            if name_lower in cls.local_name.lower():
                 suggestions.append(cls)
         
         return suggestions
     
     def get_namespaces(self) -> Dict[str, str]:
         """Extract namespace prefixes and URIs from the ontology."""
-        namespaces = {}
-        for prefix, namespace in self.graph.namespaces():
-            if prefix:  # Skip default namespace
-                namespaces[prefix] = str(namespace)
-        return namespaces
+        if self._namespaces is None:
+            namespaces = {}
+            for prefix, namespace in self.graph.namespaces():
+                if prefix:  # Skip default namespace
+                    namespaces[prefix] = str(namespace)
+            self._namespaces = namespaces
+        return dict(self._namespaces)
 
     def _extract_owl_restrictions(self):
         """Parse OWL restrictions (onProperty, some/allValuesFrom, cardinality) and store them per property."""
@@ -1,19 +1,88 @@
 """Semantic similarity matcher using sentence embeddings with Polars-integrated cache."""
 
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Tuple, List
+import hashlib
+import os
+
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from .ontology_analyzer import OntologyProperty
 from .data_analyzer import DataFieldAnalysis
 from .embedding_cache import EmbeddingCache
 
 
+# Texts per model.encode call when embedding property lists in one batch
+_ENCODE_BATCH_SIZE = 256
+
+# Normalized property matrices kept per matcher before the cache is reset
+_UNIT_CACHE_SIZE = 16
+
+# '_' and '-' separate tokens like spaces; one translate pass instead of chained replace()
+_SEPARATORS_TO_SPACE = str.maketrans("_-", "  ")
+
+_ID_TERMS = ('id', 'identifier', 'number', 'code', 'key', 'ref', 'reference')
+
+
+def _unit_rows(matrix) -> np.ndarray:
+    """L2-normalize the rows of a matrix; all-zero rows stay zero.
+
+    Cosine similarity between unit rows is a plain dot product.
+    """
+    matrix = np.atleast_2d(np.asarray(matrix))
+    norms = np.sqrt(np.einsum('ij,ij->i', matrix, matrix))
+    norms[norms == 0.0] = 1.0
+    return matrix / norms[:, np.newaxis]
+
+
+def default_embeddings_dir() -> Path:
+    """Directory where property embeddings are persisted between runs."""
+    return Path.home() / ".rdfmap" / "embeddings"
+
+
+def persist_embeddings_enabled() -> bool:
+    """Whether property embeddings are persisted by default (RDFMAP_PERSIST_EMBEDDINGS=1)."""
+    return os.environ.get("RDFMAP_PERSIST_EMBEDDINGS", "").lower() in ("1", "true", "yes")
+
+
+# Persisted property matrices kept in a directory; the least recently used are removed
+_PERSIST_MAX_FILES = 32
+
+
+# sentence-transformers (torch) takes seconds to import, so it is loaded when a
+# SemanticMatcher is first created rather than with the module
+@lru_cache(maxsize=4)
+def _load_model(model_cls, model_name: str, half: bool = False):
+    """Load a sentence-transformers model once per process, keyed by class, name and precision."""
+    model = model_cls(model_name)
+    if half:
+        model.half()
+    return model
+
+
+@lru_cache(maxsize=4)
+def _shared_embedding_cache(model_name: str, half: bool = False) -> EmbeddingCache:
+    """Text-keyed embedding cache shared by every SemanticMatcher using the same model."""
+    return EmbeddingCache(model_name)
+
+
+@lru_cache(maxsize=8192)
+def _has_id_term(text: str) -> bool:
+    """Whether lowercased text contains an identifier-like term (substring match)."""
+    return any(t in text for t in _ID_TERMS)
+
+
 class SemanticMatcher:
     """Match columns to properties using semantic embeddings with blazingly fast caching."""
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2", use_cache: bool = True):
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        use_cache: bool = True,
+        use_fp16: bool = True,
+        persist_dir: Optional[Path] = None,
+    ):
         """Initialize with a pre-trained model.
 
         Args:
@@ -21,14 +90,32 @@ class SemanticMatcher:
                 - "all-MiniLM-L6-v2" (fast, 80MB, good quality)
                 - "all-mpnet-base-v2" (slower, 420MB, best quality)
             use_cache: Enable Polars-integrated embedding cache (default True)
+            use_fp16: Run the model in half precision when it is on a CUDA device
+                (CPU inference stays in full precision)
+            persist_dir: Directory to save property embeddings in and load them
+                from on later runs (None disables persistence)
         """
-        self.model = SentenceTransformer(model_name)
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        # Weights are shared by every SemanticMatcher using the same model
+        half = use_fp16 and torch.cuda.is_available()
+        self.model = _load_model(SentenceTransformer, model_name, half)
         self.model_name = model_name
+        self._half = half
+        self.persist_dir = Path(persist_dir) if persist_dir is not None else None
         self._property_cache = {}  # Legacy cache for backward compatibility
-
-        # Polars-integrated cache for blazingly fast operations
+        self._property_token_cache = {}  # property URI -> mean token embedding
+        # Property list ids -> (properties, array aligned with them): unit-row phrase
+        # and token embedding matrices, and whether each label is identifier-like
+        self._unit_cache = {}
+        self._unit_token_cache = {}
+        self._id_label_cache = {}
+
+        # Polars-integrated cache for blazingly fast operations. It is keyed by text,
+        # so new pipelines and generators reuse embeddings computed by earlier ones
         self.use_cache = use_cache
-        self._embedding_cache = EmbeddingCache(model_name) if use_cache else None
+        self._embedding_cache = _shared_embedding_cache(model_name, half) if use_cache else None
 
     def _encode_with_cache(self, text: str) -> np.ndarray:
         """Encode text with cache lookup.
@@ -52,6 +139,29 @@ class SemanticMatcher:
         self._embedding_cache.put(text, embedding)
         return embedding
 
+    def _encode_many(self, texts: List[str]) -> List[np.ndarray]:
+        """Encode several texts with cache lookup, sending all misses in one model call.
+
+        sentence-transformers sorts the texts of a call by length before
+        splitting them into batches, so texts of similar length are padded
+        together instead of every text to the longest one.
+        """
+        if self.use_cache and self._embedding_cache is not None:
+            embeddings, missing = self._embedding_cache.get_batch(texts)
+        else:
+            embeddings, missing = [None] * len(texts), list(texts)
+
+        if missing:
+            unique = list(dict.fromkeys(missing))
+            encoded = self.model.encode(
+                unique, batch_size=_ENCODE_BATCH_SIZE, show_progress_bar=False, convert_to_numpy=True
+            )
+            if self.use_cache and self._embedding_cache is not None:
+                self._embedding_cache.put_batch(unique, encoded)
+            by_text = dict(zip(unique, encoded))
+            embeddings = [by_text[t] if e is None else e for t, e in zip(texts, embeddings)]
+        return embeddings
+
     def embed_column(self, column: DataFieldAnalysis) -> np.ndarray:
         """Create embedding for a column.
 
@@ -60,7 +170,14 @@ class SemanticMatcher:
         - Sample values (for context)
         - Inferred type
         """
-        # Build rich text representation
+        return self._encode_with_cache(self._column_text(column))
+
+    def embed_columns(self, columns: List[DataFieldAnalysis]) -> np.ndarray:
+        """Embeddings of several columns as rows of one matrix, encoded in one model call."""
+        return np.array(self._encode_many([self._column_text(col) for col in columns]))
+
+    def _column_text(self, column: DataFieldAnalysis) -> str:
+        """Rich text representation of a column for embedding."""
         parts = [column.name]
 
         # Identifier pattern enrichment
@@ -77,8 +194,7 @@ class SemanticMatcher:
         if column.inferred_type:
             parts.append(f"type: {column.inferred_type}")
 
-        text = " ".join(parts)
-        return self._encode_with_cache(text)
+        return " ".join(parts)
 
     def embed_property(self, prop: OntologyProperty) -> np.ndarray:
         """Create embedding for a property with caching.
@@ -90,11 +206,112 @@ class SemanticMatcher:
         - Local name
         """
         # Check legacy cache first for backward compatibility
-        cache_key = str(prop.uri)
+        cache_key = prop.uri_str
         if cache_key in self._property_cache:
             return self._property_cache[cache_key]
 
-        # Build rich text representation
+        embedding = self._encode_with_cache(self._property_text(prop))
+
+        # Cache it in legacy cache too
+        self._property_cache[cache_key] = embedding
+        return embedding
+
+    def embed_properties(self, properties: List[OntologyProperty]) -> np.ndarray:
+        """Embeddings of several properties as rows of one matrix.
+
+        Properties not embedded yet are encoded together in a single batched
+        model call instead of one call each.
+        """
+        pending = {}
+        for prop in properties:
+            if prop.uri_str not in self._property_cache and prop.uri_str not in pending:
+                pending[prop.uri_str] = self._property_text(prop)
+
+        if pending and not (self.persist_dir is not None and self._load_persisted(properties, pending)):
+            embeddings = self._encode_many(list(pending.values()))
+            self._property_cache.update(zip(pending, embeddings))
+            if self.persist_dir is not None:
+                self._save_persisted(properties)
+
+        return np.array([self._property_cache[prop.uri_str] for prop in properties])
+
+    def _persist_path(self, properties: List[OntologyProperty]) -> Tuple[Path, List[str]]:
+        """File holding the matrix of a whole property list, and the list's unique URIs.
+
+        Keyed by the model, its precision and the texts of every property in
+        the list (not only those this process still had to encode), so the key
+        is the same in every run and an edited label never loads a stale matrix.
+        """
+        props = list({prop.uri_str: prop for prop in properties}.values())
+        key = '\0'.join([self.model_name, str(self._half), *map(self._property_text, props)])
+        path = self.persist_dir / f"embeds_{hashlib.sha1(key.encode('utf-8')).hexdigest()}.npy"
+        return path, [prop.uri_str for prop in props]
+
+    def _load_persisted(self, properties: List[OntologyProperty], pending: dict) -> bool:
+        """Fill the pending embeddings from the list's saved matrix; False if there is none."""
+        path, uris = self._persist_path(properties)
+        try:
+            # Memory-mapped: rows are paged in when the property matrix is built
+            matrix = np.load(path, mmap_mode='r')
+            if matrix.shape[0] != len(uris):
+                return False
+            os.utime(path)  # Most recently used, for pruning
+        except (OSError, ValueError):
+            return False
+        self._property_cache.update((uri, row) for uri, row in zip(uris, matrix) if uri in pending)
+        return True
+
+    def _save_persisted(self, properties: List[OntologyProperty]) -> None:
+        """Save the list's matrix, keeping at most _PERSIST_MAX_FILES files in the directory."""
+        path, uris = self._persist_path(properties)
+        try:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent runs never read a partial file
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp, 'wb') as f:
+                np.save(f, np.array([self._property_cache[uri] for uri in uris]))
+            os.replace(tmp, path)
+
+            saved = sorted(self.persist_dir.glob("embeds_*.npy"), key=lambda p: p.stat().st_mtime)
+            for old in saved[:-_PERSIST_MAX_FILES]:
+                old.unlink(missing_ok=True)
+        except OSError:
+            pass  # Persistence is an optimization; matching works without it
+
+    def _unit_property_embeddings(self, properties: List[OntologyProperty]) -> np.ndarray:
+        """Unit-normalized embed_properties matrix, kept per property list."""
+        return self._cached_per_list(
+            self._unit_cache, properties, lambda props: _unit_rows(self.embed_properties(props))
+        )
+
+    def _unit_property_token_embeddings(self, properties: List[OntologyProperty]) -> np.ndarray:
+        """Unit-normalized _property_token_embeddings matrix, kept per property list."""
+        return self._cached_per_list(
+            self._unit_token_cache, properties, lambda props: _unit_rows(self._property_token_embeddings(props))
+        )
+
+    def _property_is_id(self, properties: List[OntologyProperty]) -> np.ndarray:
+        """Whether each property's label looks like an identifier, kept per property list."""
+        return self._cached_per_list(
+            self._id_label_cache, properties,
+            lambda props: np.fromiter(
+                (_has_id_term((prop.label or '').lower()) for prop in props), dtype=bool, count=len(props)
+            )
+        )
+
+    @staticmethod
+    def _cached_per_list(cache: dict, properties: List[OntologyProperty], build) -> np.ndarray:
+        key = tuple(map(id, properties))
+        entry = cache.get(key)
+        if entry is None:
+            if len(cache) >= _UNIT_CACHE_SIZE:
+                cache.clear()
+            # Holding the properties keeps their ids from being reused while cached
+            entry = cache[key] = (tuple(properties), build(properties))
+        return entry[1]
+
+    def _property_text(self, prop: OntologyProperty) -> str:
+        """Rich text representation of a property for embedding."""
         parts = []
 
         if prop.pref_label:
@@ -109,7 +326,7 @@ class SemanticMatcher:
             parts.append(prop.comment)
 
         # Add local name
-        local_name = str(prop.uri).split("#")[-1].split("/")[-1]
+        local_name = prop.local_name
         parts.append(local_name)
 
         lname = (prop.label or local_name or '').lower()
@@ -117,12 +334,7 @@ class SemanticMatcher:
         if any(tok in lname for tok in ['number','id','identifier','code']):
             parts.append('identifier id number code key reference')
 
-        text = " ".join(parts)
-        embedding = self._encode_with_cache(text)
-
-        # Cache it in legacy cache too
-        self._property_cache[cache_key] = embedding
-        return embedding
+        return " ".join(parts)
 
     def get_cache_statistics(self) -> dict:
         """Get cache performance statistics.
@@ -142,6 +354,10 @@ class SemanticMatcher:
         if self.use_cache and self._embedding_cache:
             self._embedding_cache.clear()
         self._property_cache.clear()
+        self._property_token_cache.clear()
+        self._unit_cache.clear()
+        self._unit_token_cache.clear()
+        self._id_label_cache.clear()
 
     def match(
         self,
@@ -163,18 +379,13 @@ class SemanticMatcher:
             return None
 
         # Embed column once
-        column_embedding = self.embed_column(column)
+        column_embedding = _unit_rows(self.embed_column(column))[0]
 
         # Embed all properties (uses cache)
-        property_embeddings = np.array([
-            self.embed_property(prop) for prop in properties
-        ])
+        property_embeddings = self._unit_property_embeddings(properties)
 
-        # Calculate similarities
-        similarities = cosine_similarity(
-            [column_embedding],
-            property_embeddings
-        )[0]
+        # Calculate cosine similarities
+        similarities = property_embeddings @ column_embedding
 
         # Find best match
         best_idx = np.argmax(similarities)
@@ -205,20 +416,13 @@ class SemanticMatcher:
             return [None] * len(columns)
 
         # Embed all columns
-        column_embeddings = np.array([
-            self.embed_column(col) for col in columns
-        ])
+        column_embeddings = _unit_rows(self.embed_columns(columns))
 
         # Embed all properties
-        property_embeddings = np.array([
-            self.embed_property(prop) for prop in properties
-        ])
-
-        # Calculate all similarities at once
-        similarities = cosine_similarity(
-            column_embeddings,
-            property_embeddings
-        )
+        property_embeddings = self._unit_property_embeddings(properties)
+
+        # Calculate all cosine similarities at once
+        similarities = column_embeddings @ property_embeddings.T
 
         # Find best match for each column
         results = []
@@ -244,13 +448,12 @@ class SemanticMatcher:
         """
         if not properties:
             return []
-        col_emb = self.embed_column(column)
-        prop_embs = np.array([self.embed_property(p) for p in properties])
-        sims = cosine_similarity([col_emb], prop_embs)[0]
+        col_emb = _unit_rows(self.embed_column(column))[0]
+        sims = self._unit_property_embeddings(properties) @ col_emb
         return list(zip(properties, [float(s) for s in sims]))
 
     def _tokenize(self, text: str) -> List[str]:
-        return [t for t in text.lower().replace('_',' ').replace('-',' ').split() if t]
+        return text.lower().translate(_SEPARATORS_TO_SPACE).split()
 
     def _embed_tokens(self, tokens: List[str]) -> np.ndarray:
         if not tokens:
@@ -260,6 +463,35 @@ class SemanticMatcher:
             return embs.mean(axis=0)
         return embs
 
+    def _property_token_embeddings(self, properties: List[OntologyProperty]) -> np.ndarray:
+        """Mean token embedding of each property's label (or local name), as matrix rows.
+
+        Tokens of properties not seen yet are encoded in one batched call.
+        """
+        pending = {}
+        for prop in properties:
+            if prop.uri_str not in self._property_token_cache:
+                pending[prop.uri_str] = self._tokenize(prop.label or prop.uri_str.split('#')[-1])
+
+        if pending:
+            unique_tokens = list(dict.fromkeys(t for tokens in pending.values() for t in tokens))
+            token_embs = {}
+            if unique_tokens:
+                encoded = self.model.encode(
+                    unique_tokens, batch_size=_ENCODE_BATCH_SIZE, show_progress_bar=False, convert_to_numpy=True
+                )
+                token_embs = dict(zip(unique_tokens, encoded))
+            dimension = None
+            for key, tokens in pending.items():
+                if tokens:
+                    self._property_token_cache[key] = np.mean([token_embs[t] for t in tokens], axis=0)
+                else:
+                    if dimension is None:
+                        dimension = self.model.get_sentence_embedding_dimension()
+                    self._property_token_cache[key] = np.zeros(dimension)
+
+        return np.array([self._property_token_cache[prop.uri_str] for prop in properties])
+
     def enhanced_score_all(self, column: DataFieldAnalysis, properties: List[OntologyProperty]) -> List[dict]:
         """Return enriched similarity scores per property.
 
@@ -271,34 +503,58 @@ class SemanticMatcher:
         """
         if not properties:
             return []
-        col_phrase_emb = self.embed_column(column)
-        col_tokens = self._tokenize(column.name)
-        col_token_emb = self._embed_tokens(col_tokens)
-        results = []
-        for prop in properties:
-            prop_phrase_emb = self.embed_property(prop)
-            prop_tokens = self._tokenize(prop.label or str(prop.uri).split('#')[-1])
-            prop_token_emb = self._embed_tokens(prop_tokens)
-            # Phrase cosine
-            phrase_cos = float(cosine_similarity([col_phrase_emb],[prop_phrase_emb])[0][0])
-            # Token cosine
-            token_cos = float(cosine_similarity([col_token_emb],[prop_token_emb])[0][0]) if (col_token_emb.any() and prop_token_emb.any()) else 0.0
-            base = max(phrase_cos, token_cos)
-            lname = (prop.label or '').lower()
-            cname = column.name.lower()
-            id_terms = {'id','identifier','number','code','key','ref','reference'}
-            if any(t in cname for t in id_terms) and any(t in lname for t in id_terms):
-                id_boost = 0.07 if base >= 0.50 else 0.03
-            else:
-                id_boost = 0.0
-            combined = min(1.0, base + id_boost)
-            results.append({
-                'property': prop,
-                'phrase_cosine': phrase_cos,
-                'token_cosine': token_cos,
-                'id_boost': id_boost,
-                'combined': combined
-            })
+        scores = self._enhanced_scores(column, properties)
+        results = [
+            self._enhanced_entry(prop, *entry)
+            for prop, *entry in zip(properties, *(array.tolist() for array in scores))
+        ]
         # Sort by combined descending
         results.sort(key=lambda r: r['combined'], reverse=True)
         return results
+
+    def best_enhanced_score(self, column: DataFieldAnalysis, properties: List[OntologyProperty]) -> Optional[dict]:
+        """Return the enhanced_score_all entry with the highest combined score.
+
+        Same as enhanced_score_all(...)[0] (first property wins ties) without
+        building and sorting an entry per property.
+        """
+        if not properties:
+            return None
+        scores = self._enhanced_scores(column, properties)
+        best = int(np.argmax(scores[3]))
+        return self._enhanced_entry(properties[best], *(float(array[best]) for array in scores))
+
+    @staticmethod
+    def _enhanced_entry(prop, phrase_cos, token_cos, id_boost, combined) -> dict:
+        return {
+            'property': prop,
+            'phrase_cosine': phrase_cos,
+            'token_cosine': token_cos,
+            'id_boost': id_boost,
+            'combined': combined
+        }
+
+    def _enhanced_scores(self, column: DataFieldAnalysis, properties: List[OntologyProperty]):
+        """Phrase cosine, token cosine, id boost and combined score arrays, aligned with properties."""
+        col_phrase_emb = self.embed_column(column)
+        col_tokens = self._tokenize(column.name)
+        col_token_emb = self._embed_tokens(col_tokens)
+
+        # Phrase cosines against all properties in one matrix-vector product
+        phrase_cosines = self._unit_property_embeddings(properties) @ _unit_rows(col_phrase_emb)[0]
+        # Token cosines likewise; zero where either side has no tokens (zero rows stay zero)
+        if col_token_emb.any():
+            token_cosines = self._unit_property_token_embeddings(properties) @ _unit_rows(col_token_emb)[0]
+        else:
+            token_cosines = np.zeros(len(properties))
+
+        # Aggregate in float64 arrays: base, identifier boost, combined (capped)
+        phrase_cosines = np.asarray(phrase_cosines, dtype=np.float64)
+        token_cosines = np.asarray(token_cosines, dtype=np.float64)
+        base = np.maximum(phrase_cosines, token_cosines)
+        if _has_id_term(column.name.lower()):
+            id_boosts = np.where(self._property_is_id(properties), np.where(base >= 0.50, 0.07, 0.03), 0.0)
+        else:
+            id_boosts = np.zeros(len(properties))
+        combined = np.minimum(1.0, base + id_boosts)
+        return phrase_cosines, token_cosines, id_boosts, combined
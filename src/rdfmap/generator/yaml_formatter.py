@@ -3,7 +3,8 @@
 Produces clean, well-commented YAML that matches the style of manual configurations.
 """
 
-from typing import Dict, Any, TextIO, List
+import io
+from typing import Dict, Any, TextIO, List, Optional
 from pathlib import Path
 
 
@@ -305,15 +306,44 @@ class MappingYAMLFormatter:
                 file.write(f"{'  ' * indent}{key}: {value}\n")
 
 
-def save_formatted_mapping(mapping: Dict[str, Any], output_path: str, wizard_config: Dict[str, Any] = None):
+def format_mapping(mapping: Dict[str, Any], wizard_config: Dict[str, Any] = None) -> str:
+    """Render mapping configuration as formatted YAML text.
+
+    Args:
+        mapping: Mapping configuration
+        wizard_config: Optional wizard configuration for header
+
+    Returns:
+        Formatted YAML document
+    """
+    buffer = io.StringIO()
+    MappingYAMLFormatter().write(mapping, buffer, wizard_config)
+    return buffer.getvalue()
+
+
+def save_formatted_mapping(
+    mapping: Dict[str, Any],
+    output_path: str,
+    wizard_config: Dict[str, Any] = None,
+    return_text: bool = True,
+) -> Optional[str]:
     """Save mapping configuration with clean formatting.
 
     Args:
         mapping: Mapping configuration
         output_path: Path to save file
         wizard_config: Optional wizard configuration for header
+        return_text: Also return the written YAML. When False the document is
+            streamed to the file sheet by sheet instead of built in memory.
+
+    Returns:
+        The YAML text that was written, or None when return_text is False
     """
-    formatter = MappingYAMLFormatter()
+    if not return_text:
+        with open(output_path, 'w') as f:
+            MappingYAMLFormatter().write(mapping, f, wizard_config)
+        return None
+    text = format_mapping(mapping, wizard_config)
     with open(output_path, 'w') as f:
-        formatter.write(mapping, f, wizard_config)
-
+        f.write(text)
+    return text
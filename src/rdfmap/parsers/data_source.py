@@ -24,6 +24,25 @@ class DataSourceParser(ABC):
         """Get list of column names."""
         pass
 
+    def parse_head(self, n_rows: int) -> pl.DataFrame:
+        """Return only the first n_rows rows of the data source.
+
+        Stops after the first chunk; subclasses override this when the
+        underlying reader can skip the rest of the file.
+        """
+        first = next(self.parse(chunk_size=n_rows), None)
+        if first is None:
+            return pl.DataFrame()
+        return first.head(n_rows)
+
+    def count_rows(self) -> int:
+        """Return the number of data rows in the source.
+
+        Walks every chunk by default; subclasses override this when the
+        underlying reader can count rows without materializing them.
+        """
+        return sum(len(df) for df in self.parse())
+
 
 class CSVParser(DataSourceParser):
     """High-performance CSV parser using Polars."""
@@ -125,6 +144,29 @@ class CSVParser(DataSourceParser):
             )
             yield df
 
+    def parse_head(self, n_rows: int) -> pl.DataFrame:
+        """Read only the first n_rows data rows of the CSV file."""
+        return pl.read_csv(
+            self.file_path,
+            separator=self.delimiter,
+            has_header=self.has_header,
+            encoding=self.encoding if self.encoding in ['utf8', 'utf8-lossy'] else 'utf8',
+            null_values=[""],
+            ignore_errors=True,
+            n_rows=n_rows,
+        )
+
+    def count_rows(self) -> int:
+        """Count data rows with a lazy scan instead of loading the file."""
+        return pl.scan_csv(
+            self.file_path,
+            separator=self.delimiter,
+            has_header=self.has_header,
+            encoding=self.encoding if self.encoding in ['utf8', 'utf8-lossy'] else 'utf8',
+            null_values=[""],
+            ignore_errors=True,
+        ).select(pl.len()).collect().item()
+
     def get_column_names(self) -> List[str]:
         """Get list of column names from CSV."""
         if not self.has_header:
@@ -10,6 +10,10 @@ from dateutil import parser as date_parser
 # Registry of transform functions
 _TRANSFORM_REGISTRY: Dict[str, Callable[[Any], Any]] = {}
 
+# Characters stripped from numeric strings, each removed in a single translate() pass
+_DROP_CURRENCY = str.maketrans("", "", "$,€£")
+_DROP_THOUSANDS = str.maketrans("", "", ", ")
+
 
 def register_transform(name: str) -> Callable:
     """Decorator to register a transform function.
@@ -58,7 +62,7 @@ def to_decimal(value: Any) -> Decimal:
         # Handle string values that might have currency symbols or commas
         if isinstance(value, str):
             # Remove common currency symbols and separators
-            cleaned = value.replace("$", "").replace(",", "").replace("€", "").replace("£", "").strip()
+            cleaned = value.translate(_DROP_CURRENCY).strip()
             return Decimal(cleaned)
         return Decimal(str(value))
     except (InvalidOperation, ValueError) as e:
@@ -87,7 +91,7 @@ def to_integer(value: Any) -> int:
             return int(value)
         if isinstance(value, str):
             # Remove commas and spaces
-            cleaned = value.replace(",", "").replace(" ", "").strip()
+            cleaned = value.translate(_DROP_THOUSANDS).strip()
             return int(float(cleaned))
         return int(value)
     except (ValueError, TypeError) as e:
@@ -1,6 +1,5 @@
 """SHACL validation integration."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
@@ -116,10 +115,10 @@ def write_validation_report(report: ValidationReport, output_path: Path) -> None
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    report_dict = report.model_dump(exclude={"results_graph"})
-    
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(report_dict, f, indent=2, default=str)
+    # pydantic-core serializes straight to JSON without building the dict first
+    output_path.write_text(
+        report.model_dump_json(indent=2, exclude={"results_graph"}), encoding="utf-8"
+    )
 
 
 def validate_against_ontology(
@@ -427,6 +427,90 @@ ex:employeeIdentifier a owl:DatatypeProperty ;
         assert "Average:" in summary  # Changed from "Avg Confidence:" to match actual implementation
         assert str(report.statistics.total_columns) in summary
 
+    def test_save_elsewhere_rewrites_relative_source(self, test_files, tmp_path):
+        """Saving to another directory re-points the source without regenerating."""
+        ontology_file, spreadsheet_file = test_files
+
+        config = GeneratorConfig(base_iri="http://example.org/data/")
+        generator = MappingGenerator(
+            str(ontology_file),
+            str(spreadsheet_file),
+            config,
+            use_semantic_matching=False
+        )
+        generator.generate(
+            target_class="http://example.org/ontology#Person",
+            output_path=str(tmp_path / "a" / "mapping.yaml")
+        )
+
+        out = tmp_path / "b" / "c" / "mapping.yaml"
+        out.parent.mkdir(parents=True)
+        generator.save_yaml(str(out))
+
+        source = generator.mapping["sheets"][0]["source"]
+        assert (out.parent / source).resolve() == spreadsheet_file.resolve()
+
+
+    def test_format_uri_prefers_most_specific_namespace(self, test_files, monkeypatch):
+        """CURIEs use the longest matching namespace regardless of declaration order."""
+        ontology_file, spreadsheet_file = test_files
+        generator = MappingGenerator(
+            str(ontology_file),
+            str(spreadsheet_file),
+            GeneratorConfig(base_iri="http://example.org/data/"),
+            use_semantic_matching=False
+        )
+        monkeypatch.setattr(generator.ontology, "get_namespaces", lambda: {
+            "org": "http://example.org/",
+            "ex": "http://example.org/ontology#",
+        })
+
+        assert generator._format_uri("http://example.org/ontology#Person") == "ex:Person"
+        assert generator._format_uri("http://example.org/other") == "org:other"
+        assert generator._format_uri("urn:isbn:123") == "urn:isbn:123"
+
+    def test_mapping_cache_reuses_previous_run(self, test_files, tmp_path, monkeypatch):
+        """With cache_dir set, identical inputs skip matching on the next run."""
+        ontology_file, spreadsheet_file = test_files
+        config = GeneratorConfig(base_iri="http://example.org/data/", cache_dir=str(tmp_path / "cache"))
+
+        def run():
+            generator = MappingGenerator(
+                str(ontology_file), str(spreadsheet_file), config, use_semantic_matching=False
+            )
+            return generator.generate_with_alignment_report(
+                target_class="http://example.org/ontology#Person"
+            )
+
+        mapping, report = run()
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("matching should have been served from the cache")
+        monkeypatch.setattr(MappingGenerator, "_generate_uncached", fail)
+        cached_mapping, cached_report = run()
+
+        assert cached_mapping == mapping
+        assert cached_report.to_dict() == report.to_dict()
+
+    def test_shared_analyzer_reuses_label_indexes(self, test_files):
+        """A second generator on the same OntologyAnalyzer builds no new label indexes."""
+        from rdfmap.generator.matchers import exact_matchers
+
+        ontology_file, spreadsheet_file = test_files
+        config = GeneratorConfig(base_iri="http://example.org/data/")
+        first = MappingGenerator(str(ontology_file), str(spreadsheet_file), config, use_semantic_matching=False)
+        mapping = first.generate(target_class="http://example.org/ontology#Person")
+        built = dict(exact_matchers._INDEXES)
+
+        second = MappingGenerator(
+            str(ontology_file), str(spreadsheet_file), config,
+            use_semantic_matching=False, ontology_analyzer=first.ontology,
+        )
+        assert second.ontology is first.ontology
+        assert second.generate(target_class="http://example.org/ontology#Person") == mapping
+        assert exact_matchers._INDEXES.keys() == built.keys()
+
 
 class TestHighConfidenceMatches:
     """Test that high-confidence matches don't generate unnecessary suggestions."""
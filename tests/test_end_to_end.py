@@ -6,8 +6,10 @@ This module tests complete workflows from data to RDF, simulating real user scen
 import pytest
 from pathlib import Path
 import polars as pl
+import yaml
 from rdflib import Graph
 
+from rdfmap.config.loader import load_mapping_config, mapping_config_from_data
 from rdfmap.generator.mapping_generator import MappingGenerator, GeneratorConfig
 from rdfmap.generator.ontology_analyzer import OntologyAnalyzer
 from rdfmap.parsers.data_source import CSVParser, JSONParser
@@ -169,6 +171,48 @@ class TestWorkflowWithValidation:
         assert len(ifp_props) >= 2 or True  # May not expose this attribute
 
 
+    def test_parse_head_reads_only_requested_rows(self, simple_csv, simple_json):
+        """Test that parse_head returns a bounded preview for CSV and JSON sources."""
+        csv_head = CSVParser(simple_csv).parse_head(2)
+        assert len(csv_head) == 2
+        assert csv_head.columns == CSVParser(simple_csv).get_column_names()
+
+        json_head = JSONParser(simple_json).parse_head(1)
+        assert len(json_head) == 1
+        assert json_head["id"].to_list() == ["P001"]
+
+    def test_count_rows_matches_full_parse(self, simple_csv, simple_json):
+        """Test that count_rows agrees with the number of parsed rows."""
+        for parser in (CSVParser(simple_csv), JSONParser(simple_json)):
+            assert parser.count_rows() == sum(len(df) for df in parser.parse())
+
+    def test_config_from_data_matches_file_load(self, simple_csv):
+        """Test that validating parsed mapping data matches loading the same YAML file."""
+        text = """
+namespaces:
+  ex: http://example.org/
+  xsd: http://www.w3.org/2001/XMLSchema#
+defaults:
+  base_iri: http://example.org/
+sheets:
+  - name: people
+    source: people.csv
+    row_resource:
+      class: ex:Person
+      iri_template: "{base_iri}person/{id}"
+    columns:
+      name:
+        as: ex:hasName
+        datatype: xsd:string
+"""
+        mapping_file = simple_csv.parent / "mapping.yaml"
+        mapping_file.write_text(text)
+
+        from_data = mapping_config_from_data(yaml.safe_load(text), simple_csv.parent)
+        assert from_data == load_mapping_config(mapping_file)
+        assert from_data.sheets[0].source == str(simple_csv)
+
+
 class TestWorkflowErrorHandling:
     """Test error handling in workflows."""
 
@@ -345,6 +345,46 @@ class TestGraphBuilderEdgeCases:
             pytest.skip("Build method not found")
 
 
+class TestGraphBuilderBatching:
+    """Test batched triple insertion."""
+
+    def test_batch_flushes_match_single_batch(self, processing_report, monkeypatch):
+        """Test that small flush batches produce the same graph as one batch."""
+        from rdfmap.emitter import graph_builder
+        from rdfmap.models.mapping import MappingConfig
+
+        config = MappingConfig(**{
+            "namespaces": {"ex": "http://example.org/", "xsd": str(XSD)},
+            "defaults": {"base_iri": "http://example.org/"},
+            "sheets": [{
+                "name": "people",
+                "source": "people.csv",
+                "row_resource": {"class": "ex:Person", "iri_template": "{base_iri}person/{id}"},
+                "columns": {"name": {"as": "ex:name", "datatype": "xsd:string"}},
+                "objects": {
+                    "dept": {
+                        "predicate": "ex:dept",
+                        "class": "ex:Dept",
+                        "iri_template": "{base_iri}dept/{dept}",
+                        "properties": [{"column": "dept", "as": "ex:code"}],
+                    }
+                },
+            }],
+        })
+        df = pl.DataFrame({"id": [1, 2, 3], "name": ["A", "B", "C"], "dept": ["X", "X", "Y"]})
+
+        builder = RDFGraphBuilder(config, processing_report)
+        builder.add_dataframe(df, config.sheets[0])
+
+        monkeypatch.setattr(graph_builder, "TRIPLE_BATCH_SIZE", 2)
+        small = RDFGraphBuilder(config, ProcessingReport())
+        small.add_dataframe(df, config.sheets[0])
+
+        # 3 people x (2 types + name + dept link) + 2 depts x (2 types + code)
+        assert len(builder.graph) == 18
+        assert set(small.graph) == set(builder.graph)
+
+
 class TestGraphBuilderLinkedObjects:
     """Test graph builder with linked objects."""
 
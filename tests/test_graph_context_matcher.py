@@ -321,6 +321,25 @@ class TestCoOccurrencePatternLearning:
         assert score > 0
         assert score <= 1.0
 
+    def test_matched_counts_cached_on_context(self, graph_reasoner, ontology_analyzer):
+        from rdfmap.generator.matchers.graph_matcher import GraphContextMatcher
+        matcher = GraphContextMatcher(reasoner=graph_reasoner, use_cooccurrence=True)
+        properties = list(ontology_analyzer.properties.values())
+        context = MatchContext(
+            column=create_column("dummy", ["x"]),
+            all_columns=[],
+            available_properties=properties,
+            matched_properties={"col1": str(TEST.firstName)}
+        )
+        counts = matcher._count_matched_domains(context)
+        assert matcher._count_matched_domains(context) is counts
+
+        # In-place change of the same size is picked up once the version is bumped
+        context.matched_properties["col1"] = str(TEST.lastName)
+        context.version += 1
+        _, uri_counts = matcher._count_matched_domains(context)
+        assert uri_counts == {str(TEST.lastName): 1}
+
 
 class TestContextPropagation:
     """Test confidence boosting through context propagation."""
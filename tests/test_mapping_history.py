@@ -340,6 +340,18 @@ def test_export_import():
         os.unlink(json_path)
 
 
+def test_default_history_opened_on_first_use(tmp_path, monkeypatch):
+    """Test that matchers without a history_db do not open one until needed."""
+    from pathlib import Path
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+    matcher = HistoryAwareMatcher(enabled=False)
+    assert not (tmp_path / ".rdfmap").exists()
+
+    matcher.history.close()
+    assert (tmp_path / ".rdfmap" / "mapping_history.db").exists()
+
+
 if __name__ == "__main__":
     print("Running mapping history tests...\n")
     test_mapping_history_creation()
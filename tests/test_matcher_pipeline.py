@@ -171,6 +171,65 @@ def test_match_context():
     print(f"✅ MatchContext created successfully")
 
 
+def test_partial_matcher_same_result_without_rapidfuzz(monkeypatch):
+    """The rapidfuzz containment scan picks the same property as the Python loop."""
+    from src.rdfmap.generator.matchers import fuzzy_matchers
+    from src.rdfmap.generator.matchers.fuzzy_matchers import PartialStringMatcher
+
+    column = DataFieldAnalysis("loan_amt", "loan_amt")
+    props = [
+        OntologyProperty(URIRef("http://ex.org/rate"), label="Interest Rate"),
+        OntologyProperty(URIRef("http://ex.org/loan"), label="Loan"),
+        OntologyProperty(URIRef("http://ex.org/loanAmount"), alt_labels=["loan amt total"]),
+    ]
+
+    with_fast = PartialStringMatcher().match(column, props)
+    monkeypatch.setattr(fuzzy_matchers, "process", None)
+    without = PartialStringMatcher().match(column, props)
+
+    assert with_fast is not None and without is not None
+    assert with_fast.property.uri == without.property.uri == URIRef("http://ex.org/loan")
+    assert with_fast.matched_via == without.matched_via == "Loan"
+
+
+def test_inline_matchers_skip_thread_pool(monkeypatch):
+    """Index-lookup matchers run on the calling thread and give the sequential results."""
+    from src.rdfmap.generator.matchers import base
+
+    pipeline = create_exact_only_pipeline()
+    column = DataFieldAnalysis("Full Name", "Full Name")
+    props = [OntologyProperty(URIRef("http://ex.org/fullName"), pref_label="Full Name")]
+    expected = pipeline.match_all(column, props, parallel=False)
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool should not be used")
+
+    monkeypatch.setattr(base, "ThreadPoolExecutor", no_pool)
+    results = pipeline.match_all(column, props, parallel=True)
+
+    assert [(r.property.uri, r.confidence) for r in results] == \
+        [(r.property.uri, r.confidence) for r in expected]
+
+
+def test_fuzzy_matcher_tolerates_typos(monkeypatch):
+    """A misspelled column reaches its property with and without rapidfuzz installed."""
+    from src.rdfmap.generator.matchers import fuzzy_matchers
+    from src.rdfmap.generator.matchers.fuzzy_matchers import FuzzyStringMatcher
+
+    props = [
+        OntologyProperty(URIRef("http://ex.org/phone")),
+        OntologyProperty(URIRef("http://ex.org/addreses")),  # Close, but "address" is closer
+        OntologyProperty(URIRef("http://ex.org/address")),
+    ]
+    for process in (fuzzy_matchers.process, None):
+        monkeypatch.setattr(fuzzy_matchers, "process", process)
+        result = FuzzyStringMatcher().match(DataFieldAnalysis("adress", "adress"), props)
+
+        assert result is not None
+        assert result.property.uri == URIRef("http://ex.org/address")
+        assert FuzzyStringMatcher().match(DataFieldAnalysis("zzz", "zzz"), props) is None
+
+
 if __name__ == "__main__":
     print("Running matcher pipeline tests...\n")
     test_exact_pref_label_matcher()
@@ -183,4 +242,3 @@ if __name__ == "__main__":
     test_add_remove_matcher()
     test_match_context()
     print("\n✅ All matcher pipeline tests passed!")
-
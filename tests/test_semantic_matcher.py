@@ -5,6 +5,38 @@ from rdfmap.generator.matchers.semantic_matcher import SemanticSimilarityMatcher
 from rdfmap.generator.ontology_analyzer import OntologyProperty
 from rdfmap.generator.data_analyzer import DataFieldAnalysis
 from rdflib import URIRef
+from types import SimpleNamespace
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Replace SentenceTransformer with a deterministic hash-based model.
+
+    Returns a namespace recording the model names loaded and the inputs of
+    every encode call.
+    """
+    import hashlib
+    import numpy as np
+    import sentence_transformers
+
+    record = SimpleNamespace(loaded=[], calls=[])
+
+    class FakeModel:
+        def __init__(self, name):
+            record.loaded.append(name)
+
+        def encode(self, texts, **kwargs):
+            record.calls.append(texts)
+            def one(text):
+                digest = hashlib.sha256(text.encode()).digest()[:8]
+                return np.frombuffer(digest, dtype=np.uint8).astype(np.float32) - 128
+            return one(texts) if isinstance(texts, str) else np.array([one(t) for t in texts])
+
+        def get_sentence_embedding_dimension(self):
+            return 8
+
+    monkeypatch.setattr(sentence_transformers, "SentenceTransformer", FakeModel)
+    return record
 
 
 def test_semantic_matcher_basic():
@@ -123,6 +155,118 @@ def test_no_match_below_threshold():
     print("✅ Threshold working: No match for dissimilar terms")
 
 
+def test_property_embeddings_are_batched(fake_model):
+    """Property texts are encoded in one model call and match per-property embeddings."""
+    import numpy as np
+    from rdfmap.generator.semantic_matcher import SemanticMatcher
+
+    props = [OntologyProperty(URIRef(f"http://ex.org/p{i}"), label=f"Field {i}") for i in range(5)]
+
+    batched = SemanticMatcher("fake", use_cache=False)
+    matrix = batched.embed_properties(props)
+    assert len(fake_model.calls) == 1 and len(fake_model.calls[0]) == len(props)
+
+    single = SemanticMatcher("fake", use_cache=False)
+    assert np.allclose(matrix, [single.embed_property(p) for p in props])
+
+    fake_model.calls.clear()
+    for name in ("field_1", "other"):
+        batched.enhanced_score_all(DataFieldAnalysis(name, name), props)
+    # Column phrase and tokens per column, property tokens once
+    assert len(fake_model.calls) == 5
+
+
+def test_model_is_loaded_once_per_name(fake_model):
+    """SemanticMatcher instances with the same model name share the loaded model."""
+    from rdfmap.generator.semantic_matcher import SemanticMatcher
+
+    first = SemanticMatcher("fake-a", use_cache=False)
+    second = SemanticMatcher("fake-a", use_cache=False)
+    other = SemanticMatcher("fake-b", use_cache=False)
+
+    assert first.model is second.model
+    assert other.model is not first.model
+    assert fake_model.loaded == ["fake-a", "fake-b"]
+
+
+def test_repeated_columns_reuse_best_match(fake_model):
+    """Matching the same column against the same properties again skips the model."""
+    props = [OntologyProperty(URIRef(f"http://ex.org/p{i}"), label=f"Field {i}") for i in range(5)]
+    matcher = SemanticSimilarityMatcher(threshold=-1.0, model_name="fake-repeat", persist_embeddings=False)
+
+    first = matcher.match(DataFieldAnalysis("field_1", "field_1"), props)
+    encoded = len(fake_model.calls)
+    again = matcher.match(DataFieldAnalysis("field_1", "field_1"), props)
+
+    assert len(fake_model.calls) == encoded
+    assert (again.property, again.confidence) == (first.property, first.confidence)
+
+
+def test_embedding_cache_shared_across_instances(fake_model):
+    """A new SemanticMatcher for the same model reuses embeddings of known texts."""
+    from rdfmap.generator.semantic_matcher import SemanticMatcher
+
+    column = DataFieldAnalysis("shared_cache_column", "shared_cache_column")
+
+    SemanticMatcher("fake-shared").embed_column(column)
+    assert len(fake_model.calls) == 1
+    SemanticMatcher("fake-shared").embed_column(column)
+    assert len(fake_model.calls) == 1
+
+
+def test_property_embeddings_persisted(fake_model, tmp_path):
+    """Property embeddings saved by one run are loaded instead of re-encoded by the next."""
+    import numpy as np
+    from rdfmap.generator.semantic_matcher import SemanticMatcher
+
+    props = [OntologyProperty(URIRef(f"http://ex.org/p{i}"), label=f"Field {i}") for i in range(3)]
+
+    first = SemanticMatcher("fake-persist", use_cache=False, persist_dir=tmp_path).embed_properties(props)
+    assert len(fake_model.calls) == 1 and list(tmp_path.glob("embeds_*.npy"))
+
+    second = SemanticMatcher("fake-persist", use_cache=False, persist_dir=tmp_path).embed_properties(props)
+    assert len(fake_model.calls) == 1
+    assert np.array_equal(first, second)
+
+    # A changed label is a different key
+    props[0].label = "Renamed"
+    SemanticMatcher("fake-persist", use_cache=False, persist_dir=tmp_path).embed_properties(props)
+    assert len(fake_model.calls) == 2
+
+
+def test_persisted_embeddings_keyed_by_whole_list(fake_model, tmp_path, monkeypatch):
+    """The saved file depends on the property list, not on what the process already encoded."""
+    from rdfmap.generator import semantic_matcher
+
+    props = [OntologyProperty(URIRef(f"http://ex.org/q{i}"), label=f"Column {i}") for i in range(4)]
+
+    warm = semantic_matcher.SemanticMatcher("fake-list", use_cache=False, persist_dir=tmp_path)
+    warm.embed_properties(props[:1])
+    warm.embed_properties(props)
+    fake_model.calls.clear()
+
+    # A fresh process with nothing cached loads the same file
+    semantic_matcher.SemanticMatcher("fake-list", use_cache=False, persist_dir=tmp_path).embed_properties(props)
+    assert fake_model.calls == []
+
+    # The directory is bounded
+    monkeypatch.setattr(semantic_matcher, "_PERSIST_MAX_FILES", 2)
+    for i in range(4):
+        semantic_matcher.SemanticMatcher("fake-list", use_cache=False, persist_dir=tmp_path).embed_properties(props[i:])
+    assert len(list(tmp_path.glob("embeds_*.npy"))) == 2
+
+
+def test_embedding_persistence_is_opt_in(fake_model, monkeypatch):
+    """SemanticSimilarityMatcher only persists embeddings when asked to."""
+    monkeypatch.delenv("RDFMAP_PERSIST_EMBEDDINGS", raising=False)
+    matcher = SemanticSimilarityMatcher(model_name="fake-opt-in")
+    assert matcher._embeddings_matcher.persist_dir is None
+
+    monkeypatch.setenv("RDFMAP_PERSIST_EMBEDDINGS", "1")
+    matcher = SemanticSimilarityMatcher(model_name="fake-opt-in")
+    assert matcher._embeddings_matcher.persist_dir is not None
+
+
 if __name__ == "__main__":
     print("Running semantic matcher tests...\n")
     test_semantic_matcher_basic()
@@ -131,4 +275,3 @@ if __name__ == "__main__":
     test_semantic_matching_better_than_fuzzy()
     test_no_match_below_threshold()
     print("\n✅ All tests passed!")
-